@@ -1,6 +1,7 @@
 import time
 import threading
 import os
+from itertools import islice
 import tkinter as tk
 from tkinter import ttk, messagebox
 import matplotlib.pyplot as plt
@@ -9,15 +10,24 @@ import networkx as nx
 import pandas as pd
 
 try:
-    from genetik_ga import run_genetic_algorithm
-    from graph_utils import create_random_graph
-    from metrics import compute_metrics
-    from Qlearning import Q_Learning_run
+    from genetik_ga import run_genetic_algorithm, run_nsga2, FitnessCache
+    from pareto_routing import best_from_front, pareto_front
+    from graph_utils import create_random_graph, as_topology, topology_layout
+    from metrics import compute_metrics, path_costs
+    from Qlearning import Q_Learning_run, Q_Learning_batch_run, Q_Learning_sweep_run
+    from qtable_store import QTableStore
+    from dijkstra import dijkstra_run, k_shortest_paths
 except ImportError as e:
     # Kritik modüller eksikse uygulama çökmez, ancak işlevsellik kısıtlanır.
     print(f"Kritik Import Hatası: {e}")
     pass
 
+# GA, en iyi maliyet bu kadar nesil iyileşmezse girilen nesil sayısını beklemeden durur
+GA_STALL_GENERATIONS = 30
+
+# Cephe üreten yöntemler: ağırlık sürgüleri değişince yol saklanan cepheden seçilir
+FRONT_ALGORITHMS = ("Genetic (NSGA-II)", "Pareto (Exact)")
+
 
 class QoSRoutingApp:
     """
@@ -91,8 +101,30 @@ class QoSRoutingApp:
                 self.G.nodes[n]['processing_delay'] = 1
                 self.G.nodes[n]['reliability'] = 0.99
 
+        # Q-Learning tabloları hedef bazında saklanır; aynı hedefe sonraki sorgular sıcak başlar.
+        self.q_store = QTableStore(cache_dir=os.path.join(data_dir, ".qtable_cache"))
+
+        # GA yol maliyetleri aynı ağırlıklarla yapılan ardışık çalıştırmalar arasında paylaşılır.
+        self.fitness_cache = FitnessCache()
+
+        # NSGA-II Pareto cepheleri (kaynak, hedef, talep, popülasyon, nesil) başına saklanır; ağırlık
+        # sürgüleri değiştiğinde yol yeniden çalıştırmadan son cepheden seçilir. Son çalıştırmanın
+        # yedek rotaları ve duruş nedeni de tutulur; yeniden çizimde kaybolmazlar.
+        self.pareto_cache = {}
+        self.current_front = None
+        self.current_backups = []
+        self.current_ga_stop = None
+
+        # Kesin Pareto cepheleri (etiket yerleştirme) (kaynak, hedef, talep) başına saklanır;
+        # ağırlık değişiklikleri aynı şekilde cepheden best_from_front ile yanıtlanır
+        self.exact_front_cache = {}
+
+        # s ile d bağlı değilse GA yolu sorguya özel sentetik kenar içerir; metrikler o katmandan hesaplanır
+        self.current_topology = None
+
         # Deterministik görselleştirme için seed sabitlenir.
-        self.pos = nx.spring_layout(self.G, seed=42)
+        # Konumlar topoloji anlık görüntüsünde saklandığından sonraki açılışlarda yeniden hesaplanmaz.
+        self.pos = topology_layout(as_topology(self.G), seed=42)
         self.current_path = None
         self.press = None
 
@@ -105,7 +137,7 @@ class QoSRoutingApp:
         self.src = tk.IntVar(value=8)
         self.dst = tk.IntVar(value=44)
         self.dem = tk.DoubleVar(value=950)
-        self.algorithm_var = tk.StringVar(value="Genetic Algorithm")
+        self.algorithm_var = tk.StringVar(value="Dijkstra")
 
         self.pop = tk.IntVar(value=50)
         self.gen = tk.IntVar(value=100)
@@ -214,9 +246,9 @@ class QoSRoutingApp:
         self._separator(parent)
 
         self._create_section_label(parent, "OPTİMİZASYON AĞIRLIKLARI")
-        self.w1 = self._rounded_slider(parent, "Gecikme", 0.4)
-        self.w2 = self._rounded_slider(parent, "Güvenilirlik", 0.3)
-        self.w3 = self._rounded_slider(parent, "Kaynak", 0.3)
+        self.w1 = self._rounded_slider(parent, "Gecikme", 0.4, command=self.on_weights_changed)
+        self.w2 = self._rounded_slider(parent, "Güvenilirlik", 0.3, command=self.on_weights_changed)
+        self.w3 = self._rounded_slider(parent, "Kaynak", 0.3, command=self.on_weights_changed)
 
         self._separator(parent)
 
@@ -241,7 +273,7 @@ class QoSRoutingApp:
 
         self._create_section_label(parent, "ALGORİTMA")
         ttk.Combobox(parent, textvariable=self.algorithm_var,
-                     values=["Genetic Algorithm", "Q-Learning"], state="readonly").pack(fill=tk.X, pady=(0, 15))
+                     values=["Dijkstra", "Pareto (Exact)", "Genetic Algorithm", "Genetic (NSGA-II)", "Q-Learning", "Q-Learning (Batch)", "Q-Learning (Sweep)"], state="readonly").pack(fill=tk.X, pady=(0, 15))
 
         self.btn_run_canvas = self._rounded_button(parent, "ALGORİTMAYI ÇALIŞTIR", self.run_selected_algorithm)
 
@@ -289,7 +321,7 @@ class QoSRoutingApp:
 
     def run_selected_algorithm(self):
         """
-        Seçilen rotalama algoritmasını (GA veya Q-Learning) başlatır.
+        Seçilen rotalama algoritmasını (Dijkstra, GA veya Q-Learning) başlatır.
         
         Threading Stratejisi:
         Hesaplama yoğun işlemler GUI (Main) thread'ini bloklamamak için
@@ -328,6 +360,10 @@ class QoSRoutingApp:
             pass
 
         algo = self.algorithm_var.get()
+        self.current_front = None
+        self.current_topology = None
+        self.current_backups = []
+        self.current_ga_stop = None
 
         self.toggle_ui_state(True)
 
@@ -339,16 +375,74 @@ class QoSRoutingApp:
                 start_time = time.perf_counter()
                 path = None
                 cost = 0
-
-                if algo == "Genetic Algorithm":
-                    path, cost = run_genetic_algorithm(self.G, s, d, talep, weights, pop_s, gen_s)
+                ga_stop = None
+                overlay = None
+
+                if algo == "Dijkstra":
+                    path, cost = dijkstra_run(self.G, s, d, talep, weights)
+                elif algo == "Genetic Algorithm":
+                    # Yakınsama canlı gösterilir (en fazla 0.1 sn'de bir); en iyi maliyet
+                    # GA_STALL_GENERATIONS nesil iyileşmezse nesil sayısı dolmadan durulur
+                    last_shown = [0.0]
+
+                    def progress(record):
+                        if record["elapsed"] - last_shown[0] >= 0.1:
+                            last_shown[0] = record["elapsed"]
+                            self.root.after(0, lambda r=record: self.on_ga_progress(r))
+
+                    path, cost, info = run_genetic_algorithm(
+                        self.G, s, d, talep, weights, pop_s, gen_s, fitness_cache=self.fitness_cache,
+                        stopping={"stall_generations": GA_STALL_GENERATIONS}, progress=progress,
+                        return_info=True)
+                    if info["generations"]:
+                        self.root.after(0, lambda r=info["generations"][-1]: self.on_ga_progress(r))
+                    ga_stop = (info["stop_reason"], info["generations_used"])
+                    if info["synthetic_edge"] is not None:
+                        overlay = info["topology"]
+                elif algo == "Genetic (NSGA-II)":
+                    # Aynı sorgunun cephesi aynı popülasyon/nesil ayarıyla bulunduysa yeniden çalıştırılmaz
+                    key = (s, d, talep, pop_s, gen_s)
+                    cached = self.pareto_cache.get(key)
+                    if cached is None:
+                        front, info = run_nsga2(self.G, s, d, talep, pop_s, gen_s,
+                                                stopping={"stall_generations": GA_STALL_GENERATIONS},
+                                                return_info=True)
+                        cached = (front, info["topology"] if info["synthetic_edge"] is not None else None,
+                                  (info["stop_reason"], info["generations_used"]))
+                        self.pareto_cache[key] = cached
+                    front, overlay, ga_stop = cached
+                    self.current_front = front
+                    path, cost = best_from_front(front, weights)
+                elif algo == "Pareto (Exact)":
+                    # Tüm domine edilmeyen yollar tek aramada bulunur; ağırlıklar cepheden uygulanır
+                    front = self.exact_front_cache.get((s, d, talep))
+                    if front is None:
+                        front = pareto_front(self.G, s, d, talep)
+                        self.exact_front_cache[(s, d, talep)] = front
+                    self.current_front = front
+                    path, cost = best_from_front(front, weights)
                 elif algo == "Q-Learning":
-                    path, cost = Q_Learning_run(self.G, s, d, talep, weights)
+                    path, cost = Q_Learning_run(self.G, s, d, talep, weights, q_store=self.q_store)
+                elif algo == "Q-Learning (Batch)":
+                    path, cost = Q_Learning_batch_run(self.G, s, d, talep, weights, q_store=self.q_store)
+                elif algo == "Q-Learning (Sweep)":
+                    path, cost = Q_Learning_sweep_run(self.G, s, d, talep, weights, q_store=self.q_store)
 
                 elapsed = time.perf_counter() - start_time
 
+                # Aynı talep için sıralı yedek rotalar (bulunan yol hariç ilk 3)
+                backups = []
+                if path:
+                    for alt, alt_cost in islice(k_shortest_paths(self.G, s, d, talep, weights), 4):
+                        if alt != path and len(backups) < 3:
+                            backups.append((alt, alt_cost))
+
                 # Thread-safe UI güncellemesi için 'after' metodu kullanılır.
-                self.root.after(0, lambda: self.on_algorithm_complete(path, cost, elapsed, algo))
+                self.current_topology = overlay
+                self.current_backups = backups
+                self.current_ga_stop = ga_stop
+                self.root.after(0, lambda: self.on_algorithm_complete(path, cost, elapsed, algo, backups, ga_stop,
+                                                                      overlay))
 
             except Exception as e:
                 self.root.after(0, lambda: self.on_algorithm_error(str(e)))
@@ -356,10 +450,44 @@ class QoSRoutingApp:
         t = threading.Thread(target=worker_thread, daemon=True)
         t.start()
 
-    def on_algorithm_complete(self, path, cost, elapsed, algo):
+    def on_ga_progress(self, record):
+        """GA'nın son nesil kaydını (en iyi / ortalama maliyet, çeşitlilik) sonuç alanında gösterir."""
+        self.result_text_widget.delete("3.0", tk.END)
+        self.result_text_widget.insert(
+            tk.END, f"► Nesil {record['generation'] + 1}: en iyi {record['best']:.4f} | "
+                    f"ortalama {record['mean']:.4f} | çeşitlilik %{100 * record['diversity']:.0f}\n")
+
+    def on_weights_changed(self):
+        """
+        Son çalıştırma cephe üretiyorsa (NSGA-II ya da kesin Pareto) yeni ağırlıklar için en iyi yolu
+        saklanan cepheden anında seçer.
+        Yol değişmediyse ekran yeniden çizilmez. Son çalıştırmanın yedek rotaları yeni ağırlıklarla
+        yeniden puanlanıp sıralanır; duruş nedeni aynen gösterilir.
+        """
+        algo = self.algorithm_var.get()
+        if self.current_front is None or algo not in FRONT_ALGORITHMS:
+            return
+        weights = self.get_weights()
+        if not weights:
+            return
+        start_time = time.perf_counter()
+        path, cost = best_from_front(self.current_front, weights)
+        if path is not None and path != self.current_path:
+            alts = [alt for alt, _ in self.current_backups if alt != path]
+            backups = []
+            if alts:
+                backups = sorted(zip(alts, path_costs(self.G, alts, weights).tolist()), key=lambda b: b[1])
+            elapsed = time.perf_counter() - start_time
+            self.result_text_widget.delete("1.0", tk.END)
+            self.on_algorithm_complete(path, cost, elapsed, algo, backups,
+                                       self.current_ga_stop, topology=self.current_topology)
+
+    def on_algorithm_complete(self, path, cost, elapsed, algo, backups=None, ga_stop=None, topology=None):
         """
         Algoritma başarıyla tamamlandığında çağrılır.
         Sonuçları ekrana basar, metrikleri hesaplar ve grafiği günceller.
+        backups verilirse maliyet sırasına göre yedek rotalar da listelenir.
+        topology verilirse yol sorguya özel sentetik kenar içerir; metrikler bu katmandan hesaplanır.
         """
         self.toggle_ui_state(False)
         self.current_path = path
@@ -370,23 +498,45 @@ class QoSRoutingApp:
             return
 
         try:
-            m = compute_metrics(self.G, path)
-            td = m["total_delay"]
-            tr = m["total_reliability"]
-            rc = m["resource_cost"]
-        except:
-            td, tr, rc = 0, 0, 0
-
-        self.card_delay.config(text=f"{td:.2f} ms")
-        self.card_rel.config(text=f"%{tr * 100:.1f}")
-        self.card_res.config(text=f"{rc:.1f}")
+            m = compute_metrics(topology if topology is not None else self.G, path)
+        except KeyError:
+            m = None
+
+        if m is not None:
+            self.card_delay.config(text=f"{m['total_delay']:.2f} ms")
+            self.card_rel.config(text=f"%{m['total_reliability'] * 100:.1f}")
+            self.card_res.config(text=f"{m['resource_cost']:.1f}")
+        else:
+            self.card_delay.config(text="-")
+            self.card_rel.config(text="-")
+            self.card_res.config(text="-")
 
         self.result_text_widget.insert(tk.END, f"► Durum:   TAMAMLANDI\n")
+        if topology is not None:
+            self.result_text_widget.insert(
+                tk.END, f"► Uyarı:   {path[0]} ile {path[-1]} bağlı değil; yol geçici (sentetik) bir kenar kullanıyor\n")
+        if m is None:
+            self.result_text_widget.insert(tk.END, "► Uyarı:   Yol grafikte bulunmayan bir kenar içeriyor, metrik yok\n")
         self.result_text_widget.insert(tk.END, f"► Yöntem:  {algo}\n")
         self.result_text_widget.insert(tk.END, f"► Süre:    {elapsed:.4f} sn\n")
         self.result_text_widget.insert(tk.END, f"► Fitness: {cost:.4f}\n")
         self.result_text_widget.insert(tk.END, f"► Uzunluk: {len(path)} node\n")
         self.result_text_widget.insert(tk.END, f"► Rota:    {path}\n")
+        if algo.startswith("Q-Learning"):
+            st = self.q_store.stats()
+            self.result_text_widget.insert(
+                tk.END, f"► Q-Tablo: {st['hits']} isabet / {st['misses']} ıska ({st['entries']} tablo)\n")
+        if algo == "Genetic Algorithm":
+            st = self.fitness_cache.stats()
+            self.result_text_widget.insert(
+                tk.END, f"► Fitness önbelleği: %{100 * st['hit_rate']:.0f} isabet ({st['entries']} yol)\n")
+        if algo.startswith("Genetic") and ga_stop is not None:
+            self.result_text_widget.insert(tk.END, f"► Duruş:   {ga_stop[0]} ({ga_stop[1]} nesil)\n")
+        if algo in FRONT_ALGORITHMS and self.current_front:
+            self.result_text_widget.insert(
+                tk.END, f"► Pareto cephesi: {len(self.current_front)} yol (ağırlıklar değişince cepheden seçilir)\n")
+        for i, (alt, alt_cost) in enumerate(backups or [], start=1):
+            self.result_text_widget.insert(tk.END, f"► Yedek {i}: {alt} (Fit: {alt_cost:.4f})\n")
 
         self.ax.set_title(f"{algo} | Süre: {elapsed:.3f} sn | Fit: {cost:.2f}")
         self.draw_graph()
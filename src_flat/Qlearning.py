@@ -1,11 +1,90 @@
 import math
-import networkx as nx
-from collections import defaultdict
-from metrics import compute_metrics, total_cost
-import random
+import heapq
+import time
+import numpy as np
+from metrics import compute_metrics, total_cost, edge_cost_table
+from graph_utils import as_topology, make_rng
+
+
+# Erken durdurma olcutleri (None olanlar devre disi):
+#   episodes      : bolum butcesi (None ise varsayilan 2500 / sicak baslangicta 500)
+#   time_budget   : saniye cinsinden duvar saati butcesi
+#   stable_window : acgozlu yol bu kadar bolum boyunca degismezse dur
+#   q_tol         : son check_every bolumde en buyuk |dQ| bu degerin altindaysa dur
+#   check_every   : acgozlu yolun ve |dQ| penceresinin kac bolumde bir kontrol edilecegi
+DEFAULT_STOPPING = {
+    "episodes": None,
+    "time_budget": None,
+    "stable_window": None,
+    "q_tol": None,
+    "check_every": 25,
+}
+
+
+# Depodaki bir tablo yalnizca bu nedenlerle erken durmus bir egitimden sonra "yakinsamis"
+# sayilir (sonraki sorgular egitimi atlar). Toplam egitim bolumu sicak baslangiclarla
+# birikebildiginden tek basina yakinsama gostergesi degildir.
+EARLY_STOPS = ("stable_path", "q_tolerance")
+
+
+# Toplu (lockstep) egitimin seriden farkli varsayilanlari. Dalga icindeki ajanlar ayni tablo
+# anindan secim yaptigi icin duz argmax kesfi daraltir; bu yuzden ayni dugumdeki acgozlu ajanlar
+# en iyi BATCH_GREEDY_RANKS aksiyonu paylasir (bkz. _ranked_slots) ve acgozlu yol BATCH_STOPPING
+# penceresi (10 dalga) boyunca degismezse egitim erken biter. Ikisi de parametreyle degistirilebilir
+# ve info'ya yazilir; seriyle ayni politika ve durdurma icin (karsilastirmalarda):
+#   Q_Learning_batch_run(..., greedy_ranks=1, stopping=SERIAL_EQUIVALENT_STOPPING)
+BATCH_GREEDY_RANKS = 8
+BATCH_STOPPING = {"stable_window": 640}
+SERIAL_EQUIVALENT_STOPPING = {"stable_window": None}
+
+
+# Durumdaki talep, ayni uygun kenar kumesini veren kapasite esigi sinifina indirgenir:
+# ayni siniftaki tum talepler (or. 172 ve 180 Mbps) ayni durumlari ve ayni Q tablosunu paylasir.
+# Talep yoksa kapasitesi pozitif tum kenarlar gecerlidir.
+def _demand_state(topo, demand):
+    cls = topo.demand_class(demand if demand > 0 else np.nextafter(0.0, 1.0))
+    return cls, topo.class_threshold(cls)
+
+
+# Ogrenilen Q tablosunu kullanarak en iyi (acgozlu) yolu cikarir
+def _greedy_path(best_action, next_node, source, destination, max_steps):
+    path = [source]
+    current = source
+    visited = {source} # Donguleri engellemek icin ziyaret edilenleri tut
+
+    for _ in range(max_steps):
+        if current == destination:
+            break
 
+        # Sadece en iyi aksiyonlari takip et (artik kesif yok)
+        eid = best_action(current)
+        nxt = None if eid is None else next_node[eid]
+
+        # Yol tikandiysa veya donguye girdiyse dur
+        if nxt is None or nxt in visited:
+            break
+
+        path.append(nxt)
+        visited.add(nxt)
+        current = nxt
+    return path
+
+
+def Q_Learning_run(G, source, destination, demand, weights, rng=None, q_store=None,
+                   stopping=None, return_info=False):
+    # Topoloji salt okunur kullanilir (grafa hicbir nitelik yazilmaz) ve kesif icin
+    # cagriya ozel RNG kullanilir; ayni graf uzerinde eszamanli sorgular guvenlidir.
+    # q_store (QTableStore) verilirse ayni hedefe daha once egitilmis tablo sicak baslangic olur.
+    # stopping ile erken durdurma olcutleri verilir; return_info=True ise (path, cost, info)
+    # doner, info durma nedenini, kullanilan bolum sayisini ve yakinsama suresini icerir.
+    start_time = time.perf_counter()
+    topo = as_topology(G)
+    rng = make_rng(rng)
+    stop = dict(DEFAULT_STOPPING, **(stopping or {}))
+
+    # Talep sinifi ve esigi; Q tablosu sinif icin egitilir
+    demand_cls, threshold = _demand_state(topo, demand)
 
-def Q_Learning_run(G, source, destination, demand, weights):
     # Q-Learning hiperparametreleri: Ogrenme orani, gelecek odul katsayisi ve adim siniri
     episodes = 2500
     max_steps = 70
@@ -17,116 +96,120 @@ def Q_Learning_run(G, source, destination, demand, weights):
     epsilon_decay = 0.995
     epsilon_min = 0.05
 
-    # Guvenilirlik (reliability) degerleri carpimsal oldugu icin (0-1 arasi),
-    # bunlari toplamsal maliyete cevirmek adina logaritma donusumu yapiyoruz.
-    # Kenarlar icin donusum:
-    for u, v, data in G.edges(data=True):
-        rel = max(min(data["reliability"], 1.0), 0.01)
-        data["rel_cost"] = -math.log(rel)
-
-    # Dugumler icin donusum:
-    for n, data in G.nodes(data=True):
-        rel = max(min(data["reliability"], 1.0), 0.01)
-        data["rel_cost"] = -math.log(rel)
-
-    # Kaynak dugumun guvenilirlik maliyetini ayrica tutalim
-    source_rel_cost = G.nodes[source]["rel_cost"]
-
-    # Q-Tablosunu baslatiyoruz (state-action degerlerini tutar)
-    Q = defaultdict(dict)
-
-    # Q degerini okumak icin yardimci fonksiyon
-    def get_q(s, a):
-        return Q[s].get(a, 0.0)
-
-    # Q degerini guncellemek icin yardimci fonksiyon
-    def set_q(s, a, v):
-        Q[s][a] = v
-
-    # Bir dugumden gidilebilecek gecerli komsulari bulur.
-    # Sadece bant genisligi talebi karsilayan kenarlar dikkate alinir.
-    def neighbors(n):
-        acts = []
-        for v in G.neighbors(n):
-            bw = G[n][v]["bandwidth"]
-            if bw > 0 and (demand <= 0 or bw >= demand):
-                acts.append(v)
-        return acts
-
-    # Mevcut durumda en yuksek Q degerine sahip aksiyonu (gidilecek dugumu) secer
-    def best_action(s, n):
-        acts = neighbors(n)
-        if not acts:
+    # Sicak baslangicta (kayitli tablo varsa) daha az bolum ve daha dusuk kesif yeterlidir
+    warm_episodes = 500
+    warm_epsilon = 0.3
+
+    # Adim maliyetleri agirliklara gore onceden hesaplanmis kenar tablosundan okunur.
+    # Tablo, varilan dugumun isleme gecikmesini (0.1 katsayisiyla) ve -log guvenilirligini icerir.
+    # Odul yalnizca hedefe baglidir: kaynak dugumun guvenilirlik maliyeti kaynaktan cikan her
+    # aksiyonda ayni sabit oldugu icin secimi degistirmez ve Q'ya katilmaz. Boylece QTableStore'daki
+    # (hedef bazli) tablo baska kaynaklardan gelen sorgular icin de gecerlidir; yolun maliyeti
+    # egitimden sonra compute_metrics ile hesaplanir.
+    edge_cost = edge_cost_table(topo, weights, proc_scale=0.1).tolist()
+    proc_delay_cost = (weights["delay"] * 0.1 * topo.s_ms).tolist()
+    capacity = topo.capacity.tolist()
+    next_node = topo.neighbors.tolist()  # kenar indisi -> varilan dugum
+
+    # Q-Tablosu: yonlu kenar basina bir deger. (dugum, talep) durumunda komsuya gitme
+    # aksiyonu tam olarak bir CSR kenarina karsilik geldigi icin kenar indisiyle adreslenir.
+    Q = np.zeros(topo.num_edges)
+    trained = 0
+    converged = False
+    sources = set()
+
+    entry = q_store.get(topo, destination, threshold, weights) if q_store is not None else None
+    if entry is not None:
+        Q = entry["q"].copy()
+        trained = entry["episodes"]
+        converged = entry["converged"]
+        sources = set(entry["sources"])
+        episodes = warm_episodes
+        epsilon = warm_epsilon
+
+    # Her dugumun talebi karsilayan kenarlari bant genisligi indeksinde ardisik bir dilimdir.
+    bw_edges = topo.bandwidth_index()[0]
+    starts, ends = topo.feasible_ranges(threshold)
+    starts, ends = starts.tolist(), ends.tolist()
+
+    # Mevcut dugumde en yuksek Q degerine sahip aksiyonu (kenar indisini) secer
+    def best_action(n):
+        lo, hi = starts[n], ends[n]
+        if lo == hi:
             return None
+        acts = bw_edges[lo:hi]
+        return int(acts[Q[acts].argmax()])
 
-        best_q = -math.inf
-        best_a = None
-        for a in acts:
-            q = get_q(s, a)
-            if q > best_q:
-                best_q = q
-                best_a = a
-        return best_a
-
-    # Rastgele bir komsu secer (Kesif amaciyla kullanilir)
+    # Rastgele bir uygun kenar secer (Kesif amaciyla kullanilir)
     def explore_action(n):
-        acts = neighbors(n)
-        if not acts:
+        lo, hi = starts[n], ends[n]
+        if lo == hi:
             return None
-        return random.choice(acts)
+        return int(bw_edges[rng.randrange(lo, hi)])
+
+    # Bir dugumden cikan uygun kenarlar uzerindeki en buyuk Q degeri
+    def max_q(n):
+        lo, hi = starts[n], ends[n]
+        if lo == hi:
+            return 0.0
+        return Q[bw_edges[lo:hi]].max()
+
+    # Ogrenilen Q tablosunu kullanarak en iyi (acgozlu) yolu cikarir
+    def greedy_path():
+        return _greedy_path(best_action, next_node, source, destination, max_steps)
+
+    if stop["episodes"] is not None:
+        episodes = stop["episodes"]
+    stop_reason = "episodes"
+
+    # Kayitli tablo bu kaynaktan egitilip yakinsamissa ve hedefe ulastiriyorsa egitim atlanir;
+    # baska kaynaklardan egitilmis tablolar yalnizca sicak baslangic olarak kullanilir
+    if converged and source in sources and greedy_path()[-1] == destination:
+        episodes = 0
+        stop_reason = "skipped"
+
+    # Yakinsama takibi: acgozlu yolun son degistigi bolum ve zaman
+    check_every = max(1, stop["check_every"])
+    last_greedy = None
+    converged_episode = 0
+    converged_time = 0.0
+    window_delta = 0.0
+    episodes_used = 0
 
     # Egitim dongusu (belirlenen bolum sayisi kadar calisir)
     for ep in range(episodes):
+        episodes_used = ep + 1
         current = source
         step = 0
         done = False
-        source_rel_added = False
 
         # Hedefe ulasana veya adim siniri dolana kadar dongu
         while not done:
             step += 1
-            state_key = (current, demand) # Durum tanimi: (bulunulan dugum, talep)
 
             # Epsilon-Greedy stratejisi: Epsilon olasilikla rastgele git, yoksa en iyiyi sec
-            if random.random() < epsilon:
-                nxt = explore_action(current)
+            if rng.random() < epsilon:
+                eid = explore_action(current)
             else:
-                nxt = best_action(state_key, current)
+                eid = best_action(current)
 
             # Gidecek yer yoksa donguyu kir (cikmaz sokak)
-            if nxt is None:
+            if eid is None:
                 break
+            nxt = next_node[eid]
 
-            # Kenar ve dugum verilerini al
-            edge = G[current][nxt]
-            node = G.nodes[nxt]
-
-            # Gecikme maliyetini hesapla (Kenar gecikmesi + dugum isleme gecikmesi)
-            delay_cost = edge["delay"]
-            if nxt != source and nxt != destination:
-                delay_cost += node["processing_delay"] * 0.1
+            # Agirlikli adim maliyeti (gecikme + guvenilirlik + kaynak)
+            cost = edge_cost[eid]
 
-            # Guvenilirlik ve kaynak kullanim maliyetlerini hesapla
-            reliability_cost = edge["rel_cost"] + node["rel_cost"]
-            resource_cost = 1000.0 / max(edge["bandwidth"], 1.0)
-
-            # Toplam maliyeti agirliklara gore hesapla
-            cost = (
-                weights["delay"] * delay_cost
-                + weights["reliability"] * reliability_cost
-                + weights["resource"] * resource_cost
-            )
+            # Hedef dugumde isleme gecikmesi sayilmaz
+            if nxt == destination:
+                cost -= proc_delay_cost[nxt]
 
             # Odul (Reward), maliyetin negatifi olarak tanimlanir (minimize etmek istedigimiz icin)
             r = -cost
 
-            # Ilk adimda kaynak dugumun guvenilirlik maliyetini de dus
-            if not source_rel_added:
-                r -= source_rel_cost
-                source_rel_added = True
-
             # Bant genisligi yetersizse ceza ver (filtreye ragmen ek kontrol)
-            if edge["bandwidth"] < demand:
+            if capacity[eid] < threshold:
                 r -= 2.0
 
             # Hedefe ulasildiysa buyuk odul ver ve bitir
@@ -140,17 +223,15 @@ def Q_Learning_run(G, source, destination, demand, weights):
                 done = True
 
             # Gelecek durum icin maksimum beklenen odulu (max Q) hesapla
-            next_state = (nxt, demand)
             future = 0.0
             if not done:
-                future = max(
-                    (get_q(next_state, a) for a in neighbors(nxt)),
-                    default=0.0
-                )
+                future = max_q(nxt)
 
             # Bellman denklemi ile Q degerini guncelle
-            old_q = get_q(state_key, nxt)
-            set_q(state_key, nxt, old_q + alpha * (r + gamma * future - old_q))
+            delta = alpha * (r + gamma * future - Q[eid])
+            Q[eid] += delta
+            if abs(delta) > window_delta:
+                window_delta = abs(delta)
 
             # Konumu guncelle
             current = nxt
@@ -158,37 +239,575 @@ def Q_Learning_run(G, source, destination, demand, weights):
         # Her bolum sonunda epsilon degerini azalt (kesifi azalt, somuruyu artir)
         epsilon = max(epsilon_min, epsilon * epsilon_decay)
 
+        # Erken durdurma kontrolleri
+        elapsed = time.perf_counter() - start_time
+        if stop["time_budget"] is not None and elapsed >= stop["time_budget"]:
+            stop_reason = "time_budget"
+            break
+
+        if episodes_used % check_every == 0:
+            greedy = greedy_path()
+            if greedy != last_greedy:
+                last_greedy = greedy
+                converged_episode = episodes_used
+                converged_time = elapsed
+
+            reached = greedy[-1] == destination
+            if (stop["stable_window"] is not None and reached
+                    and episodes_used - converged_episode >= stop["stable_window"]):
+                stop_reason = "stable_path"
+                break
+            if stop["q_tol"] is not None and reached and window_delta < stop["q_tol"]:
+                stop_reason = "q_tolerance"
+                break
+            window_delta = 0.0
+
     # Egitim bittikten sonra ogrenilen Q tablosunu kullanarak en iyi yolu cikar
-    path = [source]
-    current = source
-    visited = {source} # Donguleri engellemek icin ziyaret edilenleri tut
+    path = greedy_path()
+
+    # Tablo, ayni hedefe gidecek sonraki sorgular icin depoya yazilir
+    if q_store is not None and episodes_used > 0:
+        trained += episodes_used
+        sources.add(source)
+        q_store.put(topo, destination, threshold, weights, Q, trained,
+                    converged=stop_reason in EARLY_STOPS, sources=sources)
+
+    info = {
+        "stop_reason": stop_reason,
+        "episodes_used": episodes_used,
+        "converged_episode": converged_episode,
+        "time_to_converge": converged_time,
+        "demand_class": demand_cls,
+        "elapsed": time.perf_counter() - start_time,
+    }
 
-    for _ in range(max_steps):
-        if current == destination:
-            break
+    # Eger hedefe ulasilamadiysa basarisiz don
+    if path[-1] != destination:
+        return (None, math.inf, info) if return_info else (None, math.inf)
 
-        state_key = (current, demand)
-        # Sadece en iyi aksiyonlari takip et (artik kesif yok)
-        nxt = best_action(state_key, current)
+    # Yol metriklerini ve toplam maliyeti hesapla
+    metrics = compute_metrics(topo, path)
+    if metrics is None:
+        return (None, math.inf, info) if return_info else (None, math.inf)
 
-        # Yol tikandiysa veya donguye girdiyse dur
-        if nxt is None or nxt in visited:
+    cost = total_cost(metrics, weights)
+    return (path, cost, info) if return_info else (path, cost)
+
+
+# Ayni dugumdeki acgozlu ajanlar sirayla 1., 2., ..., ranks. en yuksek Q degerli aksiyonu secer
+# (sonra basa doner). Seri egitimde en iyi kenar kotu cikarsa sonraki bolum ikinci en iyiyi dener;
+# ayni tablo anindan secim yapan dalgada bu ardisik denemeler boylece tek dalgada yapilir.
+# Tek ajanli dugumlerde secim Q_Learning_run'daki argmax ile aynidir.
+# q: ajanlarin aksiyon degerleri (bos hucreler -inf); donen deger aksiyon sutunlaridir.
+def _ranked_slots(q, nodes, n_act, ranks):
+    k = len(nodes)
+    order = np.argsort(nodes, kind="stable")
+    sorted_nodes = nodes[order]
+    first = np.flatnonzero(np.r_[True, sorted_nodes[1:] != sorted_nodes[:-1]])
+    rank = np.empty(k, dtype=np.intp)
+    rank[order] = np.arange(k) - np.repeat(first, np.diff(np.r_[first, k]))
+    rank %= np.minimum(n_act, ranks)
+
+    slot = q.argmax(axis=1)
+    need = np.flatnonzero(rank > 0)
+    if need.size:
+        sub, r = q[need], rank[need]
+        rows = np.arange(len(need))
+        best = slot[need]
+        for j in range(1, int(r.max()) + 1):
+            sub[rows, best] = -np.inf
+            best = np.where(r >= j, sub.argmax(axis=1), best)
+        slot[need] = best
+    return slot
+
+
+def Q_Learning_batch_run(G, source, destination, demand, weights, rng=None, q_store=None,
+                         stopping=None, return_info=False, batch_size=64, greedy_ranks=BATCH_GREEDY_RANKS):
+    # Q_Learning_run ile ayni odul yapisini ve bolum butcesini kullanir, ancak batch_size adet
+    # bagimsiz bolumu ayni anda (lockstep) NumPy dizileri olarak ilerletir: her adimda tum ajanlarin
+    # epsilon-greedy secimleri, odulleri ve Bellman guncellemeleri tek seferde hesaplanir.
+    # Ayni adimda ayni kenari guncelleyen ajanlarin hedefleri ortalanip tek adimda eklenir.
+    # Erken durdurma olcutlerinin tumu (episodes, time_budget, stable_window, q_tol) dalga
+    # sonlarinda kontrol edilir; q_tol penceresi son dalgadir.
+    # Varsayilanlar seriden farklidir (BATCH_GREEDY_RANKS siralamali acgozlu secim ve BATCH_STOPPING
+    # kararlilik penceresi); greedy_ranks=1 ve stopping=SERIAL_EQUIVALENT_STOPPING seri egitimin
+    # argmax politikasini ve durdurma olcutlerini kullanir, ancak dalga icindeki ajanlar ayni tablo
+    # anini gordugu icin ayni bolum butcesinde daha zayif yollar bulur.
+    start_time = time.perf_counter()
+    topo = as_topology(G)
+    rng = make_rng(rng)
+    gen = np.random.default_rng(rng.getrandbits(64))
+    stop = dict(DEFAULT_STOPPING, **BATCH_STOPPING)
+    stop.update(stopping or {})
+
+    # Talep sinifi ve esigi; Q tablosu sinif icin egitilir
+    demand_cls, threshold = _demand_state(topo, demand)
+
+    # Hiperparametreler ve bolum butcesi Q_Learning_run ile aynidir; erken durdurma ise
+    # varsayilan olarak BATCH_STOPPING penceresini de kullanir
+    episodes = 2500
+    max_steps = 70
+    alpha = 0.12
+    gamma = 0.95
+    epsilon = 1.0
+    epsilon_decay = 0.995
+    epsilon_min = 0.05
+    warm_episodes = 500
+    warm_epsilon = 0.3
+
+    next_node = topo.neighbors
+
+    # Kenar basina sabit odul: -adim maliyeti, hedefte isleme gecikmesi duzeltmesi,
+    # bant genisligi cezasi ve hedef odulu (kaynaga bagli terim yoktur, bkz. Q_Learning_run).
+    # Adim siniri cezasi adimda eklenir.
+    step_cost = edge_cost_table(topo, weights, proc_scale=0.1).copy()
+    proc_delay_cost = weights["delay"] * 0.1 * topo.s_ms
+    ends_at = next_node == destination
+    step_cost[ends_at] -= proc_delay_cost[next_node[ends_at]]
+    reward = -step_cost
+    reward[topo.capacity < threshold] -= 2.0
+    reward[next_node == destination] += 5.0
+
+    Q = np.zeros(topo.num_edges)
+    trained = 0
+    converged = False
+    sources = set()
+
+    entry = q_store.get(topo, destination, threshold, weights) if q_store is not None else None
+    if entry is not None:
+        Q = entry["q"].copy()
+        trained = entry["episodes"]
+        converged = entry["converged"]
+        sources = set(entry["sources"])
+        episodes = warm_episodes
+        epsilon = warm_epsilon
+
+    # Uygun kenarlar dugum basina -1 ile doldurulmus bir matriste tutulur: actions[n, j],
+    # n dugumunun bant genisligi sirasindaki j. uygun kenari. Boylece ajanlarin tum
+    # aksiyon kumeleri tek bir indeksleme ile okunur.
+    actions, counts = topo.feasible_table(threshold)
+    valid = actions >= 0
+    safe_actions = np.where(valid, actions, 0)
+
+    # Egitim boyunca Q degerleri uygun kenar matrisiyle ayni yerlesimde tutulur: Qm[n, j],
+    # actions[n, j] kenarinin degeridir (bos hucreler -inf). Ajanlarin aksiyon degerleri boylece
+    # daginik Q[kenar] okumasi yerine satir okumasiyla alinir; sonunda Q vektorune geri yazilir.
+    width = actions.shape[1]
+    Qm = np.where(valid, Q[safe_actions], -np.inf)
+    Qflat = Qm.reshape(-1)
+
+    def best_action(n):
+        if counts[n] == 0:
+            return None
+        return int(actions[n, Qm[n].argmax()])
+
+    next_list = next_node.tolist()
+
+    def greedy_path():
+        return _greedy_path(best_action, next_list, source, destination, max_steps)
+
+    if stop["episodes"] is not None:
+        episodes = stop["episodes"]
+    stop_reason = "episodes"
+
+    if converged and source in sources and greedy_path()[-1] == destination:
+        episodes = 0
+        stop_reason = "skipped"
+
+    batch_size = max(1, int(batch_size))
+    last_greedy = None
+    converged_episode = 0
+    converged_time = 0.0
+    window_delta = 0.0
+    episodes_used = 0
+
+    while episodes_used < episodes:
+        b = min(batch_size, episodes - episodes_used)
+
+        # Dalgadaki her ajanin epsilon degeri kendi bolum sirasina gore azalir
+        eps = np.maximum(epsilon_min, epsilon * epsilon_decay ** np.arange(b))
+        epsilon = max(epsilon_min, epsilon * epsilon_decay ** b)
+
+        current = np.full(b, source)
+        agents = np.arange(b)
+
+        for step in range(1, max_steps + 1):
+            # Cikmaz sokaktaki ajanlar guncelleme yapmadan bolumu bitirir
+            n_act = counts[current]
+            alive = n_act > 0
+            if not alive.all():
+                agents, current, n_act = agents[alive], current[alive], n_act[alive]
+            k = len(agents)
+            if k == 0:
+                break
+
+            # Epsilon-Greedy: kesif yapan ajan rastgele uygun kenari, digerleri en yuksek Q degerli
+            # kenari (greedy_ranks > 1 ise siralamali acgozlu secimi, bkz. _ranked_slots) secer
+            slot = (gen.random(k) * n_act).astype(np.intp)
+            greedy = gen.random(k) >= eps[agents]
+            if greedy.any():
+                if greedy_ranks > 1:
+                    slot[greedy] = _ranked_slots(Qm[current[greedy]], current[greedy], n_act[greedy],
+                                                 greedy_ranks)
+                else:
+                    slot[greedy] = Qm[current[greedy]].argmax(axis=1)
+            eid = actions[current, slot]
+            nxt = next_node[eid]
+
+            r = reward[eid]
+            done = nxt == destination
+            if step >= max_steps:
+                r = r - 5.0
+                done = np.ones(k, dtype=bool)
+
+            # Gelecek durum icin maksimum beklenen odul (bitenlerde ve cikmazlarda 0)
+            future = np.where(done | (counts[nxt] == 0), 0.0, Qm[nxt].max(axis=1))
+
+            # Bellman guncellemesi scatter-add ile uygulanir. Ayni kenari secen c ajanin hedefleri
+            # ortalanir ve adim 1 - (1 - alpha)^c alinir: ayni hedefe c ardisik guncellemeyle
+            # esdegerdir ve 1'i asmaz (toplanirsa adim alpha * c olur ve tablo iraksar).
+            # q_tol icin adim basina en buyuk degisimin ust siniri izlenir.
+            cell = current * width + slot
+            delta = r + gamma * future - Qflat[cell]
+            shared = np.bincount(cell)[cell]
+            step_size = 1.0 - (1.0 - alpha) ** shared
+            np.add.at(Qflat, cell, step_size * delta / shared)
+            window_delta = max(window_delta, float(np.abs(step_size * delta).max()))
+
+            keep = ~done
+            agents, current = agents[keep], nxt[keep]
+
+        episodes_used += b
+
+        # Erken durdurma kontrolleri (dalga sonlarinda)
+        elapsed = time.perf_counter() - start_time
+        if stop["time_budget"] is not None and elapsed >= stop["time_budget"]:
+            stop_reason = "time_budget"
             break
 
-        path.append(nxt)
-        visited.add(nxt)
-        current = nxt
+        greedy = greedy_path()
+        if greedy != last_greedy:
+            last_greedy = greedy
+            converged_episode = episodes_used
+            converged_time = elapsed
+        reached = greedy[-1] == destination
+        if (stop["stable_window"] is not None and reached
+                and episodes_used - converged_episode >= stop["stable_window"]):
+            stop_reason = "stable_path"
+            break
+        if stop["q_tol"] is not None and reached and window_delta < stop["q_tol"]:
+            stop_reason = "q_tolerance"
+            break
+        window_delta = 0.0
+
+    Q[actions[valid]] = Qm[valid]
+    path = greedy_path()
+
+    if q_store is not None and episodes_used > 0:
+        trained += episodes_used
+        sources.add(source)
+        q_store.put(topo, destination, threshold, weights, Q, trained,
+                    converged=stop_reason in EARLY_STOPS, sources=sources)
+
+    info = {
+        "stop_reason": stop_reason,
+        "episodes_used": episodes_used,
+        "converged_episode": converged_episode,
+        "time_to_converge": converged_time,
+        "demand_class": demand_cls,
+        "greedy_ranks": greedy_ranks,
+        "stable_window": stop["stable_window"],
+        "elapsed": time.perf_counter() - start_time,
+    }
 
-    # Eger hedefe ulasilamadiysa basarisiz don
     if path[-1] != destination:
-        return None, math.inf
+        return (None, math.inf, info) if return_info else (None, math.inf)
 
-    # Yol metriklerini ve toplam maliyeti hesapla
-    metrics = compute_metrics(G, path)
+    metrics = compute_metrics(topo, path)
     if metrics is None:
-        return None, math.inf
+        return (None, math.inf, info) if return_info else (None, math.inf)
 
     cost = total_cost(metrics, weights)
-    return path, cost
+    return (path, cost, info) if return_info else (path, cost)
+
+
+def Q_Learning_sweep_run(G, source, destination, demand, weights, rng=None, q_store=None,
+                         stopping=None, return_info=False):
+    # Prioritized sweeping (model tabanli Dyna-Q): ortam deterministiktir ve gecis modeli
+    # (kenar -> varilan dugum, kenar -> odul) graftan bilinir. Her gercek adimdan sonra
+    # Bellman hatasi buyuk olan kenarlar bir oncelik kuyrugundan cekilerek modelle
+    # guncellenir; bir kenarin degeri degisince o dugume gelen kenarlar kuyruga eklenir.
+    # Odul tanimi ve imza Q_Learning_run ile aynidir; gerekli gercek bolum sayisi cok azdir.
+    # Bedeli: 2500 yerine 200 gercek bolum kullanilir, ancak her yedekleme Python'da yapilir ve bir
+    # dugumun en iyi degerini dusuren yedekleme satiri yeniden tarar. Veri setinin yogun grafinda
+    # (dugum basina ~100 kenar) sorgu suresi bu yuzden seri egitimle ayni mertebede, genellikle
+    # biraz ustundedir; kazanc bolum sayisinda ve yol kalitesindedir, duvar saatinde degil.
+    start_time = time.perf_counter()
+    topo = as_topology(G)
+    rng = make_rng(rng)
+    stop = dict(DEFAULT_STOPPING, **(stopping or {}))
+
+    # Talep sinifi ve esigi; Q tablosu sinif icin egitilir
+    demand_cls, threshold = _demand_state(topo, demand)
+
+    # Gercek bolum sayisi Q_Learning_run'in 2500 bolumunun kucuk bir kesridir;
+    # her gercek adimdan sonra en fazla planning_steps model guncellemesi yapilir.
+    # Maliyet: sorgu basina en fazla planning_steps x gercek adim sayisi yedekleme (veri setinin
+    # yogun grafinda 5-35 bin, info["planning_backups"]). planning_steps=20 yol kalitesini
+    # artirmadan sureyi ~%10 uzatiyordu.
+    # (50 bolum gecikme agirlikli sorgularda yetersiz kaliyordu: adim maliyetleri buyuk oldugunda
+    # tek ziyaretli kenarlarin degerleri gercek maliyetin cok ustunde kalir.)
+    episodes = 200
+    max_steps = 70
+    alpha = 0.12
+    gamma = 0.95
+    planning_steps = 10
+    theta = 1e-4  # Bu degerin altindaki Bellman hatalari kuyruga alinmaz
+
+    epsilon = 1.0
+    epsilon_decay = 0.92
+    epsilon_min = 0.05
+
+    warm_episodes = 40
+    warm_epsilon = 0.3
+
+    # Gecis modeli: Q_Learning_run'daki adim odulunun kenar basina vektoru. Odul yalnizca hedefe
+    # baglidir (bkz. Q_Learning_run); gercek adimlar ve planlama yedeklemeleri ayni odulu kullanir.
+    next_node = topo.neighbors
+    heads = topo.heads
+    step_cost = edge_cost_table(topo, weights, proc_scale=0.1).copy()
+    proc_delay_cost = weights["delay"] * 0.1 * topo.s_ms
+    ends_at = next_node == destination
+    step_cost[ends_at] -= proc_delay_cost[next_node[ends_at]]
+    reward = -step_cost
+    reward[topo.capacity < threshold] -= 2.0
+    reward[next_node == destination] += 5.0
+    terminal = (next_node == destination).tolist()
+    reward_list = reward.tolist()
+    next_list = next_node.tolist()
+    head_list = heads.tolist()
+
+    # Yonsuz kenarlar iki yonde de saklandigindan (u, v)'nin tersi (v, u) kenaridir;
+    # bir dugume gelen uygun kenarlar, cikan uygun kenarlarin tersleridir
+    reverse = topo.edge_ids(next_node, heads)
+
+    Q = np.zeros(topo.num_edges)
+    trained = 0
+    converged = False
+    sources = set()
+
+    entry = q_store.get(topo, destination, threshold, weights) if q_store is not None else None
+    if entry is not None:
+        Q = entry["q"].copy()
+        trained = entry["episodes"]
+        converged = entry["converged"]
+        sources = set(entry["sources"])
+        episodes = warm_episodes
+        epsilon = warm_epsilon
+
+    bw_edges = topo.bandwidth_index()[0]
+    starts, ends = topo.feasible_ranges(threshold)
+    starts, ends = starts.tolist(), ends.tolist()
+
+    def best_action(n):
+        lo, hi = starts[n], ends[n]
+        if lo == hi:
+            return None
+        acts = bw_edges[lo:hi]
+        return int(acts[Q[acts].argmax()])
+
+    def explore_action(n):
+        lo, hi = starts[n], ends[n]
+        if lo == hi:
+            return None
+        return int(bw_edges[rng.randrange(lo, hi)])
+
+    def row_max(n):
+        lo, hi = starts[n], ends[n]
+        if lo == hi:
+            return 0.0
+        return float(Q[bw_edges[lo:hi]].max())
+
+    # Her yedekleme hem varilan hem cikilan dugumun en buyuk Q degerini okur; bu degerler dugum
+    # basina onbellekte tutulur ve Q yalnizca set_q ile degistirilir. Satir yalnizca en buyuk
+    # degerli kenarin degeri dustugunde yeniden taranir.
+    node_max = [row_max(n) for n in range(topo.num_nodes)]
+
+    def max_q(n):
+        return node_max[n]
+
+    def set_q(e, value):
+        # Q[e]'yi yazar; kenarin cikis dugumunun en buyuk Q degeri degistiyse True doner
+        u = head_list[e]
+        old = Q[e]
+        Q[e] = value
+        m = node_max[u]
+        if value > m:
+            node_max[u] = value
+        elif old == m and value < m:
+            node_max[u] = row_max(u)
+        return node_max[u] != m
+
+    def greedy_path():
+        return _greedy_path(best_action, next_list, source, destination, max_steps)
+
+    # Oncelik kuyrugu: (-|Bellman hatasi|, kenar). Ayni kenar birden fazla kez bulunabilir;
+    # guncel onceligi olmayan kayitlar cekildiginde atlanir.
+    queue = []
+    priority = np.zeros(topo.num_edges)
+    backups = 0
+    scanned = [False] * topo.num_nodes
+
+    def push_predecessors(n, force=False):
+        # n dugumunun degeri degisti: n'ye gelen uygun kenarlarin hatasi yeniden hesaplanir.
+        # Dugumun degeri (en buyuk Q) degismediyse gelen kenarlarin hatasi da degismez; bu yuzden
+        # ilk taramadan sonra yalnizca deger degisince cagrilir.
+        lo, hi = starts[n], ends[n]
+        if lo == hi or (n == destination and not force):
+            return
+        scanned[n] = True
+        preds = reverse[bw_edges[lo:hi]]
+        future = 0.0 if n == destination else gamma * max_q(n)
+        err = np.abs(reward[preds] + future - Q[preds])
+        hot = (err > theta) & (err > priority[preds])
+        if not hot.any():
+            return
+        preds, err = preds[hot], err[hot]
+        priority[preds] = err
+        for e, p in zip(preds.tolist(), err.tolist()):
+            heapq.heappush(queue, (-p, e))
+
+    def push_edge(e):
+        # Gercek deneyimle degisen kenarin kendi hatasi
+        v = next_list[e]
+        err = abs(reward_list[e] + (0.0 if terminal[e] else gamma * node_max[v]) - Q[e])
+        if err > theta and err > priority[e]:
+            priority[e] = err
+            heapq.heappush(queue, (-err, e))
+
+    def plan():
+        # Kuyruktaki en buyuk hatali kenarlar modelden tam (deterministik) yedekleme alir
+        nonlocal backups
+        for _ in range(planning_steps):
+            while queue:
+                p, e = heapq.heappop(queue)
+                if priority[e] == -p:
+                    break
+            else:
+                return
+            priority[e] = 0.0
+            v = next_list[e]
+            u = head_list[e]
+            backups += 1
+            if set_q(e, reward_list[e] + (0.0 if terminal[e] else gamma * node_max[v])) or not scanned[u]:
+                push_predecessors(u)
+
+    if stop["episodes"] is not None:
+        episodes = stop["episodes"]
+    stop_reason = "episodes"
+
+    if converged and source in sources and greedy_path()[-1] == destination:
+        episodes = 0
+        stop_reason = "skipped"
+
+    # Model bilindigi icin hedefe giren kenarlar bastan kuyruga alinir;
+    # hedef odulu ilk gercek bolumden once geriye dogru yayilmaya baslar
+    push_predecessors(destination, force=True)
+
+    check_every = max(1, stop["check_every"])
+    last_greedy = None
+    converged_episode = 0
+    converged_time = 0.0
+    window_delta = 0.0
+    episodes_used = 0
+
+    for ep in range(episodes):
+        episodes_used = ep + 1
+        current = source
+        step = 0
+        done = False
+
+        while not done:
+            step += 1
+
+            if rng.random() < epsilon:
+                eid = explore_action(current)
+            else:
+                eid = best_action(current)
+
+            if eid is None:
+                break
+            nxt = next_list[eid]
+
+            # Gercek deneyimden gelen odul: model odulu ve bolume bagli adim siniri cezasi
+            r = reward_list[eid]
+            done = terminal[eid]
+            if step >= max_steps:
+                r -= 5.0
+                done = True
+
+            future = 0.0 if done else max_q(nxt)
+            delta = alpha * (r + gamma * future - Q[eid])
+            changed = set_q(eid, Q[eid] + delta)
+            if abs(delta) > window_delta:
+                window_delta = abs(delta)
+
+            # Degeri degisen dugume gelen kenarlar kuyruga girer, ardindan planlama yapilir
+            if changed or not scanned[current]:
+                push_predecessors(current)
+            push_edge(eid)
+            plan()
+
+            current = nxt
+
+        epsilon = max(epsilon_min, epsilon * epsilon_decay)
 
-Bunlar nasıl sence
+        elapsed = time.perf_counter() - start_time
+        if stop["time_budget"] is not None and elapsed >= stop["time_budget"]:
+            stop_reason = "time_budget"
+            break
+
+        if episodes_used % check_every == 0:
+            greedy = greedy_path()
+            if greedy != last_greedy:
+                last_greedy = greedy
+                converged_episode = episodes_used
+                converged_time = elapsed
+
+            reached = greedy[-1] == destination
+            if (stop["stable_window"] is not None and reached
+                    and episodes_used - converged_episode >= stop["stable_window"]):
+                stop_reason = "stable_path"
+                break
+            if stop["q_tol"] is not None and reached and window_delta < stop["q_tol"]:
+                stop_reason = "q_tolerance"
+                break
+            window_delta = 0.0
+
+    path = greedy_path()
+
+    if q_store is not None and episodes_used > 0:
+        trained += episodes_used
+        sources.add(source)
+        q_store.put(topo, destination, threshold, weights, Q, trained,
+                    converged=stop_reason in EARLY_STOPS, sources=sources)
+
+    info = {
+        "stop_reason": stop_reason,
+        "episodes_used": episodes_used,
+        "converged_episode": converged_episode,
+        "time_to_converge": converged_time,
+        "demand_class": demand_cls,
+        "planning_backups": backups,
+        "elapsed": time.perf_counter() - start_time,
+    }
+
+    if path[-1] != destination:
+        return (None, math.inf, info) if return_info else (None, math.inf)
+
+    metrics = compute_metrics(topo, path)
+    if metrics is None:
+        return (None, math.inf, info) if return_info else (None, math.inf)
+
+    cost = total_cost(metrics, weights)
+    return (path, cost, info) if return_info else (path, cost)
@@ -0,0 +1,203 @@
+import math
+import heapq
+import numpy as np
+
+from graph_utils import as_topology
+from metrics import edge_cost_table, weights_key, path_costs
+
+
+# Ağırlıklı toplam maliyet kenarlar üzerinde toplamsal olduğundan (güvenilirlik -log ile
+# toplama çevrildi), bant genişliği kısıtlı problem talebi karşılamayan kenarlar atılmış
+# grafikte Dijkstra ile kesin olarak çözülür.
+
+
+def shortest_path_tree(G, source, demand, weights, target=None, blocked_nodes=None, blocked_edges=None):
+    """
+    source'tan talebi karşılayan kenarlar üzerinden tek kaynaklı en kısa yol ağacı.
+    Kenar ağırlıkları edge_cost_table'dan okunur. target (tek düğüm ya da düğüm kümesi)
+    verilirse hepsi kesinleştiğinde arama durur.
+    blocked_nodes / blocked_edges (bool dizileri) verilirse o düğüm ve kenarlar kullanılmaz.
+
+    Öncelik kuyruğu ikili yığındır (heapq); bir düğümün uygun kenarları bant genişliği
+    indeksinden tek dilim olarak alınıp NumPy ile toplu gevşetilir.
+
+    :return: (dist, parent) dizileri; parent[v], v'ye gelinen kenarın indisidir (kaynak ve
+             ulaşılamayan düğümler için -1), ulaşılamayan düğümlerin dist değeri inf'tir.
+    """
+    topo = as_topology(G)
+    bw_edges, bw_nbrs, _ = topo.bandwidth_index()
+    cost = edge_cost_table(topo, weights)[bw_edges]
+
+    dist = np.full(topo.num_nodes, np.inf)
+    parent = np.full(topo.num_nodes, -1, dtype=np.int64)
+    done = np.zeros(topo.num_nodes, dtype=bool)
+    dist[source] = 0.0
+    heap = [(0.0, source)]
+    remaining = None
+    if target is not None:
+        remaining = set(target) if isinstance(target, (set, frozenset, list, tuple)) else {target}
+
+    while heap:
+        du, u = heapq.heappop(heap)
+        if done[u]:
+            continue
+        done[u] = True
+        if remaining is not None:
+            remaining.discard(u)
+            if not remaining:
+                break
+
+        lo, hi = topo._feasible_count(u, demand)
+        v = bw_nbrs[lo:hi]
+        nd = du + cost[lo:hi]
+        better = nd < dist[v]
+        if blocked_nodes is not None:
+            better &= ~blocked_nodes[v]
+        if blocked_edges is not None:
+            better &= ~blocked_edges[bw_edges[lo:hi]]
+        if better.any():
+            v, nd = v[better], nd[better]
+            dist[v] = nd
+            parent[v] = bw_edges[lo:hi][better]
+            for dv, w in zip(nd.tolist(), v.tolist()):
+                heapq.heappush(heap, (dv, w))
+
+    return dist, parent
+
+
+def tree_path(G, parent, source, target):
+    """En kısa yol ağacından source -> target yolunu çıkarır; ulaşılamıyorsa None."""
+    if target != source and parent[target] < 0:
+        return None
+    heads = as_topology(G).heads
+    path = [int(target)]
+    while path[-1] != source:
+        path.append(int(heads[parent[path[-1]]]))
+    return path[::-1]
+
+
+def path_cost_from_tree(G, dist, source, target, weights):
+    # Ağaç mesafesine kaynak güvenilirliği eklenir, hedefin işlem gecikmesi çıkarılır (bkz. edge_cost_table)
+    topo = as_topology(G)
+    w_d, w_r, _ = weights_key(weights)
+    return float(dist[target]) + w_r * float(topo.node_rel_cost[source]) - w_d * float(topo.s_ms[target])
+
+
+def dijkstra_run(G, source, destination, demand, weights):
+    """
+    Talep kısıtlı ağırlıklı en kısa yolu kesin olarak bulur.
+    run_genetic_algorithm / Q_Learning_run ile aynı biçimde (path, cost) döndürür;
+    yol yoksa (None, inf).
+    """
+    topo = as_topology(G)
+    if source not in topo or destination not in topo or source == destination:
+        return None, math.inf
+
+    dist, parent = shortest_path_tree(topo, source, demand, weights, target=destination)
+    path = tree_path(topo, parent, source, destination)
+    if path is None:
+        return None, math.inf
+
+    return path, path_cost_from_tree(topo, dist, source, destination, weights)
+
+
+def k_shortest_paths(G, source, destination, demand, weights):
+    """
+    Talep kısıtlı grafikte döngüsüz yolları artan maliyet sırasıyla üreten üreteç (Yen algoritması).
+
+    Sapma (deviation) yolları tembel üretilir: bir sonraki yol yalnızca istendiğinde,
+    bir önceki yolun sapma noktalarından hesaplanır. Her adımda (path, cost) verir.
+    """
+    topo = as_topology(G)
+    if source not in topo or destination not in topo or source == destination:
+        return
+
+    path, cost = dijkstra_run(topo, source, destination, demand, weights)
+    if path is None:
+        return
+
+    accepted = [path]
+    seen = {tuple(path)}
+    candidates = []
+    yield path, cost
+
+    while True:
+        last = accepted[-1]
+        for i in range(len(last) - 1):
+            spur = last[i]
+            root = last[:i + 1]
+
+            # Aynı kök ile başlayan kabul edilmiş yolların bir sonraki kenarı yasaklanır
+            blocked_edges = np.zeros(topo.num_edges, dtype=bool)
+            for p in accepted:
+                if len(p) > i + 1 and p[:i + 1] == root:
+                    e = topo.edge_id(p[i], p[i + 1])
+                    if e >= 0:
+                        blocked_edges[e] = True
+
+            # Kök üzerindeki düğümler (sapma düğümü hariç) döngü oluşmaması için yasaklanır
+            blocked_nodes = np.zeros(topo.num_nodes, dtype=bool)
+            blocked_nodes[root[:-1]] = True
+
+            dist, parent = shortest_path_tree(
+                topo, spur, demand, weights, target=destination,
+                blocked_nodes=blocked_nodes, blocked_edges=blocked_edges
+            )
+            spur_path = tree_path(topo, parent, spur, destination)
+            if spur_path is None:
+                continue
+
+            total = root[:-1] + spur_path
+            key = tuple(total)
+            if key in seen:
+                continue
+            seen.add(key)
+            heapq.heappush(candidates, (float(path_costs(topo, [total], weights)[0]), total))
+
+        if not candidates:
+            return
+
+        cost, path = heapq.heappop(candidates)
+        accepted.append(path)
+        yield path, cost
+
+
+def route_demands(G, demands, weights=None):
+    """
+    Talep listesini kaynak başına en kısa yol ağaçlarıyla toplu olarak yönlendirir.
+
+    demands öğeleri (src, dst, demand) ya da (src, dst, demand, weights) olabilir.
+    Talepler (kaynak, kapasite eşik sınıfı, ağırlıklar) anahtarıyla gruplanır; aynı sınıftaki
+    talepler aynı uygun kenar kümesini gördüğünden her grup için tek bir arama yeterlidir
+    ve tüm hedeflerin yolları ağaçtan çıkarılır.
+
+    :return: Girdi sırasıyla (path, cost) listesi; yol yoksa (None, inf).
+    """
+    topo = as_topology(G)
+    groups = {}
+    items = []
+    for i, item in enumerate(demands):
+        s, d, b = item[0], item[1], item[2]
+        w = item[3] if len(item) > 3 else weights
+        items.append((s, d, w))
+        key = (s, topo.demand_class(b), weights_key(w))
+        groups.setdefault(key, []).append(i)
+
+    results = [(None, math.inf)] * len(items)
+    for (s, cls, _), members in groups.items():
+        if s not in topo:
+            continue
+        w = items[members[0]][2]
+        targets = {items[i][1] for i in members if items[i][1] in topo and items[i][1] != s}
+        if not targets:
+            continue
+        dist, parent = shortest_path_tree(topo, s, topo.class_threshold(cls), w, target=targets)
+        for i in members:
+            d = items[i][1]
+            if d == s or d not in topo:
+                continue
+            path = tree_path(topo, parent, s, d)
+            if path is not None:
+                results[i] = (path, path_cost_from_tree(topo, dist, s, d, w))
+
+    return results
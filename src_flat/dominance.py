@@ -0,0 +1,142 @@
+import bisect
+
+import numpy as np
+
+
+# Domine edilmeme (Pareto) filtresi. Tüm amaçlar küçültülür: j, i'yi domine eder
+# <=> her amaçta j <= i ve en az birinde j < i. Aynı noktanın kopyaları birbirini domine etmez.
+#
+#   2 amaç : sözlük sırası + önek minimumu (tamamen vektörel), O(n log n)
+#   3 amaç : Kung tarzı tarama; önceki domine edilmeyen noktaların (y, z) merdiveni
+#            ikili aramayla sorgulanır. Karşılaştırmalar O(n log n), ancak merdiven Python
+#            listesi olduğundan her ekleme/silme O(h) kaydırmadır (h: merdiven boyu); en kötü
+#            durum (tüm noktalar cephede) O(n^2) kaydırma, pratikte memmove hızındadır
+#   4+ amaç: toplam değere göre sıralı bloklar; her blok bulunan cepheye ve kendi içine karşı
+#            vektörel olarak elenir
+#
+# NaN içeren satırlar karşılaştırılamaz ve domine edilmiş sayılır.
+
+DEFAULT_BLOCK = 1024
+
+
+def _unique_sorted(points):
+    # Farklı noktalar sözlük sırasıyla ve her satırın bu listedeki indisi
+    uniq, inverse = np.unique(points, axis=0, return_inverse=True)
+    return uniq, inverse.reshape(-1)
+
+
+def _mask_2d(uniq):
+    # Sıralı listede önceki her farklı nokta x'te <= olduğundan, i ancak önceki noktaların
+    # en küçük y'si y_i'den büyükse domine edilmez
+    prev_min = np.minimum.accumulate(np.concatenate([[np.inf], uniq[:-1, 1]]))
+    return uniq[:, 1] < prev_min
+
+
+def _mask_3d(uniq):
+    # Merdiven: y'ye göre artan, z'ye göre kesin azalan domine edilmeyen (y, z) çiftleri.
+    # y_j <= y_i olan en sağdaki basamak bu aralıktaki en küçük z'yi taşır.
+    ys, zs = [], []
+    keep = np.zeros(len(uniq), dtype=bool)
+    for i, (y, z) in enumerate(uniq[:, 1:].tolist()):
+        k = bisect.bisect_right(ys, y)
+        if k and zs[k - 1] <= z:
+            continue
+        keep[i] = True
+        # Yeni basamağın domine ettiği (y >= y_i, z >= z_i) basamaklar silinir; her basamak en
+        # fazla bir kez silindiğinden tarama toplamda O(n), dilim ataması ise O(len(ys)) kaydırmadır
+        end = k
+        while end < len(ys) and zs[end] >= z:
+            end += 1
+        if k and ys[k - 1] == y:
+            k -= 1
+        ys[k:end] = [y]
+        zs[k:end] = [z]
+    return keep
+
+
+def _dominated_by(A, B):
+    # A'nın her satırı B'deki bir satır tarafından domine ediliyor mu? (|A| x |B| matris;
+    # amaçlar tek tek katlanır, (|A|, |B|, m) ara dizisi oluşturulmaz)
+    le = np.ones((len(A), len(B)), dtype=bool)
+    lt = np.zeros((len(A), len(B)), dtype=bool)
+    for k in range(A.shape[1]):
+        a, b = A[:, k, None], B[None, :, k]
+        le &= b <= a
+        lt |= b < a
+    return (le & lt).any(axis=1)
+
+
+def _mask_blocked(uniq, block):
+    # Domine eden nokta toplamca daha küçüktür (sonsuz toplamlarda eşitlik sözlük sırasıyla
+    # bozulur); toplam sırasıyla işlenince bulunan cepheden hiçbir nokta sonradan elenmez
+    with np.errstate(invalid="ignore"):
+        total = np.nan_to_num(uniq.sum(axis=1), nan=np.inf)
+    order = np.argsort(total, kind="stable")
+    pts = uniq[order]
+    keep = np.zeros(len(pts), dtype=bool)
+    front = pts[:0]
+    for lo in range(0, len(pts), block):
+        blk = pts[lo:lo + block]
+        alive = ~_dominated_by(blk, front) if len(front) else np.ones(len(blk), dtype=bool)
+        idx = np.flatnonzero(alive)
+        cand = blk[idx]
+        if len(cand) > 1:
+            idx = idx[~_dominated_by(cand, cand)]
+        keep[lo + idx] = True
+        front = np.vstack([front, blk[idx]])
+    out = np.zeros(len(pts), dtype=bool)
+    out[order] = keep
+    return out
+
+
+def non_dominated_mask(points, block=DEFAULT_BLOCK):
+    """
+    (n, m) nokta dizisi için domine edilmeyen satırların bool maskesi (tüm amaçlar küçültülür).
+    m = 2 için sıralama ve taramayla O(n log n); m = 3 için O(n log n) karşılaştırma ve en kötü
+    O(n^2) liste kaydırması; daha yüksek boyutlarda block büyüklüğünde vektörel karşılaştırma
+    kullanılır.
+    """
+    points = np.asarray(points, dtype=float)
+    if points.ndim != 2:
+        raise ValueError("points (n, m) boyutlu olmalıdır")
+    n, m = points.shape
+    mask = np.zeros(n, dtype=bool)
+    comparable = ~np.isnan(points).any(axis=1)
+    if n == 0 or not comparable.any():
+        return mask
+    if m == 1:
+        mask[comparable] = points[comparable, 0] == points[comparable, 0].min()
+        return mask
+
+    uniq, inverse = _unique_sorted(points[comparable])
+    if m == 2:
+        keep = _mask_2d(uniq)
+    elif m == 3:
+        keep = _mask_3d(uniq)
+    else:
+        keep = _mask_blocked(uniq, block)
+    mask[comparable] = keep[inverse]
+    return mask
+
+
+def pareto_indices(points, block=DEFAULT_BLOCK):
+    """Domine edilmeyen satırların indisleri (artan sırada)."""
+    return np.flatnonzero(non_dominated_mask(points, block))
+
+
+def pareto_ranks(points, block=DEFAULT_BLOCK):
+    """
+    Her satırın cephe numarası (0 = Pareto cephesi): domine edilmeyenler sırayla soyulur.
+    NaN içeren satırlar en son cepheye konur.
+    """
+    points = np.asarray(points, dtype=float)
+    rank = np.full(len(points), -1, dtype=np.intp)
+    remaining = np.flatnonzero(~np.isnan(points).any(axis=1))
+    front = 0
+    while remaining.size:
+        current = non_dominated_mask(points[remaining], block)
+        rank[remaining[current]] = front
+        remaining = remaining[~current]
+        front += 1
+    rank[rank < 0] = front
+    return rank
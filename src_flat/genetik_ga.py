@@ -1,249 +1,920 @@
-import random
-import networkx as nx
-
-from metrics import compute_metrics, total_cost
-from graph_utils import assign_random_edge_attributes
-
-
-# H grafı fallback için sadece + klasik yol
-def random_path(G, s, d, talep, max_attempts=200):
-
-    # Belirli sayıda deneme yapılır
-    for _ in range(max_attempts):
-        current = s
-        path = [s]
-        visited = {s}
-
-        # Maksimum düğüm sayısı kadar ilerlemeye izin verilir
-        for _ in range(len(G)):
-            if current == d:
-                return path
-
-            # Mevcut düğümün komşuları alınır
-            neighbors = list(G.neighbors(current))
-            random.shuffle(neighbors)
-
-            moved = False
-            for nb in neighbors:
-                # Daha önce ziyaret edilen düğümlere geri dönülmemesi için hedef haric
-                if nb in visited and nb != d:
-                    continue
-
-                # Kenar bilgileri alınır
-                data = G.get_edge_data(current, nb, {})
-                bw = data.get("bandwidth", None)
-
-                # Bant genişliği talebi karşılanıyorsa ilerlenir
-                if bw is not None and bw >= talep:
-                    path.append(nb)
-                    visited.add(nb)
-                    current = nb
-                    moved = True
-                    break
-
-            # Hiçbir komşuya gidilemediyse bu deneme başarısız
-            if not moved:
+import time
+import threading
+import numpy as np
+from collections import OrderedDict
+from itertools import islice
+
+from metrics import compute_metrics_batch, edge_cost_table, path_costs, weights_key
+from graph_utils import as_topology, bfs_path, make_rng, with_random_edge
+from dijkstra import k_shortest_paths
+from dominance import pareto_ranks
+
+
+# Dizi tabanlı popülasyon: yollar -1 ile doldurulmuş tamsayı matrisinde tutulur.
+# Operatörler tüm popülasyon üzerinde toplu (vektörel) çalışır; liste kopyalama,
+# list.index ve kenar başına has_edge çağrıları yerine indeks tabloları kullanılır.
+class PathPopulation:
+    """
+    nodes[i, :lengths[i]] i. bireyin düğümleridir, kalan hücreler -1'dir.
+    Düğüm sıraları seyrek tutulur: her satırın (düğüm, sıra) çiftleri yalnızca yolun gerçek uzunluğu
+    üzerinden (satır, düğüm) anahtarına göre sıralanır ve locate ile searchsorted üzerinden aranır.
+    Bellek topoloji boyutuyla değil, toplam yol uzunluğuyla büyür. Yollar basit (döngüsüz)
+    olduğundan her düğüm en fazla bir kez geçer.
+    """
+
+    def __init__(self, nodes, lengths, num_nodes):
+        self.nodes = nodes
+        self.lengths = lengths
+        self.num_nodes = num_nodes
+        self._index = None
+
+    @classmethod
+    def from_paths(cls, paths, num_nodes):
+        lengths = np.array([len(p) for p in paths], dtype=np.intp)
+        nodes = np.full((len(paths), max(int(lengths.max(initial=0)), 1)), -1, dtype=np.int32)
+        for i, p in enumerate(paths):
+            nodes[i, :len(p)] = p
+        return cls(nodes, lengths, num_nodes)
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def locate(self, rows, query):
+        """query[r, :] düğümlerinin rows[r]. yoldaki sıraları (yolda yoksa ya da dolguysa -1)."""
+        if self._index is None:
+            r, cols = np.nonzero(self.nodes >= 0)
+            keys = r.astype(np.int64) * self.num_nodes + self.nodes[r, cols]
+            order = np.argsort(keys, kind="stable")
+            self._index = (keys[order], cols[order].astype(np.int32))
+        keys, cols = self._index
+        query = np.asarray(query)
+        if keys.size == 0:
+            return np.full(query.shape, -1, dtype=np.int32)
+        q = np.asarray(rows, dtype=np.int64)[:, None] * self.num_nodes + np.maximum(query, 0)
+        at = np.minimum(np.searchsorted(keys, q), keys.size - 1)
+        return np.where((query >= 0) & (keys[at] == q), cols[at], -1)
+
+    def path(self, i):
+        return self.nodes[i, :self.lengths[i]].tolist()
+
+    def take(self, idx):
+        return PathPopulation(self.nodes[idx], self.lengths[idx], self.num_nodes)
+
+    @classmethod
+    def concat(cls, parts):
+        width = max(p.nodes.shape[1] for p in parts)
+        nodes = np.concatenate([_pad(p.nodes, width) for p in parts])
+        lengths = np.concatenate([p.lengths for p in parts])
+        return cls(nodes, lengths, parts[0].num_nodes)
+
+
+def _pad(nodes, width):
+    if nodes.shape[1] >= width:
+        return nodes
+    out = np.full((len(nodes), width), -1, dtype=nodes.dtype)
+    out[:, :nodes.shape[1]] = nodes
+    return out
+
+
+# Toplu turnuva seçimi: her satır için k farklı birey arasından fitness'ı en yüksek olan
+def tournament_batch(fitnesses, count, k=3, gen=None):
+    fitnesses = np.asarray(fitnesses)
+    size = len(fitnesses)
+    k = min(k, size)
+    # Satır başına tekrarsız k aday (rng.sample karşılığı): tekrar içeren satırlar yeniden çekilir
+    cand = gen.integers(0, size, (count, k))
+    while k > 1:
+        srt = np.sort(cand, axis=1)
+        dup = (srt[:, 1:] == srt[:, :-1]).any(axis=1)
+        if not dup.any():
+            break
+        cand[dup] = gen.integers(0, size, (int(dup.sum()), k))
+    return cand[np.arange(count), fitnesses[cand].argmax(axis=1)]
+
+
+# Yolların tüm kenarları mevcut mu ve uç düğümler doğru mu? (satır başına bool)
+def valid_paths(G, nodes, lengths, s, d):
+    topo = as_topology(G)
+    rows = np.arange(len(lengths))
+    u, v = nodes[:, :-1], nodes[:, 1:]
+    used = v >= 0
+    ids = topo.edge_ids(np.where(used, u, 0), np.where(used, v, 0))
+    ok = ((ids >= 0) | ~used).all(axis=1)
+    return ok & (nodes[:, 0] == s) & (nodes[rows, np.maximum(lengths - 1, 0)] == d)
+
+
+# Toplu birleştirme ve döngü temizliği: A[r, :i+1] + B[r, j+1:lb] (A[r, i] == B[r, j]).
+# pa[r, t], B[r, t] düğümünün A[r]'daki sırasıdır (yoksa -1; bkz. PathPopulation.locate).
+# B'nin kuyruğu A'nın önekindeki bir düğüme dönüyorsa A'daki en erken tekrar noktasından
+# B'deki karşılığına atlanır; iki basit yolun birleşimi böylece yine basit yol olur.
+def _splice(A, pa, i, B, j, lb):
+    m, W = B.shape
+    rows = np.arange(m)
+    cols = np.arange(W)
+    in_suffix = (cols >= j[:, None]) & (cols < lb[:, None])
+    hit = in_suffix & (pa >= 0) & (pa <= i[:, None])
+    pa_hit = np.where(hit, pa, A.shape[1] + W)
+    b = pa_hit.argmin(axis=1)
+    a = pa_hit[rows, b]
+
+    new_len = a + lb - b
+    t = np.arange(max(int(new_len.max(initial=1)), 1))[None, :]
+    from_a = _row_gather(A, np.minimum(t, A.shape[1] - 1))
+    from_b = _row_gather(B, np.minimum(np.maximum(t - a[:, None] + b[:, None], 0), W - 1))
+    child = np.where(t <= a[:, None], from_a, from_b)
+    child[t >= new_len[:, None]] = -1
+    return child, new_len
+
+
+# M[r, idx[r, :]] satır bazlı toplama (düz indeksle; iki boyutlu fancy indexing'den hızlı)
+def _row_gather(M, idx):
+    M = np.ascontiguousarray(M)
+    offsets = (np.arange(len(M)) * M.shape[1])[:, None]
+    return M.ravel()[idx + offsets]
+
+
+# Toplu çaprazlama: her (p1[r], p2[r]) çifti rastgele bir ortak ara düğümde birleştirilir
+def crossover_batch(G, pop, p1, p2, s, d, gen=None):
+    m = len(p1)
+    rows = np.arange(m)
+    la, lb = pop.lengths[p1], pop.lengths[p2]
+    A = pop.nodes[p1]
+    cols = np.arange(A.shape[1])
+    inB = pop.locate(p2, A)
+
+    # Başlangıç ve bitiş hariç ortak düğümler (A'daki sırayla); her satırda rastgele biri seçilir
+    common = ((cols >= 1) & (cols < (la - 1)[:, None])
+              & (inB >= 1) & (inB < (lb - 1)[:, None]))
+    c = np.where(common, gen.random(common.shape), -1.0).argmax(axis=1)
+    sel = np.flatnonzero(common[rows, c])
+
+    # Ortak düğüm yoksa parent1; geçersiz çocukta %30 kısa parent, aksi halde rastgele parent
+    shorter = np.where(la <= lb, p1, p2)
+    either = np.where(gen.random(m) < 0.5, p1, p2)
+    fallback = np.where(gen.random(m) < 0.3, shorter, either)
+    result = p1.copy()
+    result[sel] = fallback[sel]
+    nodes = pop.nodes[result]
+    lengths = pop.lengths[result]
+    if sel.size == 0:
+        return PathPopulation(nodes, lengths, pop.num_nodes)
+
+    a, b = p1[sel], p2[sel]
+    B = pop.nodes[b]
+    child, new_len = _splice(A[sel], pop.locate(a, B), c[sel], B, inB[sel, c[sel]], lb[sel])
+    ok = valid_paths(G, child, new_len, s, d)
+    sel, child, new_len = sel[ok], child[ok], new_len[ok]
+
+    width = max(child.shape[1], nodes.shape[1])
+    nodes = _pad(nodes, width)
+    nodes[sel] = _pad(child, width)
+    lengths[sel] = new_len
+    return PathPopulation(nodes, lengths, pop.num_nodes)
+
+
+# Toplu rastgele yürüyüş: her start'tan d'ye, ziyaret edilmemiş uygun komşular arasından eşit
+# olasılıkla. Satır i'nin yolu walk[i, :length[i]]'dir (start dahil).
+# Tıkanan yürüyüş baştan denenir; max_attempts denemede ulaşamayan satırlarda ok=False döner.
+def _random_walks(nbr_table, counts, start, d, gen, max_attempts=200, tries=4):
+    k = len(start)
+    n = len(nbr_table)
+    rows_all = np.arange(k)
+    visited = np.zeros((k, n), dtype=bool)
+    visited[rows_all, start] = True
+    walk = np.full((k, n), -1, dtype=np.int32)
+    walk[:, 0] = start
+    length = np.ones(k, dtype=np.intp)
+    cur = start.copy()
+    attempts = np.ones(k, dtype=np.intp)
+    ok = start == d
+    active = rows_all[~ok]
+
+    while active.size:
+        c = cur[active]
+
+        # Reddetme örneklemesi: tüm uygun komşular arasından eşit olasılıkla seçilip ziyaret
+        # edilmişse yeniden çekilir. Kabul edilen seçim, aday kümesi üzerinde yine eşit dağılımlıdır.
+        # (Uygun kenarı olmayan düğümde 0. sütun -1 dolgusudur ve seçim reddedilir.)
+        picked = nbr_table[c, (gen.random(active.size) * counts[c]).astype(np.intp)]
+        accept = (picked >= 0) & ((picked == d) | ~visited[active, picked])
+        todo = np.flatnonzero(~accept)
+        for _ in range(tries - 1):
+            if todo.size == 0:
                 break
-
-        # Döngü sonunda hedefe ulaşıldıysa yol döndürülür
-        if current == d:
-            return path
-
-    # Rastgele yol bulunamazsa:
-    # Talep kısıtını sağlayan kenarlardan oluşan alt graf (H) oluşturulur
-    H = G.__class__()
-    H.add_nodes_from(G.nodes(data=True))
-    print("H yapısı çalışcak")
-
-    for u, v, data in G.edges(data=True):
-        bw = data.get("bandwidth", None)
-        # Yalnızca talebi karşılayan kenarları ekliyoruz
-        if bw is not None and bw >= talep:
-            H.add_edge(u, v, **data)
-
-    # Kaynak veya hedef grafikte yoksa yol yoktur
-    if s not in H or d not in H:
-        return None
-
-    try:
-        # Kısıtı sağlayan en kısa yol bulunur
-        print("Kısa yol çalıştı")
-        return nx.shortest_path(H, s, d)
-    except nx.NetworkXNoPath:
-        return None
-
-
-# Popülasyondaki her yol için maliyet ve fitness hesabını yapıyoruz
-def evaluate_population(G, population, weights):
-    costs = []
-    fitnesses = []
-
-    for path in population:
-        metrics = compute_metrics(G, path)
-
-        # Geçersiz yol durumu
-        if metrics is None:
-            c = float("inf")
-            f = 0.0
-        else:
-            # Ağırlıklı toplam maliyet
-            c = total_cost(metrics, weights)
-            f = 1.0 / (1.0 + c)
-
-        costs.append(c)
-        fitnesses.append(f)
-
-    return costs, fitnesses
-
-
-# Turnuva seçimi: rastgele k birey arasından en iyisi seçilir
-def tournament_selection(population, fitnesses, k=3):
-
-    indices = random.sample(range(len(population)), k)
-    best_idx = max(indices, key=lambda i: fitnesses[i])
-    return population[best_idx]
-
-
-# Çaprazlama (crossover) işlemi
-def crossover(G, parent1, parent2, s, d):
-
-    # Başlangıç ve bitiş hariç ortak düğümler bulunur
-    common_nodes = list(set(parent1[1:-1]) & set(parent2[1:-1]))
-
-    # Ortak düğüm yoksa parent1 aynen döndürülür
-    if not common_nodes:
-        return parent1[:]
-
-    # Rastgele bir ortak düğüm seçilir
-    c = random.choice(common_nodes)
-    i = parent1.index(c)
-    j = parent2.index(c)
-
-    # İki parent birleştirilir
-    child = parent1[: i + 1] + parent2[j + 1 :]
-
-    # Döngüleri (tekrarlı düğümleri) temizle
-    seen = set()
-    new_path = []
-    for node in child:
-        if node in seen:
-            continue
-        new_path.append(node)
-        seen.add(node)
-
-    strategy = random.random()
-
-    # Geçersiz yol durumu (başlangıç / bitiş yanlış)
-    if not new_path or new_path[0] != s or new_path[-1] != d:
-        if strategy < 0.3:
-            # Daha kısa olan parent tercih edilir
-            if (len(parent1) <= len(parent2)):
-                return parent1[:]
+            ct = c[todo]
+            nb = nbr_table[ct, (gen.random(todo.size) * counts[ct]).astype(np.intp)]
+            ok_nb = (nb >= 0) & ((nb == d) | ~visited[active[todo], nb])
+            picked[todo[ok_nb]] = nb[ok_nb]
+            todo = todo[~ok_nb]
+
+        # Kalan satırlarda aday maskesi üzerinden tam seçim (aday yoksa yürüyüş tıkanmıştır)
+        if todo.size:
+            nb = nbr_table[c[todo]]
+            cand = (nb >= 0) & (~visited[active[todo][:, None], np.maximum(nb, 0)] | (nb == d))
+            score = np.where(cand, gen.random(cand.shape), -1.0)
+            col = score.argmax(axis=1)
+            r = np.arange(todo.size)
+            picked[todo] = np.where(score[r, col] >= 0, nb[r, col], -1)
+
+        moving = picked >= 0
+        rows = active[moving]
+        picked = picked[moving]
+        walk[rows, length[rows]] = picked
+        length[rows] += 1
+        visited[rows, picked] = True
+        cur[rows] = picked
+        ok[rows[picked == d]] = True
+
+        # Tıkanan yürüyüşler sıfırlanıp yeniden denenir
+        failed = active[~moving]
+        attempts[failed] += 1
+        retry = failed[attempts[failed] <= max_attempts]
+        visited[retry] = False
+        visited[retry, start[retry]] = True
+        length[retry] = 1
+        cur[retry] = start[retry]
+
+        active = np.concatenate([rows[picked != d], retry])
+
+    return walk, length, ok
+
+
+class WalkPool:
+    """
+    d'ye giden rastgele yürüyüşlerin başlangıç düğümüne göre stoku.
+    Yürüyüşler çok sayıda satır için birlikte (lockstep) üretilir ve her biri bir kez kullanılır;
+    böylece nesil başına birkaç yüz kısa toplu adım yerine az sayıda büyük toplu üretim yapılır.
+    Yürüyüşü sürekli başarısız olan düğümler için talep kısıtlı BFS yolu kullanılır.
+    """
+
+    def __init__(self, G, d, talep, gen, batch=8, lookahead=32):
+        self.topo = as_topology(G)
+        self.d = d
+        self.talep = talep
+        self.gen = gen
+        self.batch = batch
+        self.lookahead = lookahead
+        table, self.counts = self.topo.feasible_table(talep)
+        self.nbr_table = np.where(table >= 0, self.topo.neighbors[np.maximum(table, 0)], -1).astype(np.int32)
+        self._stock = {}
+        self._fallback = {}
+
+    def _refill(self, starts):
+        need = np.bincount(starts, minlength=len(self.nbr_table))
+        have = np.array([len(self._stock.get(u, ())) for u in range(len(need))])
+        if (need <= have).all():
+            return
+        # Üretim maliyeti en uzun yürüyüşe bağlı olduğundan, eksik çıkınca tüm düğümler
+        # birlikte doldurulur: her düğüme batch, istenenlere lookahead katı kadar yürüyüş
+        want = self.lookahead * need + self.batch
+        short = np.flatnonzero(want > have)
+        reps = want[short] - have[short]
+        start = np.repeat(short, reps)
+        walk, length, ok = _random_walks(self.nbr_table, self.counts, start, self.d, self.gen)
+        for u, w, ln, good in zip(start.tolist(), walk, length.tolist(), ok.tolist()):
+            if good:
+                self._stock.setdefault(u, []).append(w[:ln])
+            elif u not in self._fallback:
+                self._fallback[u] = bfs_path(self.topo, u, self.d, self.talep)
+
+    def take(self, starts):
+        """Her başlangıç için bir yürüyüş: (-1 dolgulu matris, uzunluklar, bulundu mu)."""
+        self._refill(starts)
+        out = []
+        for u in starts.tolist():
+            stock = self._stock.get(u)
+            if stock:
+                out.append(stock.pop())
             else:
-                return parent2[:]
-
+                path = self._fallback.get(u)
+                out.append(np.asarray(path if path is not None else [], dtype=np.int64))
+        lengths = np.array([len(w) for w in out], dtype=np.intp)
+        nodes = np.full((len(out), max(int(lengths.max(initial=0)), 1)), -1, dtype=np.int32)
+        for r, w in enumerate(out):
+            nodes[r, :len(w)] = w
+        return nodes, lengths, lengths > 0
+
+
+def distances_to(G, d, talep, edge_cost=None):
+    """
+    Talebi karşılayan kenarlar üzerinden her düğümden d'ye en kısa uzaklık (ulaşılamayan: inf).
+    edge_cost verilmezse atlama sayısı, verilirse kenar başına maliyet dizisi (ör. edge_cost_table)
+    kullanılır. Ters yönde vektörel Bellman-Ford: her turda tüm uygun kenarlar birlikte gevşetilir.
+    """
+    topo = as_topology(G)
+    feasible = topo.capacity >= talep
+    tails = topo.heads[feasible]
+    heads = topo.neighbors[feasible]
+    cost = np.ones(len(tails)) if edge_cost is None else np.asarray(edge_cost, dtype=float)[feasible]
+
+    dist = np.full(topo.num_nodes, np.inf)
+    dist[d] = 0.0
+    for _ in range(topo.num_nodes):
+        new = dist.copy()
+        np.minimum.at(new, tails, cost + dist[heads])
+        if np.array_equal(new, dist):
+            break
+        dist = new
+    return dist
+
+
+class GuidedWalkPool:
+    """
+    d'ye olan uzaklık tablosuyla yönlendirilen yürüyüşler (WalkPool ile aynı take arayüzü).
+    Uzaklıklar çalıştırma başına bir kez hesaplanır: weights verilmezse atlama sayısı, verilirse
+    ağırlıklı kenar maliyeti. u -> v adımının ağırlığı exp(-r / temperature) olup
+    r = c(u, v) + dist[v] - dist[u] en kısa yoldan sapmadır (en kısa yol kenarlarında 0).
+    Hedefe yaklaştırmayan (atlama sayısını azaltmayan) en fazla slack adım atılabilir; sonra yalnızca
+    yaklaştıran komşular seçilir ve yürüyüş hedefe en çok atlama[u] + 2·slack adımda ulaşır.
+    Ziyaret edilmiş düğüme dönülürse aradaki döngü silinir. Yeniden deneme ve BFS yedeği gerekmez;
+    d'ye ulaşamayan başlangıçlar için bulundu=False döner.
+    """
+
+    def __init__(self, G, d, talep, gen, weights=None, slack=4, temperature=1.0):
+        self.topo = as_topology(G)
+        self.d = d
+        self.gen = gen
+        self.slack = slack
+        table, self.counts = self.topo.feasible_table(talep)
+        n = len(table)
+
+        # Satırlar komşu numarasına göre sıralanır (dolgu sonda): (satır, komşu) anahtarları böylece
+        # düz dizide artan olur ve yürüyüş önekleri searchsorted ile aranabilir (bkz. _visited)
+        nbr = np.where(table >= 0, self.topo.neighbors[np.maximum(table, 0)], n)
+        order = np.argsort(nbr, axis=1, kind="stable")
+        table = np.take_along_axis(table, order, axis=1)
+        nbr = np.take_along_axis(nbr, order, axis=1)
+        self._keys = (np.arange(n, dtype=np.int64)[:, None] * (n + 1) + nbr).ravel()
+        valid = table >= 0
+        eid = np.maximum(table, 0)
+        self.nbr_table = np.where(valid, nbr, -1).astype(np.int32)
+
+        self.hops = distances_to(self.topo, d, talep)
+        if weights is None:
+            dist, cost, scale = self.hops, np.ones(len(self.topo.neighbors)), 1.0
         else:
-            # Rastgele parent döndürülür
-            return random.choice([parent1[:], parent2[:]])
-
-    # Kenar bütünlüğü kontrolü
-    for k in range(len(new_path) - 1):
-        if not G.has_edge(new_path[k], new_path[k + 1]):
-            if strategy < 0.3:
-                if (len(parent1) <= len(parent2)):
-                    return parent1[:]
+            cost = edge_cost_table(self.topo, weights)
+            dist = distances_to(self.topo, d, talep, cost)
+            used = cost[table[valid]]
+            scale = float(np.median(used)) if used.size else 1.0
+        nbr = np.maximum(self.nbr_table, 0)
+        rows = np.arange(len(table))[:, None]
+        with np.errstate(invalid="ignore"):
+            reduced = cost[eid] + dist[nbr] - dist[rows]
+
+        # Geçersiz ya da d'ye ulaşamayan komşular hiç seçilmez
+        usable = valid & np.isfinite(dist[nbr]) & np.isfinite(dist[rows])
+        self.log_weight = np.where(usable, -reduced / (temperature * max(scale, 1e-12)), -np.inf)
+        self.closer = usable & (self.hops[nbr] < self.hops[rows])
+
+    def _visited(self, c, walk, length):
+        """
+        c[r] düğümünün komşularından walk[r, :length[r]] önekinde olanlar: (önekteki sıra ya da -1,
+        ziyaret edildi mi), ikisi de (satır, komşu sütunu) biçiminde. Önekteki her düğüm c[r]'nin
+        sıralı komşu satırında aranır; maliyet önek uzunluğuyla sınırlıdır.
+        """
+        n, width = self.nbr_table.shape
+        L = int(length.max())
+        q = c[:, None].astype(np.int64) * (n + 1) + walk[:, :L]
+        idx = np.minimum(np.searchsorted(self._keys, q), self._keys.size - 1)
+        rows, t = np.nonzero((np.arange(L) < length[:, None]) & (self._keys[idx] == q))
+        at = np.full((len(c), width), -1, dtype=np.intp)
+        at[rows, idx[rows, t] - c[rows] * width] = t
+        return at, at >= 0
+
+    def take(self, starts):
+        """Her başlangıç için bir yürüyüş: (-1 dolgulu matris, uzunluklar, bulundu mu)."""
+        starts = np.asarray(starts, dtype=np.intp)
+        k = len(starts)
+        d = self.d
+        rows_all = np.arange(k)
+        found = np.isfinite(self.hops[starts])
+
+        # Tamponlar topoloji boyutuyla değil atlama sınırıyla (atlama[u] + 2·slack) boyutlanır;
+        # ziyaret denetimi yürüyüşün canlı öneki üzerinden yapılır (bkz. _visited)
+        bound = self.hops[starts[found]] + 2 * self.slack + 1
+        walk = np.full((k, int(bound.max(initial=1))), -1, dtype=np.int32)
+        walk[:, 0] = starts
+        length = np.ones(k, dtype=np.intp)
+        cur = starts.copy()
+        detours = np.zeros(k, dtype=np.intp)
+
+        active = rows_all[found & (starts != d)]
+        while active.size:
+            c = cur[active]
+            nb = self.nbr_table[c]
+            r = np.arange(active.size)
+            at, seen = self._visited(c, walk[active], length[active])
+
+            # Sapma hakkı olan satırlarda ziyaret edilmemiş tüm komşular, diğerlerinde yalnızca
+            # hedefe yaklaştıran komşular (ziyaret edilmemişler öncelikli) adaydır
+            log_w = self.log_weight[c]
+            free = np.isfinite(log_w) & ~seen
+            use_free = (detours[active] < self.slack) & free.any(axis=1)
+            descend = np.where(self.closer[c], log_w - np.where(seen, 1e9, 0.0), -np.inf)
+            score = np.where(use_free[:, None], np.where(free, log_w, -np.inf), descend)
+            score = score + self.gen.gumbel(size=score.shape)
+            col = score.argmax(axis=1)
+            v = nb[r, col]
+
+            detours[active] += self.hops[v] >= self.hops[c]
+            back = seen[r, col]
+
+            # Döngü silme: ziyaret edilmiş düğüme dönülürse yürüyüş o noktaya kısaltılır
+            b = active[back]
+            length[b] = at[r, col][back] + 1
+            a = active[~back]
+            if a.size and int(length[a].max()) >= walk.shape[1]:
+                walk = _pad(walk, 2 * walk.shape[1])
+            walk[a, length[a]] = v[~back]
+            length[a] += 1
+            cur[active] = v
+            active = active[v != d]
+
+        width = max(int(length[found].max(initial=0)), 1)
+        nodes = np.where(found[:, None], walk[:, :width], -1)
+        return nodes, np.where(found, length, 0), found
+
+
+# Mutasyon onarım kipleri: "random" eşit olasılıklı yürüyüş stoku (BFS yedekli),
+# "hop" / "cost" d'ye atlama sayısı / ağırlıklı maliyet uzaklığıyla yönlendirilen yürüyüşler
+REPAIR_MODES = ("random", "hop", "cost")
+
+
+def make_walk_pool(G, d, talep, weights, gen, repair="hop"):
+    if repair == "random":
+        return WalkPool(G, d, talep, gen)
+    if repair == "hop":
+        return GuidedWalkPool(G, d, talep, gen)
+    if repair == "cost":
+        return GuidedWalkPool(G, d, talep, gen, weights=weights)
+    raise ValueError(f"Bilinmeyen onarım kipi: {repair!r}")
+
+
+# Toplu mutasyon: seçilen bireylerde rastgele bir kesme noktasından sonrası yeniden üretilir.
+# Yeni kuyruk havuzdan alınan yürüyüştür; önekle oluşan döngüler _splice ile temizlenir.
+def mutate_batch(pop, pool, mutation_rate=0.3, gen=None):
+    m = len(pop)
+    lengths = pop.lengths
+    rows = np.flatnonzero((gen.random(m) < mutation_rate) & (lengths > 2))
+    if rows.size == 0:
+        return pop
+
+    cut = (gen.random(rows.size) * (lengths[rows] - 1)).astype(np.intp)
+    walk, wlen, ok = pool.take(pop.nodes[rows, cut])
+    rows, cut, walk, wlen = rows[ok], cut[ok], walk[ok], wlen[ok]
+    if rows.size == 0:
+        return pop
+
+    child, new_len = _splice(pop.nodes[rows], pop.locate(rows, walk), cut,
+                             walk, np.zeros(len(rows), dtype=np.intp), wlen)
+    width = max(pop.nodes.shape[1], child.shape[1])
+    nodes = _pad(pop.nodes, width).copy()
+    nodes[rows] = _pad(child, width)
+    new_lengths = lengths.copy()
+    new_lengths[rows] = new_len
+    return PathPopulation(nodes, new_lengths, pop.num_nodes)
+
+
+class FitnessCache:
+    """
+    Yol -> maliyet önbelleği (sınırlı, LRU).
+
+    Anahtar: (topoloji sürümü, ağırlıklar, yolun düğüm dizisinin baytları). Elit birey ve
+    çaprazlama/mutasyondan değişmeden dönen çocuklar her nesilde yeniden puanlanmaz.
+    Varsayılan olarak her çalıştırma kendi önbelleğini kurar; aynı nesne run_genetic_algorithm'e
+    tekrar verilirse aynı ağırlıklı çalıştırmalar arasında paylaşılır (iş parçacığı güvenli).
+    """
+
+    def __init__(self, max_entries=200000):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def evaluate(self, G, pop, weights):
+        """
+        Popülasyonun maliyetlerini döndürür; yalnızca önbellekte olmayan farklı yollar hesaplanır.
+        :return: (costs, sayaçlar) -> {"hits", "unique", "evaluated", "saved"}
+        """
+        topo = as_topology(G)
+        scope = (topo.version, weights_key(weights))
+        keys = [(scope, row[:n].tobytes()) for row, n in zip(pop.nodes, pop.lengths.tolist())]
+
+        costs = np.empty(len(keys))
+        first = {}
+        missing = []
+        hits = 0
+        with self._lock:
+            for i, key in enumerate(keys):
+                cost = self._entries.get(key)
+                if cost is not None:
+                    self._entries.move_to_end(key)
+                    costs[i] = cost
+                    hits += 1
+                elif key in first:
+                    continue
                 else:
-                    return parent2[:]
-            else:
-                return random.choice([parent1[:], parent2[:]])
-
-    return new_path
-
-
-# Mutasyon: yolun bir noktasından sonrası yeniden üretilir
-def mutate(G, path, s, d, talep , mutation_rate=0.3):
-
-    # Mutasyon gerçekleşmezse veya yol çok kısaysa
-    if random.random() > mutation_rate or len(path) <= 2:
-        return path[:]
-
-    # Rastgele bir kesme noktası
-    cut = random.randint(0, len(path) - 2)
-    prefix = path[: cut + 1]
-    node = prefix[-1]
-
-    # Kalan yol rastgele yeniden oluşturulur
-    suffix = random_path(G, node, d , talep)
-
-    # Geçerli yol yoksa eski yol korunur
-    if suffix is None or len(suffix) < 2:
-        return path[:]
-
-    return prefix + suffix[1:]
-
-
-# Genetik algoritmanın ana fonksiyonu
+                    first[key] = i
+                    missing.append(i)
+
+        if missing:
+            rows = np.array(missing)
+            costs[rows] = path_costs(topo, pop.nodes[rows], weights)
+            # Aynı nesilde tekrar eden yeni yollar ilk örneğin maliyetini alır
+            for i, key in enumerate(keys):
+                j = first.get(key)
+                if j is not None and j != i:
+                    costs[i] = costs[j]
+
+        with self._lock:
+            self.hits += hits
+            self.misses += len(missing)
+            for i in missing:
+                self._entries[keys[i]] = float(costs[i])
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        counters = {
+            "hits": hits,
+            "unique": len(set(keys)),
+            "evaluated": len(missing),
+            "saved": len(keys) - len(missing),
+        }
+        return costs, counters
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+# Kaynak ve hedef arasında yol yoksa fallback kenar yalnızca bu sorguya özel katmana eklenir
+def prepare_topology(G, s, d, rng):
+    G = as_topology(G)
+    if bfs_path(G, s, d, -np.inf) is None and not G.has_edge(s, d):
+        G = with_random_edge(G, s, d, rng)
+    return G
+
+
+# Başlangıç popülasyonu: bir kısmı k-en kısa döngüsüz yollardan (Yen), kalanı yürüyüş havuzundan
+# Yen tohumları birbirinden farklı ve kalitelidir. Varsayılan olarak popülasyonun beşte biri.
+def seed_paths(G, s, d, talep, weights, pop_size, seed_count=None):
+    if seed_count is None:
+        seed_count = max(1, pop_size // 5)
+    seed_count = min(seed_count, pop_size)
+    return [p for p, _ in islice(k_shortest_paths(G, s, d, talep, weights), seed_count)]
+
+
+# seeds verilirse (ör. ada modelinde ana süreçte bir kez hesaplanmış) Yen araması tekrarlanmaz
+def initial_population(G, s, d, talep, weights, pop_size, pool, seed_count=None, seeds=None):
+    if seeds is None:
+        seeds = seed_paths(G, s, d, talep, weights, pop_size, seed_count)
+    population = [list(p) for p in seeds[:pop_size]]
+
+    # Kalan bireyler çeşitlilik için rastgele yürüyüşlerle (toplu) oluşturuluyor
+    missing = pop_size - len(population)
+    if missing > 0:
+        walks, lengths, found = pool.take(np.full(missing, s))
+        population += [w[:n].tolist() for w, n, f in zip(walks, lengths, found) if f]
+    return population
+
+
+# Bir nesil: puanlama, en iyinin güncellenmesi, elitizm, turnuva, çaprazlama ve çift mutasyon.
+# (pop, best_path, best_cost, nesil sayaçları, puanlar) döndürür; puanlar eski popülasyona aittir.
+def next_generation(G, pop, pool, s, d, weights, best_path, best_cost, fitness_cache, gen,
+                    pop_size, mutation_rate=0.3, crossover_rate=0.7):
+    costs, counters = fitness_cache.evaluate(G, pop, weights)
+    fitnesses = np.where(np.isfinite(costs), 1.0 / (1.0 + costs), 0.0)
+
+    # En iyi çözüm güncellenir
+    i = int(costs.argmin())
+    if costs[i] < best_cost:
+        best_cost = float(costs[i])
+        best_path = pop.path(i)
+
+    # Elitizm: en iyi birey doğrudan korunur, kalanlar turnuva ile seçilen ebeveynlerden üretilir
+    m = pop_size - 1
+    parent1 = tournament_batch(fitnesses, m, k=3, gen=gen)
+    parent2 = tournament_batch(fitnesses, m, k=3, gen=gen)
+
+    # Çaprazlama (olasılığı tutmayan satırlarda parent1 kopyalanır)
+    cross = gen.random(m) < crossover_rate
+    children = pop.take(parent1)
+    if cross.any():
+        crossed = crossover_batch(G, pop, parent1[cross], parent2[cross], s, d, gen=gen)
+        width = max(children.nodes.shape[1], crossed.nodes.shape[1])
+        nodes = _pad(children.nodes, width)
+        nodes[cross] = _pad(crossed.nodes, width)
+        children.lengths[cross] = crossed.lengths
+        children = PathPopulation(nodes, children.lengths, pop.num_nodes)
+
+    # Çift mutasyon uygulanır - çeşitliliği artırmak için
+    children = mutate_batch(children, pool, mutation_rate=mutation_rate, gen=gen)
+    children = mutate_batch(children, pool, mutation_rate=mutation_rate, gen=gen)
+
+    elite = PathPopulation.from_paths([best_path], pop.num_nodes)
+    return PathPopulation.concat([elite, children]), best_path, best_cost, counters, costs
+
+
+# Erken durdurma ölçütleri (None olanlar kullanılmaz):
+#   generations       : nesil sayısını geçersiz kılar
+#   stall_generations : en iyi maliyet bu kadar nesil iyileşmezse durulur
+#   target_cost       : en iyi maliyet bu değere inerse durulur
+#   time_budget       : saniye cinsinden duvar saati bütçesi
+#   eval_budget       : gerçekten hesaplanan (önbellekte olmayan) yol sayısı bütçesi
+DEFAULT_STOPPING = {
+    "generations": None,
+    "stall_generations": None,
+    "target_cost": None,
+    "time_budget": None,
+    "eval_budget": None,
+}
+
+
+# Genetik algoritmanın ana fonksiyonu.
+# stopping ile erken durdurma ölçütleri verilir (bkz. DEFAULT_STOPPING); progress verilirse her
+# nesilden sonra o neslin kaydıyla çağrılır (ör. arayüzde canlı yakınsama gösterimi).
+# return_info=True ise (path, cost, info) döner; info["stop_reason"] duruş nedenini verir.
+# s ile d bağlı değilse yol sorguya özel sentetik kenarı kullanabilir: info["synthetic_edge"]
+# bu kenarı (yoksa None), info["topology"] yolun metriklerinin hesaplanacağı katmanı verir.
 def run_genetic_algorithm(
     G, s, d, talep , weights,
     pop_size=50, generations=100,
-    mutation_rate=0.3, crossover_rate=0.7
+    mutation_rate=0.3, crossover_rate=0.7,
+    seed_count=None, rng=None, fitness_cache=None, return_info=False, repair="hop",
+    stopping=None, progress=None
 ):
 
-    print(pop_size , generations)
-
-    # Kaynak ve hedef arasında yol yoksa fallback kenar ekliyoruz
-    if not nx.has_path(G, s, d):
-        if not G.has_edge(s, d):
-            G.add_edge(s, d)
-            assign_random_edge_attributes(G, s, d)
-
-    # Başlangıç popülasyonu oluşturuluruyoruz
-    population = []
-    for _ in range(pop_size * 5):
-        p = random_path(G, s, d , talep)
-        if p is not None:
-            population.append(p)
-        if len(population) >= pop_size:
-            break
-
-    # Hiç yol bulunamazsa
-    if not population:
-        return None, float("inf")
+    start = time.perf_counter()
+    stop = dict(DEFAULT_STOPPING, **(stopping or {}))
+    if stop["generations"] is not None:
+        generations = stop["generations"]
+
+    # Topoloji salt okunur kullanılır; tüm rastgelelik çağrıya özel RNG'den gelir.
+    # Böylece aynı graf üzerinde eşzamanlı sorgular kilitsiz çalışabilir.
+    rng = make_rng(rng)
+    base = as_topology(G)
+    G = prepare_topology(base, s, d, rng)
+
+    # Operatörler çağrıya özel NumPy üretecini ve d'ye giden yürüyüş havuzunu kullanır
+    # (varsayılan: uzaklık tablosuyla yönlendirilen onarım, bkz. REPAIR_MODES)
+    gen = np.random.default_rng(rng.getrandbits(64))
+    pool = make_walk_pool(G, d, talep, weights, gen, repair)
+    population = initial_population(G, s, d, talep, weights, pop_size, pool, seed_count)
+
+    # Değişmeden kalan bireyler önbellekten puanlanır. info["generations"] nesil başına
+    # önbellek sayaçlarını ve yakınsama geçmişini (best, mean, diversity, elapsed) tutar.
+    if fitness_cache is None:
+        fitness_cache = FitnessCache()
+    info = {
+        "generations": [],
+        "stop_reason": "generations",
+        "generations_used": 0,
+        "best_generation": None,
+        "evaluations": 0,
+        "elapsed": 0.0,
+        "topology": G,
+        "synthetic_edge": (s, d) if G is not base else None,
+    }
+
+    # Hiç yol bulunamazsa (s == d için de diğer çözücüler gibi yol yoktur; tek düğümlü yol puanlanamaz)
+    if not population or s == d:
+        info["stop_reason"] = "no_path"
+        info["elapsed"] = time.perf_counter() - start
+        return (None, float("inf"), info) if return_info else (None, float("inf"))
+
+    # Popülasyon dizi tabanlı motora aktarılır
+    pop = PathPopulation.from_paths(population, len(G))
 
     best_path = None
     best_cost = float("inf")
+    last_improvement = -1
 
     # Nesiller boyunca evrim
-    for gen in range(generations):
-        costs, fitnesses = evaluate_population(G, population, weights)
+    for g in range(generations):
+        prev_cost = best_cost
+        pop, best_path, best_cost, counters, costs = next_generation(
+            G, pop, pool, s, d, weights, best_path, best_cost, fitness_cache, gen,
+            pop_size, mutation_rate, crossover_rate,
+        )
+        finite = costs[np.isfinite(costs)]
+        elapsed = time.perf_counter() - start
+        record = dict(
+            counters,
+            generation=g,
+            best=best_cost,
+            mean=float(finite.mean()) if finite.size else float("inf"),
+            diversity=counters["unique"] / len(costs),
+            elapsed=elapsed,
+        )
+        info["generations"].append(record)
+        info["generations_used"] = g + 1
+        info["evaluations"] += counters["evaluated"]
+        if best_cost < prev_cost:
+            info["best_generation"] = last_improvement = g
+        if progress is not None:
+            progress(record)
+
+        if stop["target_cost"] is not None and best_cost <= stop["target_cost"]:
+            info["stop_reason"] = "target_cost"
+            break
+        if (stop["stall_generations"] is not None
+                and g - last_improvement >= stop["stall_generations"]):
+            info["stop_reason"] = "stall"
+            break
+        if stop["time_budget"] is not None and elapsed >= stop["time_budget"]:
+            info["stop_reason"] = "time_budget"
+            break
+        if stop["eval_budget"] is not None and info["evaluations"] >= stop["eval_budget"]:
+            info["stop_reason"] = "eval_budget"
+            break
 
-        # En iyi çözüm güncellenir
-        for pth, c in zip(population, costs):
-            if c < best_cost:
-                best_cost = c
-                best_path = pth[:]
+    info["elapsed"] = time.perf_counter() - start
+    return (best_path, best_cost, info) if return_info else (best_path, best_cost)
 
-        new_population = []
 
-        # Elitizm: en iyi birey doğrudan korunur
-        new_population.append(best_path[:])
+# ---------------------------------------------------------------------------
+# NSGA-II çok amaçlı kip: tek ağırlık vektörü yerine (gecikme, güvenilirlik maliyeti,
+# kaynak maliyeti) üzerinde domine edilmeyen yollar kümesi evrilir. Bir çalıştırma tüm
+# Pareto kümesini döndürür; farklı ağırlıklar için seçim pareto_routing.best_from_front ile
+# yeniden çalıştırmadan yapılır.
+# ---------------------------------------------------------------------------
 
-        while len(new_population) < pop_size:
-            parent1 = tournament_selection(population, fitnesses, k=3)
-            parent2 = tournament_selection(population, fitnesses, k=3)
+OBJECTIVES = ("total_delay", "reliability_cost", "resource_cost")
 
-            # Çaprazlama
-            if random.random() < crossover_rate:
-                child = crossover(G, parent1, parent2, s, d)
-            else:
-                child = parent1[:]
+# Başlangıç tohumları için amaç köşeleri ve dengeli ağırlık (her biri ayrı bir Yen taraması)
+_SEED_WEIGHTS = (
+    {"delay": 1.0, "reliability": 0.0, "resource": 0.0},
+    {"delay": 0.0, "reliability": 1.0, "resource": 0.0},
+    {"delay": 0.0, "reliability": 0.0, "resource": 1.0},
+    {"delay": 1 / 3, "reliability": 1 / 3, "resource": 1 / 3},
+)
 
-            # Çift mutasyon uygulanır - çeşitliliği artırmak için
-            child = mutate(G, child, s, d, talep ,mutation_rate=mutation_rate)
-            child = mutate(G, child, s, d, talep ,mutation_rate=mutation_rate)
 
-            new_population.append(child)
+def objective_matrix(G, pop):
+    """Popülasyonun (m, 3) amaç matrisi (OBJECTIVES sırasıyla); geçersiz yollar inf."""
+    batch = compute_metrics_batch(G, pop.nodes)
+    return np.column_stack([batch[k] for k in OBJECTIVES])
 
-        population = new_population
 
-    return best_path, best_cost
+def crowding_distance(F, rank):
+    """Her satırın kendi cephesindeki kalabalık mesafesi; cephe uçları inf."""
+    dist = np.zeros(len(F))
+    for r in np.unique(rank).tolist():
+        members = np.flatnonzero(rank == r)
+        if members.size <= 2:
+            dist[members] = np.inf
+            continue
+        for k in range(F.shape[1]):
+            values = F[members, k]
+            order = members[np.argsort(values, kind="stable")]
+            sorted_vals = F[order, k]
+            span = sorted_vals[-1] - sorted_vals[0]
+            dist[order[0]] = dist[order[-1]] = np.inf
+            if np.isfinite(span) and span > 0:
+                dist[order[1:-1]] += (sorted_vals[2:] - sorted_vals[:-2]) / span
+    return dist
+
+
+def _nsga_order(F):
+    # (cephe, -kalabalık mesafesi) sırası ve her satırın bu sıradaki konumu
+    rank = pareto_ranks(F)
+    crowd = crowding_distance(F, rank)
+    order = np.lexsort((-crowd, rank))
+    position = np.empty(len(F), dtype=np.intp)
+    position[order] = np.arange(len(F))
+    return rank, order, position
+
+
+def _unique_rows(pop):
+    # Tekrarlanan yollar atılır (ilk görülen korunur); cephede aynı yolun kopyaları yer kaplamaz
+    seen = {}
+    for i, (row, n) in enumerate(zip(pop.nodes, pop.lengths.tolist())):
+        seen.setdefault(row[:n].tobytes(), i)
+    return pop.take(np.fromiter(seen.values(), dtype=np.intp, count=len(seen)))
+
+
+# NSGA-II ana fonksiyonu. stopping: generations, stall_generations (Pareto cephesindeki yollar
+# değişmeden geçen nesil), time_budget ve eval_budget (hesaplanan yol sayısı) kullanılır.
+def run_nsga2(
+    G, s, d, talep,
+    pop_size=50, generations=100,
+    mutation_rate=0.3, crossover_rate=0.7,
+    seed_count=None, rng=None, return_info=False, repair="hop",
+    stopping=None, progress=None
+):
+    """
+    NSGA-II ile s -> d için talebi karşılayan domine edilmeyen yolları bulur.
+
+    :return: Gecikmeye göre sıralı sözlük listesi (pareto_routing.pareto_front ile aynı biçim):
+             {"path", "total_delay", "reliability_cost", "resource_cost"};
+             return_info=True ise (front, info). info["topology"] ve info["synthetic_edge"]
+             run_genetic_algorithm'dekiyle aynıdır.
+    """
+    start = time.perf_counter()
+    stop = dict(DEFAULT_STOPPING, **(stopping or {}))
+    if stop["generations"] is not None:
+        generations = stop["generations"]
+
+    rng = make_rng(rng)
+    base = as_topology(G)
+    G = prepare_topology(base, s, d, rng)
+    gen = np.random.default_rng(rng.getrandbits(64))
+    if repair == "cost":
+        raise ValueError("NSGA-II tek bir ağırlık vektörü kullanmaz; repair 'hop' ya da 'random' olmalı")
+    pool = make_walk_pool(G, d, talep, None, gen, repair)
+
+    # Tohumlar her amaç köşesinin k-en kısa yollarından, kalanı yürüyüş havuzundan
+    if seed_count is None:
+        seed_count = max(1, pop_size // 5)
+    per_corner = max(1, seed_count // len(_SEED_WEIGHTS))
+    population = []
+    for w in _SEED_WEIGHTS:
+        population += [p for p, _ in islice(k_shortest_paths(G, s, d, talep, w), per_corner)]
+    missing = pop_size - len(population)
+    if missing > 0:
+        walks, lengths, found = pool.take(np.full(missing, s))
+        population += [w[:n].tolist() for w, n, f in zip(walks, lengths, found) if f]
+
+    info = {"generations": [], "stop_reason": "generations", "generations_used": 0,
+            "evaluations": 0, "elapsed": 0.0,
+            "topology": G, "synthetic_edge": (s, d) if G is not base else None}
+    if not population:
+        info["stop_reason"] = "no_path"
+        info["elapsed"] = time.perf_counter() - start
+        return ([], info) if return_info else []
+
+    pop = _unique_rows(PathPopulation.from_paths(population, len(G)))
+    F = objective_matrix(G, pop)
+    info["evaluations"] += len(pop)
+    rank, order, position = _nsga_order(F)
+    front_key = None
+    stall = 0
+
+    for g in range(generations):
+        # Ebeveynler (cephe, kalabalık) sırasına göre ikili turnuvayla seçilir
+        m = pop_size
+        fitness = (len(pop) - position).astype(float)
+        parent1 = tournament_batch(fitness, m, k=2, gen=gen)
+        parent2 = tournament_batch(fitness, m, k=2, gen=gen)
+
+        cross = gen.random(m) < crossover_rate
+        children = pop.take(parent1)
+        if cross.any():
+            crossed = crossover_batch(G, pop, parent1[cross], parent2[cross], s, d, gen=gen)
+            width = max(children.nodes.shape[1], crossed.nodes.shape[1])
+            nodes = _pad(children.nodes, width)
+            nodes[cross] = _pad(crossed.nodes, width)
+            children.lengths[cross] = crossed.lengths
+            children = PathPopulation(nodes, children.lengths, pop.num_nodes)
+        children = mutate_batch(children, pool, mutation_rate=mutation_rate, gen=gen)
+        children = mutate_batch(children, pool, mutation_rate=mutation_rate, gen=gen)
+
+        # Ebeveyn + çocuk birleşiminden en iyi pop_size birey (elitist çevresel seçim)
+        merged = _unique_rows(PathPopulation.concat([pop, children]))
+        F_merged = np.vstack([F, objective_matrix(G, merged.take(np.arange(len(pop), len(merged))))])
+        info["evaluations"] += len(merged) - len(pop)
+        _, order, _ = _nsga_order(F_merged)
+        keep = np.sort(order[:pop_size])
+        pop, F = merged.take(keep), F_merged[keep]
+        rank, order, position = _nsga_order(F)
+
+        best = rank == 0
+        key = frozenset(pop.nodes[i, :n].tobytes() for i, n in zip(np.flatnonzero(best).tolist(),
+                                                                    pop.lengths[best].tolist()))
+        stall = stall + 1 if key == front_key else 0
+        front_key = key
+
+        elapsed = time.perf_counter() - start
+        record = {"generation": g, "front_size": int(best.sum()), "population": len(pop), "elapsed": elapsed}
+        info["generations"].append(record)
+        info["generations_used"] = g + 1
+        if progress is not None:
+            progress(record)
+
+        if stop["stall_generations"] is not None and stall >= stop["stall_generations"]:
+            info["stop_reason"] = "stall"
+            break
+        if stop["time_budget"] is not None and elapsed >= stop["time_budget"]:
+            info["stop_reason"] = "time_budget"
+            break
+        if stop["eval_budget"] is not None and info["evaluations"] >= stop["eval_budget"]:
+            info["stop_reason"] = "eval_budget"
+            break
+
+    finite = np.isfinite(F).all(axis=1) & (rank == 0)
+    front = [
+        {"path": pop.path(i), "total_delay": float(F[i, 0]),
+         "reliability_cost": float(F[i, 1]), "resource_cost": float(F[i, 2])}
+        for i in np.flatnonzero(finite).tolist()
+    ]
+    front.sort(key=lambda m: (m["total_delay"], m["reliability_cost"], m["resource_cost"]))
+    info["elapsed"] = time.perf_counter() - start
+    return (front, info) if return_info else front
@@ -1,47 +1,777 @@
+import os
 import random
+import shutil
+import hashlib
+import itertools
+import numpy as np
 import networkx as nx
 import pandas as pd
 
-def create_graph_from_csv(edge_file, demand_file, node_file):
+
+# Her Topology nesnesine verilen benzersiz sürüm numarası (önbellek anahtarları için)
+_TOPOLOGY_VERSIONS = itertools.count(1)
+
+# Düğüm sayısının karesi bu sınırın altındaysa edge_ids yoğun n x n indis matrisi kullanır (int32)
+DENSE_EDGE_LOOKUP_LIMIT = 1 << 22
+
+
+class Topology:
+    """
+    Ağın CSR (Compressed Sparse Row) biçimindeki dizi gösterimi.
+
+    Her yönsüz kenar iki yönlü kenar olarak saklanır; u düğümünün komşuları
+    neighbors[offsets[u]:offsets[u + 1]] aralığındadır ve kenar nitelikleri
+    (capacity, delay, r_link) aynı kenar indisleriyle tutulur. Komşular her
+    satırda artan sıradadır, bu sayede (u, v) kenarı ikili arama ile bulunur.
+    NetworkX grafı yalnızca arayüz (çizim) için ihtiyaç duyulduğunda üretilir.
+    """
+
+    def __init__(self, offsets, neighbors, capacity, delay, r_link, s_ms, r_node):
+        self.offsets = np.ascontiguousarray(offsets, dtype=np.int32)
+        self.neighbors = np.ascontiguousarray(neighbors, dtype=np.int32)
+        self.capacity = np.ascontiguousarray(capacity, dtype=np.float64)
+        self.delay = np.ascontiguousarray(delay, dtype=np.float64)
+        self.r_link = np.ascontiguousarray(r_link, dtype=np.float64)
+        self.s_ms = np.ascontiguousarray(s_ms, dtype=np.float64)
+        self.r_node = np.ascontiguousarray(r_node, dtype=np.float64)
+
+        self.num_nodes = len(self.s_ms)
+        self.num_edges = len(self.neighbors)
+
+        # Diziler oluşturulduktan sonra değiştirilmez; türetilmiş tablolar bu sürümle anahtarlanır
+        self.version = next(_TOPOLOGY_VERSIONS)
+
+        # Anlık görüntüden (snapshot) yüklendiyse dizin yolu, yerleşim (layout) önbelleği için
+        self.snapshot_path = None
+        self.layout = None
+
+        self._heads = None
+        self._keys = None
+        self._graph = None
+        self._bw_index = None
+        self._derived = {}
+
+    @classmethod
+    def from_edges(cls, num_nodes, src, dst, capacity, delay, r_link, s_ms, r_node):
+        """
+        Yönsüz kenar listesinden CSR yapısını vektörel olarak kurar.
+        Aynı kenar birden fazla kez verilmişse (nx.Graph'ta olduğu gibi) son satır geçerlidir.
+        """
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+
+        # Kendine dönen kenarlar yönlendirmede anlamsız olduğu için atılır
+        keep = src != dst
+        src, dst = src[keep], dst[keep]
+        capacity = np.asarray(capacity, dtype=np.float64)[keep]
+        delay = np.asarray(delay, dtype=np.float64)[keep]
+        r_link = np.asarray(r_link, dtype=np.float64)[keep]
+
+        # Kenarlar (min, max) yönüne çevrilir; ters yönde tekrarlanan kenarlar da aynı anahtarı
+        # alır ve kararlı sıralamada yalnızca son satır tutulur, böylece iki yön aynı niteliklerle kalır
+        lo, hi = np.minimum(src, dst), np.maximum(src, dst)
+        order = np.argsort(lo * num_nodes + hi, kind="stable")
+        keys = lo[order] * num_nodes + hi[order]
+        last = np.ones(len(keys), dtype=bool)
+        last[:-1] = keys[1:] != keys[:-1]
+        order = order[last]
+        lo, hi = lo[order], hi[order]
+        capacity, delay, r_link = capacity[order], delay[order], r_link[order]
+
+        # Her kenar iki yönde de eklenir
+        heads = np.concatenate([lo, hi])
+        tails = np.concatenate([hi, lo])
+        capacity = np.concatenate([capacity, capacity])
+        delay = np.concatenate([delay, delay])
+        r_link = np.concatenate([r_link, r_link])
+
+        # (head, tail) sırasına göre sıralama
+        order = np.lexsort((tails, heads))
+        heads = heads[order]
+        counts = np.bincount(heads, minlength=num_nodes)
+        offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        return cls(offsets, tails[order], capacity[order], delay[order], r_link[order], s_ms, r_node)
+
+    @classmethod
+    def from_networkx(cls, G):
+        """
+        NetworkX grafını dizi gösterimine çevirir. Düğümler 0..n-1 tamsayıları olmalıdır.
+        """
+        n = G.number_of_nodes()
+        if any(not isinstance(v, (int, np.integer)) or v < 0 or v >= n for v in G.nodes()):
+            raise ValueError("Dizi gösterimi için düğümler 0..n-1 aralığında tamsayı olmalıdır.")
+
+        s_ms = np.zeros(n)
+        r_node = np.ones(n)
+        for v, data in G.nodes(data=True):
+            s_ms[v] = data.get("processing_delay", 0.0)
+            r_node[v] = data.get("reliability", 1.0)
+
+        m = G.number_of_edges()
+        src = np.empty(m, dtype=np.int64)
+        dst = np.empty(m, dtype=np.int64)
+        capacity = np.zeros(m)
+        delay = np.zeros(m)
+        r_link = np.ones(m)
+        for i, (u, v, data) in enumerate(G.edges(data=True)):
+            src[i], dst[i] = u, v
+            capacity[i] = data.get("bandwidth", 0.0)
+            delay[i] = data.get("delay", 0.0)
+            r_link[i] = data.get("reliability", 1.0)
+
+        topo = cls.from_edges(n, src, dst, capacity, delay, r_link, s_ms, r_node)
+        topo._graph = G
+        return topo
+
+    def with_edges(self, src, dst, capacity, delay, r_link):
+        """
+        Verilen yönsüz kenarların eklendiği yeni bir Topology döndürür; bu nesne değişmez.
+        Sorguya özel geçici kenarlar (overlay) için kullanılır.
+        """
+        heads = self.heads
+        mask = heads < self.neighbors
+        return Topology.from_edges(
+            self.num_nodes,
+            np.concatenate([heads[mask], np.asarray(src, dtype=np.int64)]),
+            np.concatenate([self.neighbors[mask], np.asarray(dst, dtype=np.int64)]),
+            np.concatenate([self.capacity[mask], np.asarray(capacity, dtype=np.float64)]),
+            np.concatenate([self.delay[mask], np.asarray(delay, dtype=np.float64)]),
+            np.concatenate([self.r_link[mask], np.asarray(r_link, dtype=np.float64)]),
+            self.s_ms,
+            self.r_node,
+        )
+
+    def __len__(self):
+        return self.num_nodes
+
+    def __contains__(self, node):
+        return isinstance(node, (int, np.integer)) and 0 <= node < self.num_nodes
+
+    def nodes(self):
+        return range(self.num_nodes)
+
+    def degree(self, u):
+        return int(self.offsets[u + 1] - self.offsets[u])
+
+    def neighbors_of(self, u):
+        """u düğümünün komşu dizisi (kopyasız görünüm)."""
+        return self.neighbors[self.offsets[u]:self.offsets[u + 1]]
+
+    @property
+    def heads(self):
+        """Her yönlü kenarın başlangıç düğümü (ihtiyaç duyulduğunda üretilir)."""
+        if self._heads is None:
+            counts = np.diff(self.offsets)
+            self._heads = np.repeat(np.arange(self.num_nodes, dtype=np.int32), counts)
+        return self._heads
+
+    @property
+    def keys(self):
+        """head * n + tail anahtarları; CSR sırası nedeniyle artan sıralıdır."""
+        if self._keys is None:
+            self._keys = self.heads.astype(np.int64) * self.num_nodes + self.neighbors
+        return self._keys
+
+    def _cached(self, name, fn):
+        arr = self._derived.get(name)
+        if arr is None:
+            arr = self._derived[name] = fn()
+        return arr
+
+    @property
+    def fingerprint(self):
+        """Dizilerin içeriğinden üretilen kalıcı özet; süreçler arası önbellek anahtarı olarak kullanılır."""
+        def digest():
+            h = hashlib.sha256()
+            for name in SNAPSHOT_ARRAYS:
+                h.update(np.ascontiguousarray(getattr(self, name)).tobytes())
+            return h.hexdigest()
+        return self._cached("fingerprint", digest)
+
+    @property
+    def edge_rel_cost(self):
+        """Kenar başına -log(r_link)."""
+        return self._cached("edge_rel_cost", lambda: -np.log(self.r_link))
+
+    @property
+    def node_rel_cost(self):
+        """Düğüm başına -log(r_node)."""
+        return self._cached("node_rel_cost", lambda: -np.log(self.r_node))
+
+    @property
+    def edge_res_cost(self):
+        """Kenar başına kaynak kullanım maliyeti 1000 / capacity."""
+        return self._cached("edge_res_cost", lambda: 1000.0 / self.capacity)
+
+    def edge_id(self, u, v):
+        """(u, v) yönlü kenarının indisini döndürür, kenar yoksa -1."""
+        lo, hi = self.offsets[u], self.offsets[u + 1]
+        i = lo + np.searchsorted(self.neighbors[lo:hi], v)
+        if i < hi and self.neighbors[i] == v:
+            return int(i)
+        return -1
+
+    def edge_ids(self, u, v):
+        """edge_id'nin vektörel hali; bulunamayan kenarlar için -1."""
+        u = np.asarray(u, dtype=np.int64)
+        v = np.asarray(v, dtype=np.int64)
+        n = self.num_nodes
+        # Aralık dışındaki uçlar -1'dir; aksi halde u * n + v anahtarı bir sonraki CSR satırındaki
+        # gerçek bir kenarla çakışabilir (ör. (0, n) -> (1, 0))
+        valid = (u >= 0) & (u < n) & (v >= 0) & (v < n)
+        # Küçük topolojilerde n x n kenar indisi matrisinden doğrudan okunur (ikili arama yok)
+        if n * n <= DENSE_EDGE_LOOKUP_LIMIT and valid.all():
+            return self._cached("edge_matrix", self._edge_matrix)[u, v].astype(np.int64)
+        if self.num_edges == 0:
+            return np.full(valid.shape, -1, dtype=np.int64)
+        q = u * n + v
+        idx = np.searchsorted(self.keys, q)
+        idx = np.minimum(idx, self.num_edges - 1)
+        found = valid & (self.keys[idx] == q)
+        return np.where(found, idx, -1)
+
+    def _edge_matrix(self):
+        mat = np.full((self.num_nodes, self.num_nodes), -1, dtype=np.int32)
+        mat[self.heads, self.neighbors] = np.arange(self.num_edges, dtype=np.int32)
+        mat.setflags(write=False)
+        return mat
+
+    def has_edge(self, u, v):
+        return self.edge_id(u, v) >= 0
+
+    def bandwidth_index(self):
+        """
+        Kapasiteye göre azalan sıralı komşuluk: (kenar indisleri, komşular, -kapasite).
+        Satır sınırları offsets ile aynıdır; yalnızca satır içindeki sıra değişir.
+        """
+        if self._bw_index is None:
+            order = np.lexsort((-self.capacity, self.heads))
+            self._bw_index = (
+                order.astype(np.int32),
+                self.neighbors[order],
+                -self.capacity[order],
+            )
+        return self._bw_index
+
+    @property
+    def capacity_levels(self):
+        """Topolojideki farklı capacity değerleri (artan sırada)."""
+        return self._cached("capacity_levels", lambda: np.unique(self.capacity))
+
+    def demand_class(self, demand):
+        """
+        Talebin kapasite eşik sınıfı: capacity >= demand koşulunu sağlayan en küçük kapasite
+        seviyesinin indisi. Aynı sınıftaki talepler tam olarak aynı uygun kenar kümesine sahiptir;
+        len(capacity_levels) değeri hiçbir kenarın talebi karşılamadığı sınıftır.
+        """
+        return int(np.searchsorted(self.capacity_levels, demand, side="left"))
+
+    def class_threshold(self, cls):
+        """Sınıfın temsilci talebi (o sınıfın kapasite seviyesi; boş sınıf için inf)."""
+        levels = self.capacity_levels
+        return float(levels[cls]) if cls < len(levels) else np.inf
+
+    def feasible_ranges(self, demand):
+        """
+        Tüm düğümler için bant genişliği indeksindeki uygun kenar aralıkları (starts, ends):
+        u'nun talebi karşılayan kenarları bandwidth_index()[0][starts[u]:ends[u]] dilimidir.
+        """
+        neg_cap = self.bandwidth_index()[2]
+        counts = np.bincount(self.heads[neg_cap <= -demand], minlength=self.num_nodes)
+        starts = self.offsets[:-1].astype(np.int64)
+        return starts, starts + counts
+
+    def _feasible_count(self, u, demand):
+        lo, hi = self.offsets[u], self.offsets[u + 1]
+        neg_cap = self.bandwidth_index()[2]
+        return lo, lo + np.searchsorted(neg_cap[lo:hi], -demand, side="right")
+
+    def feasible_edges(self, u, demand):
+        """
+        u'dan çıkan ve capacity >= demand olan kenarların indisleri.
+        Satır kapasiteye göre sıralı olduğundan O(log deg) ikili arama ile bulunur, kopya üretilmez.
+        """
+        lo, hi = self._feasible_count(u, demand)
+        return self.bandwidth_index()[0][lo:hi]
+
+    def feasible_neighbors(self, u, demand):
+        """feasible_edges ile aynı sırada, talebi karşılayan komşular (kopyasız görünüm)."""
+        lo, hi = self._feasible_count(u, demand)
+        return self.bandwidth_index()[1][lo:hi]
+
+    def feasible_table(self, demand):
+        """
+        Uygun kenarların düğüm başına -1 ile doldurulmuş matrisi ve satır uzunlukları (table, counts):
+        table[u, j], u'nun bant genişliği sırasındaki j. uygun kenarıdır. Çok sayıda ajanın/yolun
+        aksiyon kümesini tek indekslemeyle okuyan toplu (vektörel) işlemler için.
+        """
+        starts, ends = self.feasible_ranges(demand)
+        counts = ends - starts
+        cols = np.arange(max(int(counts.max(initial=0)), 1))
+        valid = cols < counts[:, None]
+        bw_edges = self.bandwidth_index()[0]
+        if len(bw_edges) == 0:
+            return np.full(valid.shape, -1, dtype=np.int64), counts
+        pos = np.minimum(starts[:, None] + cols, len(bw_edges) - 1)
+        return np.where(valid, bw_edges[pos], -1), counts
+
+    @property
+    def graph(self):
+        """Arayüz için NetworkX grafı (ilk erişimde bir kez oluşturulur)."""
+        if self._graph is None:
+            self._graph = self.to_networkx()
+        return self._graph
+
+    def to_networkx(self):
+        G = nx.Graph()
+        G.add_nodes_from(
+            (v, {"processing_delay": float(self.s_ms[v]), "reliability": float(self.r_node[v])})
+            for v in range(self.num_nodes)
+        )
+
+        # Her yönsüz kenar bir kez eklenir (head < tail)
+        heads = self.heads
+        mask = heads < self.neighbors
+        G.add_edges_from(
+            (int(u), int(v), {"bandwidth": float(bw), "delay": float(dl), "reliability": float(rl)})
+            for u, v, bw, dl, rl in zip(
+                heads[mask], self.neighbors[mask],
+                self.capacity[mask], self.delay[mask], self.r_link[mask]
+            )
+        )
+        G.graph["topology"] = self
+        return G
+
+
+def as_topology(G):
+    """
+    Topology ya da NetworkX grafı alır ve dizi gösterimini döndürür.
+    NetworkX grafları için dönüşüm sonucu G.graph içinde saklanır.
+    """
+    if isinstance(G, Topology):
+        return G
+
+    topo = G.graph.get("topology")
+    if topo is None or topo.num_nodes != G.number_of_nodes() or topo.num_edges != 2 * G.number_of_edges():
+        topo = Topology.from_networkx(G)
+        G.graph["topology"] = topo
+    return topo
+
+
+def as_graph(G):
+    """Topology ya da NetworkX grafı alır ve NetworkX grafını döndürür."""
+    if isinstance(G, Topology):
+        return G.graph
+    return G
+
+
+def bfs_path(G, s, d, demand):
+    """
+    Yalnızca capacity >= demand olan kenarlar üzerinden en az atlamalı yolu bulur.
+    Alt graf kopyalanmaz; komşular bant genişliği indeksinden okunur. Yol yoksa None.
+    """
+    topo = as_topology(G)
+    if s not in topo or d not in topo:
+        return None
+    if s == d:
+        return [s]
+
+    parent = {s: s}
+    frontier = [s]
+    while frontier:
+        nxt_frontier = []
+        for u in frontier:
+            for v in topo.feasible_neighbors(u, demand).tolist():
+                if v in parent:
+                    continue
+                parent[v] = u
+                if v == d:
+                    path = [d]
+                    while path[-1] != s:
+                        path.append(parent[path[-1]])
+                    return path[::-1]
+                nxt_frontier.append(v)
+        frontier = nxt_frontier
+    return None
+
+
+def load_demands(demand_file):
+    """DemandData CSV dosyasını (src, dst, demand_mbps) demetleri listesi olarak okur."""
+    df = pd.read_csv(demand_file, sep=';', decimal=',')
+    df.columns = df.columns.str.strip()
+    return list(zip(
+        df["src"].astype(int).tolist(),
+        df["dst"].astype(int).tolist(),
+        df["demand_mbps"].astype(float).tolist(),
+    ))
+
+
+def demand_class_report(G, demands=()):
+    """
+    Talep sınıfı özeti. Sınıflar, farklı capacity değerlerinden türetilen kapasite eşikleridir;
+    aynı sınıftaki tüm talepler aynı uygun kenar kümesini (ve aynı Q-Learning durumunu) paylaşır.
+    demands verilirse (talep değerleri veya load_demands demetleri) kaç farklı sınıfa düştükleri
+    ve sınıf başına talep sayısı da raporlanır.
+    """
+    topo = as_topology(G)
+    levels = topo.capacity_levels
+    report = {
+        "capacity_levels": len(levels),
+        "classes": len(levels) + 1,  # + hiçbir kenarın karşılamadığı sınıf
+    }
+    values = [d[2] if isinstance(d, (tuple, list)) else d for d in demands]
+    if values:
+        classes = np.searchsorted(levels, np.asarray(values, dtype=np.float64), side="left")
+        used, counts = np.unique(classes, return_counts=True)
+        report["demands"] = len(values)
+        report["demand_classes"] = len(used)
+        report["class_counts"] = {int(c): int(n) for c, n in zip(used, counts)}
+    return report
+
+
+def load_topology(edge_file, node_file):
+    """
+    Edge/Node CSV dosyalarını sütun bazında okuyup doğrudan CSR yapısını oluşturur.
+    """
     edges_df = pd.read_csv(edge_file, sep=';', decimal=',')
     nodes_df = pd.read_csv(node_file, sep=';', decimal=',')
-    demands_df = pd.read_csv(demand_file, sep=';', decimal=',')
-
 
     nodes_df.columns = nodes_df.columns.str.strip()
     edges_df.columns = edges_df.columns.str.strip()
-    demands_df.columns = demands_df.columns.str.strip()
 
+    node_ids = nodes_df["node_id"].to_numpy(dtype=np.int64)
+    num_nodes = int(max(node_ids.max(initial=-1), edges_df["src"].max(), edges_df["dst"].max())) + 1
 
-    G = nx.Graph()
+    # CSV'de yer almayan düğümler nötr değerlerle doldurulur
+    s_ms = np.zeros(num_nodes)
+    r_node = np.ones(num_nodes)
+    s_ms[node_ids] = nodes_df["s_ms"].to_numpy(dtype=np.float64)
+    r_node[node_ids] = nodes_df["r_node"].to_numpy(dtype=np.float64)
 
+    return Topology.from_edges(
+        num_nodes,
+        edges_df["src"].to_numpy(dtype=np.int64),
+        edges_df["dst"].to_numpy(dtype=np.int64),
+        edges_df["capacity_mbps"].to_numpy(dtype=np.float64),
+        edges_df["delay_ms"].to_numpy(dtype=np.float64),
+        edges_df["r_link"].to_numpy(dtype=np.float64),
+        s_ms,
+        r_node,
+    )
 
-    for _, row in nodes_df.iterrows():
-        node_id = int(row['node_id'])
-        G.add_node(node_id)
-        G.nodes[node_id]["processing_delay"] = float(row['s_ms'])
-        G.nodes[node_id]["reliability"] = float(row['r_node'])
 
+SNAPSHOT_ARRAYS = ("offsets", "neighbors", "capacity", "delay", "r_link", "s_ms", "r_node")
 
-    for _, row in edges_df.iterrows():
-        u = int(row['src'])
-        v = int(row['dst'])
-        G.add_edge(u, v)
+# Anlık görüntü biçiminin sürümü. Yükleyicinin dizileri kurma biçimi değiştiğinde (ör. kenar
+# tekilleştirme kuralı) artırılır; eski sürümle yazılmış önbellek dizinleri kullanılmaz.
+SNAPSHOT_VERSION = 2
+SNAPSHOT_VERSION_FILE = "VERSION"
 
-        G.edges[u, v]["bandwidth"] = float(row['capacity_mbps'])
-        G.edges[u, v]["delay"] = float(row['delay_ms'])
-        G.edges[u, v]["reliability"] = float(row['r_link'])
 
+def csv_hash(*files):
+    """Verilen dosyaların içeriğinden SHA-256 özet değeri üretir."""
+    h = hashlib.sha256()
+    for f in files:
+        with open(f, "rb") as fp:
+            for chunk in iter(lambda: fp.read(1 << 20), b""):
+                h.update(chunk)
+        h.update(b"\0")
+    return h.hexdigest()
 
 
-    return G
+def save_snapshot(topo, path):
+    """
+    Topolojiyi .npy dosyalarından oluşan bir dizine yazar.
+    Önce geçici dizine yazılıp ardından yeniden adlandırılır; yarım kalan yazım okunmaz.
+    """
+    tmp = f"{path}.tmp-{os.getpid()}"
+    os.makedirs(tmp, exist_ok=True)
+    for name in SNAPSHOT_ARRAYS:
+        np.save(os.path.join(tmp, name + ".npy"), getattr(topo, name))
+    with open(os.path.join(tmp, SNAPSHOT_VERSION_FILE), "w") as fp:
+        fp.write(str(SNAPSHOT_VERSION))
+
+    try:
+        os.replace(tmp, path)
+    except OSError:
+        # Başka bir süreç aynı anlık görüntüyü önce yazmış olabilir
+        shutil.rmtree(tmp, ignore_errors=True)
+    topo.snapshot_path = path
+
+
+def load_snapshot(path, mmap=True):
+    """
+    Anlık görüntüyü yükler. mmap=True ise diziler salt okunur bellek eşlemesi olarak açılır,
+    böylece aynı makinedeki birden çok süreç tek bir kopyayı paylaşır.
+    Sürüm dosyası eksik ya da SNAPSHOT_VERSION'dan farklıysa ValueError verilir.
+    """
+    try:
+        with open(os.path.join(path, SNAPSHOT_VERSION_FILE)) as fp:
+            version = fp.read().strip()
+    except FileNotFoundError:
+        version = None
+    if version != str(SNAPSHOT_VERSION):
+        raise ValueError(f"Anlık görüntü sürümü uyumsuz: {version!r} (beklenen {SNAPSHOT_VERSION})")
+
+    mode = "r" if mmap else None
+    arrays = [np.load(os.path.join(path, name + ".npy"), mmap_mode=mode) for name in SNAPSHOT_ARRAYS]
+    topo = Topology(*arrays)
+    topo.snapshot_path = path
+    return topo
+
+
+def load_topology_cached(edge_file, node_file, cache_dir=None):
+    """
+    CSV içeriğinin özeti ve SNAPSHOT_VERSION ile anahtarlanan anlık görüntüyü kullanır;
+    yoksa CSV'den kurup yazar.
+    Varsayılan önbellek dizini CSV dosyalarının yanındaki .topology_cache klasörüdür.
+    """
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(edge_file)), ".topology_cache")
+    path = os.path.join(cache_dir, f"v{SNAPSHOT_VERSION}-{csv_hash(edge_file, node_file)}")
+
+    if os.path.isdir(path):
+        try:
+            return load_snapshot(path)
+        except (OSError, ValueError):
+            # Bozuk anlık görüntü: CSV'den yeniden kurulur
+            shutil.rmtree(path, ignore_errors=True)
+
+    topo = load_topology(edge_file, node_file)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        save_snapshot(topo, path)
+    except OSError:
+        # Yazma izni yoksa önbelleksiz devam edilir
+        pass
+    return topo
+
+
+def topology_layout(topo, seed=42):
+    """
+    Çizim için spring layout konumlarını döndürür.
+    Anlık görüntüsü olan topolojilerde sonuç layout_<seed>.npy olarak saklanır.
+    """
+    if topo.layout is not None and topo.layout[0] == seed:
+        pos = topo.layout[1]
+        return {v: pos[v] for v in range(topo.num_nodes)}
+
+    layout_file = None
+    if topo.snapshot_path is not None:
+        layout_file = os.path.join(topo.snapshot_path, f"layout_{seed}.npy")
+
+    if layout_file is not None and os.path.exists(layout_file):
+        pos = np.load(layout_file)
+    else:
+        pos_dict = nx.spring_layout(topo.graph, seed=seed)
+        pos = np.array([pos_dict[v] for v in range(topo.num_nodes)])
+        if layout_file is not None:
+            try:
+                tmp = f"{layout_file}.tmp-{os.getpid()}.npy"
+                np.save(tmp, pos)
+                os.replace(tmp, layout_file)
+            except OSError:
+                pass
+
+    topo.layout = (seed, pos)
+    return {v: pos[v] for v in range(topo.num_nodes)}
+
+
+def create_graph_from_csv(edge_file, demand_file, node_file):
+    # Dizi gösterimi anlık görüntüden (yoksa CSV'den) kurulur, NetworkX grafı ondan üretilir
+    return load_topology_cached(edge_file, node_file).graph
+
+
+def _er_edges(rng, n, avg_degree, batch=1 << 20):
+    """
+    G(n, p) kenarlarını geometrik atlama (Batagelj–Brandes) ile üretir: O(n + m).
+    Olası (n·(n-1)/2) çift doğrusal indislenir, seçilen indisler arası boşluklar
+    Geometrik(p) dağılımından toplu olarak çekilir.
+    """
+    total = n * (n - 1) // 2
+    p = min(avg_degree / max(n - 1, 1), 1.0)
+    if p <= 0.0 or total == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    if p >= 1.0:
+        picks = np.arange(total, dtype=np.int64)
+    else:
+        chunks = []
+        last = -1
+        size = min(batch, int(total * p * 1.1) + 64)
+        while last < total:
+            pos = last + np.cumsum(rng.geometric(p, size=size).astype(np.int64))
+            chunks.append(pos[pos < total])
+            last = int(pos[-1])
+        picks = np.concatenate(chunks)
+
+    # k indisini alt üçgendeki (w, v), v < w çiftine çevir
+    w = np.floor((1.0 + np.sqrt(1.0 + 8.0 * picks)) / 2.0).astype(np.int64)
+    w[w * (w - 1) // 2 > picks] -= 1
+    w[w * (w + 1) // 2 <= picks] += 1
+    v = picks - w * (w - 1) // 2
+    return v, w
+
 
+def _ba_edges(rng, n, avg_degree):
+    """
+    Barabási–Albert modeli, Batagelj–Brandes dizi yöntemiyle.
+    k. kenarın hedefi, kendisinden önceki uç noktalardan rastgele birinin kopyasıdır;
+    kopya zincirleri vektörel işaretçi atlamayla çözülür.
+    """
+    m = max(1, int(round(avg_degree / 2.0)))
+    num = n * m
+    k = np.arange(num, dtype=np.int64)
+    src = k // m
 
-def create_random_graph(num_nodes=250, p=0.4, edge_file=None, demand_file=None, node_file=None):
+    # r_k ∈ [0, 2k]; çift konumlar doğrudan düğüm, tek konumlar önceki bir hedefe işaret eder
+    ptr = (rng.random(num) * (2 * k + 1)).astype(np.int64)
+    r = ptr.copy()
+    odd = (ptr & 1) == 1
+    while odd.any():
+        ptr[odd] = r[(ptr[odd] - 1) // 2]
+        odd = (ptr & 1) == 1
+    dst = (ptr // 2) // m
+    return src, dst
+
+
+def _waxman_edges(rng, n, avg_degree, alpha=None, beta=0.4, cutoff=4.6, batch=1 << 16):
+    """
+    Waxman modeli: birim karede rastgele düğümler, P(u, v) = beta·exp(-d / (alpha·L)).
+    Seyrek üretim için alpha hedef ortalama dereceden türetilir ve yalnızca
+    cutoff·alpha·L mesafesi içindeki çiftler hücre ızgarası üzerinden denenir
+    (ihmal edilen olasılıklar exp(-cutoff) ≈ %1'in altındadır).
+    """
+    L = np.sqrt(2.0)
+    if alpha is None:
+        # Sınır etkileri ihmal edilirse E[derece] ≈ n·beta·2π(alpha·L)²
+        alpha = np.sqrt(avg_degree / (2.0 * np.pi * n * beta)) / L
+    scale = alpha * L
+    radius = min(cutoff * scale, L)
+
+    xy = rng.random((n, 2))
+    cells = max(1, int(1.0 / radius))
+    cx = np.minimum((xy[:, 0] * cells).astype(np.int64), cells - 1)
+    cy = np.minimum((xy[:, 1] * cells).astype(np.int64), cells - 1)
+    cell = cx * cells + cy
+
+    order = np.argsort(cell, kind="stable")
+    sorted_cell = cell[order]
+    starts = np.searchsorted(sorted_cell, np.arange(cells * cells + 1))
+
+    src_chunks, dst_chunks = [], []
+    # Her çift bir kez denensin diye komşu hücrelerin yarısı taranır
+    for dx, dy in ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1)):
+        for lo in range(0, n, batch):
+            a = order[lo:lo + batch]
+            nx_, ny_ = cx[a] + dx, cy[a] + dy
+            valid = (nx_ >= 0) & (nx_ < cells) & (ny_ >= 0) & (ny_ < cells)
+            a = a[valid]
+            target = nx_[valid] * cells + ny_[valid]
+            first, count = starts[target], starts[target + 1] - starts[target]
+
+            # Düzensiz (ragged) çarpım: a'daki her düğüm hedef hücredeki tüm düğümlerle
+            u = np.repeat(a, count)
+            base = np.repeat(first - np.cumsum(count) + count, count)
+            v = order[base + np.arange(len(u))]
+            if dx == 0 and dy == 0:
+                keep = u < v
+                u, v = u[keep], v[keep]
+
+            d = np.sqrt(((xy[u] - xy[v]) ** 2).sum(axis=1))
+            keep = rng.random(len(u)) < beta * np.exp(-d / scale)
+            src_chunks.append(u[keep])
+            dst_chunks.append(v[keep])
+
+    return np.concatenate(src_chunks), np.concatenate(dst_chunks)
+
+
+def _fat_tree_edges(k, hosts=False):
+    """
+    k-ary fat-tree (3 katmanlı Clos). Düğüm sırası: (k/2)² çekirdek, k·k/2 toplama,
+    k·k/2 kenar anahtarı ve hosts=True ise k³/4 uç düğüm.
+    """
+    if k % 2:
+        raise ValueError("Fat-tree için k çift olmalıdır.")
+    h = k // 2
+    agg0 = h * h
+    edge0 = agg0 + k * h
+    host0 = edge0 + k * h
+
+    pod = np.repeat(np.arange(k), h * h)
+    i = np.tile(np.repeat(np.arange(h), h), k)
+    j = np.tile(np.tile(np.arange(h), h), k)
+
+    # Pod içi toplama–kenar tam iki parçalı bağlantı
+    src = [agg0 + pod * h + i]
+    dst = [edge0 + pod * h + j]
+    # i. toplama anahtarı i·h .. (i+1)·h-1 çekirdeklerine bağlanır
+    src.append(agg0 + pod * h + i)
+    dst.append(i * h + j)
+
+    num = host0
+    if hosts:
+        e = np.repeat(np.arange(k * h), h)
+        src.append(edge0 + e)
+        dst.append(host0 + np.arange(k * h * h))
+        num += k * h * h
+
+    return num, np.concatenate(src), np.concatenate(dst)
+
+
+TOPOLOGY_FAMILIES = ("er", "ba", "waxman", "fat_tree")
+
+
+def generate_topology(num_nodes=250, avg_degree=8.0, family="er", seed=None, **params):
+    """
+    Büyük ölçekli sentetik topolojiyi doğrudan dizi gösteriminde (Topology) üretir.
+
+    family: "er" (geometrik atlamalı Erdős–Rényi), "ba" (Barabási–Albert),
+    "waxman" ya da "fat_tree". fat_tree için düğüm sayısı yapıdan gelir:
+    params["k"] verilmezse en az num_nodes anahtar içeren en küçük çift k seçilir.
+    Nitelikler create_random_graph ile aynı düzgün dağılımlardan toplu olarak çekilir.
+    """
+    rng = np.random.default_rng(seed)
+
+    if family == "er":
+        src, dst = _er_edges(rng, num_nodes, avg_degree)
+    elif family == "ba":
+        src, dst = _ba_edges(rng, num_nodes, avg_degree)
+    elif family == "waxman":
+        src, dst = _waxman_edges(rng, num_nodes, avg_degree, **params)
+    elif family == "fat_tree":
+        k = params.get("k")
+        if k is None:
+            k = 2
+            while 5 * k * k // 4 < num_nodes:
+                k += 2
+        num_nodes, src, dst = _fat_tree_edges(k, hosts=params.get("hosts", False))
+    else:
+        raise ValueError(f"Bilinmeyen topoloji ailesi: {family} (seçenekler: {TOPOLOGY_FAMILIES})")
+
+    m = len(src)
+    return Topology.from_edges(
+        num_nodes, src, dst,
+        rng.uniform(100.0, 1000.0, m),
+        rng.uniform(3.0, 15.0, m),
+        rng.uniform(0.95, 0.999, m),
+        rng.uniform(0.5, 2.0, num_nodes),
+        rng.uniform(0.95, 0.999, num_nodes),
+    )
+
+
+def create_random_graph(num_nodes=250, p=0.4, edge_file=None, demand_file=None, node_file=None,
+                        avg_degree=None, family="er", seed=None):
 
     if edge_file and node_file:
         return create_graph_from_csv(edge_file, demand_file, node_file)
 
+    # Ortalama derece verilirse seyrek üretici kullanılır (büyük ağlar için)
+    if avg_degree is not None:
+        return generate_topology(num_nodes, avg_degree, family=family, seed=seed).graph
+
     # csv bulamazsa random oluşturacak
     G = nx.erdos_renyi_graph(num_nodes, p)
 
@@ -57,9 +787,34 @@ def create_random_graph(num_nodes=250, p=0.4, edge_file=None, demand_file=None,
     return G
 
 
+def make_rng(rng=None):
+    """
+    Çağrıya özel random.Random örneği döndürür. rng bir Random ise aynen, tamsayıysa tohum
+    olarak kullanılır; None ise küresel random modülünden tohum türetilir, böylece
+    random.seed(42) ile tekrarlanabilirlik korunur ama sonraki çekilişler paylaşılmaz.
+    """
+    if isinstance(rng, random.Random):
+        return rng
+    if rng is None:
+        return random.Random(random.getrandbits(64))
+    return random.Random(rng)
+
+
+def with_random_edge(G, u, v, rng=random):
+    """
+    u-v kenarı rastgele niteliklerle eklenmiş topoloji katmanını döndürür (orijinal değişmez).
+    Nitelikler assign_random_edge_attributes ile aynı aralıklardan çekilir.
+    """
+    return as_topology(G).with_edges(
+        [u], [v],
+        [rng.uniform(100.0, 1000.0)],
+        [rng.uniform(3.0, 15.0)],
+        [rng.uniform(0.95, 0.999)],
+    )
+
+
 # arassında yol olmayan başlangıç ve bitiş düğümleri varsa ikisini bağladıktan sonra parametrelerini vermek için kullanıyoruz
 def assign_random_edge_attributes(G, u, v):
     G.edges[u, v]["bandwidth"] = random.uniform(100.0, 1000.0)
     G.edges[u, v]["delay"] = random.uniform(3.0, 15.0)
     G.edges[u, v]["reliability"] = random.uniform(0.95, 0.999)
-
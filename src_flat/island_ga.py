@@ -0,0 +1,296 @@
+import os
+import math
+import time
+import shutil
+import tempfile
+import traceback
+import multiprocessing as mp
+
+import numpy as np
+
+from graph_utils import load_snapshot, save_snapshot, make_rng
+from genetik_ga import (
+    FitnessCache, PathPopulation, initial_population, make_walk_pool, next_generation, prepare_topology,
+    seed_paths,
+)
+
+
+# Ada modeli (island model) paralel genetik algoritma.
+# K alt popülasyon birbirinden bağımsız evrilir ve her M nesilde bir en iyi bireylerini
+# komşu adalara gönderir. Adalar süreç havuzunda çalışır; işçiler topolojiyi G'yi
+# pickle'lamak yerine salt okunur anlık görüntüden (mmap) açar.
+# Her adanın tohumu ana tohumdan türetilir; sonuç işçi sayısından bağımsızdır.
+# Yen k-en kısa yol tohumları deterministik olduğundan ana süreçte bir kez hesaplanır ve
+# tüm adalara aynı liste olarak verilir; adalar yalnızca rastgele yürüyüşleriyle ayrışır.
+
+MIGRATION_TOPOLOGIES = ("ring", "all")
+
+
+class _Island:
+    """Tek bir alt popülasyon: kendi NumPy üreteci, yürüyüş havuzu ve fitness önbelleği vardır."""
+
+    def __init__(self, G, s, d, talep, weights, seed, params):
+        self.G = G
+        self.s = s
+        self.d = d
+        self.weights = weights
+        self.params = params
+        self.gen = np.random.default_rng(seed)
+        self.pool = make_walk_pool(G, d, talep, weights, self.gen, params["repair"])
+        self.cache = FitnessCache()
+
+        paths = initial_population(G, s, d, talep, weights, params["pop_size"], self.pool,
+                                   seeds=params["seed_paths"])
+        self.pop = PathPopulation.from_paths(paths, len(G)) if paths else None
+        self.best_path = None
+        self.best_cost = math.inf
+        self.evaluated = 0
+
+    def run(self, generations, immigrants=()):
+        """Göçmenleri alıp generations nesil evrilir; (göçmenler, en iyi yol, maliyet, hesaplanan) döner."""
+        if self.pop is None:
+            return [], None, math.inf, 0
+        if immigrants:
+            self._immigrate(immigrants)
+
+        p = self.params
+        for _ in range(generations):
+            self.pop, self.best_path, self.best_cost, counters, _ = next_generation(
+                self.G, self.pop, self.pool, self.s, self.d, self.weights,
+                self.best_path, self.best_cost, self.cache, self.gen,
+                p["pop_size"], p["mutation_rate"], p["crossover_rate"],
+            )
+            self.evaluated += counters["evaluated"]
+        return self._emigrants(), self.best_path, self.best_cost, self.evaluated
+
+    def _emigrants(self):
+        # Popülasyonun en iyi migrants kadar farklı bireyi (yol, maliyet) olarak gönderilir
+        costs, _ = self.cache.evaluate(self.G, self.pop, self.weights)
+        out, seen = [], set()
+        for i in np.argsort(costs, kind="stable").tolist():
+            path = self.pop.path(i)
+            key = tuple(path)
+            if key in seen:
+                continue
+            seen.add(key)
+            out.append((path, float(costs[i])))
+            if len(out) >= self.params["migrants"]:
+                break
+        return out
+
+    def _immigrate(self, immigrants):
+        # Göçmenler popülasyonun en kötü bireylerinin yerini alır
+        costs, _ = self.cache.evaluate(self.G, self.pop, self.weights)
+        worst = np.argsort(costs, kind="stable")[::-1][:len(immigrants)]
+        keep = np.setdiff1d(np.arange(len(self.pop)), worst)
+        incoming = PathPopulation.from_paths([p for p, _ in immigrants], self.pop.num_nodes)
+        self.pop = PathPopulation.concat([self.pop.take(keep), incoming])
+
+
+def _route_migrants(emigrants, topology, count):
+    """Her adanın alacağı göçmenler: ring'de bir önceki adadan, all'da diğer adaların en iyileri."""
+    k = len(emigrants)
+    if k < 2:
+        return [[] for _ in range(k)]
+    if topology == "ring":
+        return [emigrants[(i - 1) % k] for i in range(k)]
+
+    routed = []
+    for i in range(k):
+        pooled = [m for j, e in enumerate(emigrants) if j != i for m in e]
+        pooled.sort(key=lambda m: m[1])
+        chosen, seen = [], set()
+        for path, cost in pooled:
+            if tuple(path) not in seen:
+                seen.add(tuple(path))
+                chosen.append((path, cost))
+            if len(chosen) >= count:
+                break
+        routed.append(chosen)
+    return routed
+
+
+def _worker_main(conn, snapshot_path, s, d, talep, weights, island_seeds, params):
+    # İşçi süreç: topolojiyi anlık görüntüden açar, kendi adalarını kurar ve komut bekler
+    try:
+        topo = load_snapshot(snapshot_path)
+        islands = {i: _Island(topo, s, d, talep, weights, seed, params) for i, seed in island_seeds}
+        conn.send(("ready", None))
+        while True:
+            msg = conn.recv()
+            if msg is None:
+                break
+            generations, immigrants = msg
+            conn.send(("ok", {i: isl.run(generations, immigrants.get(i, ())) for i, isl in islands.items()}))
+    except Exception:
+        conn.send(("error", traceback.format_exc()))
+    finally:
+        conn.close()
+
+
+class _LocalIslands:
+    """Adaları ana süreçte sırayla çalıştırır (workers <= 1)."""
+
+    def __init__(self, topo, s, d, talep, weights, seeds, params):
+        self.islands = [_Island(topo, s, d, talep, weights, seed, params) for seed in seeds]
+
+    def run(self, generations, immigrants):
+        return [isl.run(generations, imm) for isl, imm in zip(self.islands, immigrants)]
+
+    def close(self):
+        pass
+
+
+class _ProcessIslands:
+    """Adaları workers adet süreçe i % workers kuralıyla dağıtır; süreçler çalıştırma boyunca yaşar."""
+
+    def __init__(self, snapshot_path, s, d, talep, weights, seeds, params, workers):
+        ctx = mp.get_context()
+        self.count = len(seeds)
+        self.procs = []
+        for w in range(workers):
+            own = [(i, seeds[i]) for i in range(w, self.count, workers)]
+            parent, child = ctx.Pipe()
+            proc = ctx.Process(target=_worker_main,
+                               args=(child, snapshot_path, s, d, talep, weights, own, params),
+                               daemon=True)
+            proc.start()
+            child.close()
+            self.procs.append((proc, parent, [i for i, _ in own]))
+        for _, conn, _ in self.procs:
+            self._recv(conn)
+
+    @staticmethod
+    def _recv(conn):
+        status, payload = conn.recv()
+        if status == "error":
+            raise RuntimeError("Ada işçisi hata verdi:\n" + payload)
+        return payload
+
+    def run(self, generations, immigrants):
+        for _, conn, own in self.procs:
+            conn.send((generations, {i: immigrants[i] for i in own}))
+        results = [None] * self.count
+        for _, conn, _ in self.procs:
+            results_part = self._recv(conn)
+            for i, res in results_part.items():
+                results[i] = res
+        return results
+
+    def close(self):
+        for proc, conn, _ in self.procs:
+            try:
+                conn.send(None)
+            except (OSError, EOFError):
+                pass
+            conn.close()
+        for proc, _, _ in self.procs:
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.terminate()
+
+
+def run_island_ga(
+    G, s, d, talep, weights,
+    islands=4, workers=None,
+    pop_size=50, generations=100,
+    migration_interval=10, migration_rate=0.1, migration_topology="ring",
+    mutation_rate=0.3, crossover_rate=0.7,
+    seed_count=None, seed=None, return_info=False, repair="hop",
+):
+    """
+    Ada modeli GA. islands alt popülasyonun her biri pop_size bireylidir ve
+    migration_interval nesilde bir, popülasyonun migration_rate oranı kadar en iyi bireyini
+    migration_topology'ye göre ("ring": bir sonraki ada, "all": diğer tüm adalar) gönderir.
+    workers: süreç sayısı (None ise min(islands, CPU sayısı); 0/1 ise ana süreçte çalışır).
+    seed verilirse ada tohumları ondan türetilir ve sonuç işçi sayısından bağımsızdır.
+    repair: mutasyon onarım kipi (bkz. genetik_ga.REPAIR_MODES).
+
+    :return: (path, cost) veya return_info=True ise (path, cost, info)
+    """
+    start = time.perf_counter()
+    if migration_topology not in MIGRATION_TOPOLOGIES:
+        raise ValueError(f"Bilinmeyen göç topolojisi: {migration_topology!r}")
+
+    rng = make_rng(seed)
+    topo = prepare_topology(G, s, d, rng)
+    seeds = np.random.SeedSequence(rng.getrandbits(64)).spawn(islands)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, islands))
+
+    params = {
+        "pop_size": pop_size,
+        "mutation_rate": mutation_rate,
+        "crossover_rate": crossover_rate,
+        "seed_paths": seed_paths(topo, s, d, talep, weights, pop_size, seed_count),
+        "repair": repair,
+        "migrants": max(1, int(round(migration_rate * pop_size))),
+    }
+
+    # Çok süreçli çalıştırmada işçiler topolojiyi anlık görüntüden açar; topoloji bellekte
+    # üretilmişse (rastgele graf, fallback kenarlı katman) geçici bir anlık görüntü yazılır
+    tmp_dir = None
+    if workers > 1:
+        snapshot_path = topo.snapshot_path
+        if snapshot_path is None:
+            tmp_dir = tempfile.mkdtemp(prefix="island_ga_")
+            snapshot_path = os.path.join(tmp_dir, "topology")
+            save_snapshot(topo, snapshot_path)
+            topo.snapshot_path = None
+        runner = _ProcessIslands(snapshot_path, s, d, talep, weights, seeds, params, workers)
+    else:
+        runner = _LocalIslands(topo, s, d, talep, weights, seeds, params)
+
+    interval = migration_interval if migration_interval and migration_interval > 0 else generations
+    epochs = 0
+    try:
+        immigrants = [[] for _ in range(islands)]
+        results = []
+        done = 0
+        while done < generations:
+            n = min(interval, generations - done)
+            results = runner.run(n, immigrants)
+            done += n
+            epochs += 1
+            immigrants = _route_migrants([r[0] for r in results], migration_topology, params["migrants"])
+    finally:
+        runner.close()
+        if tmp_dir is not None:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    best_path, best_cost = None, math.inf
+    for _, path, cost, _ in results:
+        if cost < best_cost:
+            best_path, best_cost = path, cost
+
+    info = {
+        "islands": islands,
+        "workers": workers,
+        "epochs": epochs,
+        "island_best": [r[2] for r in results],
+        "evaluations": sum(r[3] for r in results),
+        "elapsed": time.perf_counter() - start,
+    }
+    return (best_path, best_cost, info) if return_info else (best_path, best_cost)
+
+
+def island_speedup_report(G, s, d, talep, weights, worker_counts=(1, 2, 4), islands=None, seed=12345,
+                          **kwargs):
+    """
+    Aynı tohumla farklı işçi sayılarında run_island_ga çalıştırır.
+    Her satır: {"workers", "time", "speedup" (ilk satıra göre), "cost"}. Tohum sabit olduğundan
+    tüm satırlarda maliyet aynı olmalıdır.
+    """
+    if islands is None:
+        islands = max(worker_counts)
+    rows = []
+    for w in worker_counts:
+        t = time.perf_counter()
+        _, cost = run_island_ga(G, s, d, talep, weights, islands=islands, workers=w, seed=seed, **kwargs)
+        rows.append({"workers": w, "time": time.perf_counter() - t, "cost": cost})
+    base = rows[0]["time"]
+    for row in rows:
+        row["speedup"] = base / row["time"] if row["time"] > 0 else math.inf
+    return rows
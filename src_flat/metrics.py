@@ -1,56 +1,187 @@
-import math
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from graph_utils import as_topology
+
+# (topoloji sürümü, ağırlıklar, işlem gecikmesi katsayısı) -> kenar maliyet dizisi
+EDGE_COST_CACHE_SIZE = 16
+_edge_cost_cache = OrderedDict()
+_edge_cost_lock = threading.Lock()
+
+
+def path_arrays(paths):
+    """
+    Yolları düzensiz (ragged) biçime çevirir: (offsets, nodes).
+    paths; yol listesi, -1 ile doldurulmuş 2 boyutlu dizi ya da hazır (offsets, nodes) çifti olabilir.
+    """
+    if isinstance(paths, tuple) and len(paths) == 2:
+        offsets, nodes = paths
+        return np.asarray(offsets, dtype=np.int64), np.asarray(nodes, dtype=np.int64)
+
+    if isinstance(paths, np.ndarray) and paths.ndim == 2:
+        filled = paths >= 0
+        lengths = filled.sum(axis=1)
+        nodes = paths[filled].astype(np.int64)
+    else:
+        lengths = np.fromiter((len(p) if p is not None else 0 for p in paths), dtype=np.int64)
+        nodes = np.fromiter(
+            (v for p in paths if p is not None for v in p), dtype=np.int64, count=int(lengths.sum())
+        )
+
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets, nodes
+
+
+def _path_layout(offsets, nodes):
+    # Düğüm konumlarının sahibi olan yol, ilk/son konum maskeleri ve kenar oluşturan çiftler
+    num_paths = len(offsets) - 1
+    lengths = np.diff(offsets)
+
+    owner = np.repeat(np.arange(num_paths), lengths)
+    first = np.zeros(len(nodes), dtype=bool)
+    last = np.zeros(len(nodes), dtype=bool)
+    nonempty = lengths > 0
+    first[offsets[:-1][nonempty]] = True
+    last[offsets[1:][nonempty] - 1] = True
+
+    # Ardışık konumlar aynı yola aitse bir kenar oluşturur
+    pair = ~last[:-1] if len(nodes) else np.zeros(0, dtype=bool)
+    return num_paths, lengths, owner, first, last, pair
+
+
+def _path_edges(topo, nodes, owner, pair, num_paths, lengths):
+    # Kenar indisleri ve geçerlilik; grafikte olmayan kenarlar 0 indisine yönlendirilip maskelenir
+    edge_owner = owner[:-1][pair]
+    eids = topo.edge_ids(nodes[:-1][pair], nodes[1:][pair])
+    missing = eids < 0
+    valid = (lengths >= 2) & (np.bincount(edge_owner[missing], minlength=num_paths) == 0)
+    return np.where(missing, 0, eids), edge_owner, valid
+
+
+def compute_metrics_batch(G, paths):
+    """
+    Birden çok yolun QoS metriklerini tek bir NumPy geçişinde hesaplar.
+
+    Kenar/düğüm başına -log(r) ve 1000/bandwidth dizileri topolojide önceden hesaplanmıştır;
+    burada yalnızca kenar indisleri bulunup yol başına toplanır.
+    Dönen sözlükteki her değer yol sayısı uzunluğunda bir dizidir. "valid" False olan yollar
+    (2 düğümden kısa ya da grafikte olmayan kenar içeren) için maliyetler inf'tir.
+    """
+    topo = as_topology(G)
+    offsets, nodes = path_arrays(paths)
+    num_paths, lengths, owner, first, last, pair = _path_layout(offsets, nodes)
+    eids, edge_owner, valid = _path_edges(topo, nodes, owner, pair, num_paths, lengths)
+
+    def per_path(values, who):
+        # Boş girişte bincount tamsayı dizisi döndürür; inf atanabilmesi için float'a çevrilir
+        return np.bincount(who, weights=values, minlength=num_paths).astype(np.float64, copy=False)
+
+    inner = ~(first | last)
+    total_delay = per_path(topo.delay[eids], edge_owner) + per_path(topo.s_ms[nodes[inner]], owner[inner])
+    reliability_cost = per_path(topo.edge_rel_cost[eids], edge_owner) + per_path(topo.node_rel_cost[nodes], owner)
+    resource_cost = per_path(topo.edge_res_cost[eids], edge_owner)
+
+    total_delay[~valid] = np.inf
+    reliability_cost[~valid] = np.inf
+    resource_cost[~valid] = np.inf
+
+    return {
+        "total_delay": total_delay,
+        "total_reliability": np.exp(-reliability_cost),
+        "reliability_cost": reliability_cost,
+        "resource_cost": resource_cost,
+        "valid": valid,
+    }
+
+
+def weights_key(weights):
+    return (float(weights["delay"]), float(weights["reliability"]), float(weights["resource"]))
+
+
+def edge_cost_table(G, weights, proc_scale=1.0):
+    """
+    Verilen ağırlıklar için yönlü kenar başına skaler maliyet dizisini döndürür.
+
+    u -> v kenarının maliyeti, varılan v düğümünün işlem gecikmesini (proc_scale ile çarpılmış)
+    ve güvenilirlik maliyetini de içerir:
+        w_d·(delay + proc_scale·s_ms[v]) + w_r·(-log r_link - log r_node[v]) + w_res·1000/capacity
+    Böylece s -> d yolunun total_cost değeri
+        Σ tablo[e] + w_r·(-log r_node[s]) - w_d·proc_scale·s_ms[d]
+    olur (bkz. path_costs). Tablo (topoloji sürümü, ağırlıklar) başına bir kez kurulur
+    ve küçük bir LRU önbellekte tutulur; dönen dizi salt okunurdur.
+    """
+    topo = as_topology(G)
+    key = (topo.version, weights_key(weights), float(proc_scale))
+
+    with _edge_cost_lock:
+        table = _edge_cost_cache.get(key)
+        if table is not None:
+            _edge_cost_cache.move_to_end(key)
+            return table
+
+    w_d, w_r, w_res = key[1]
+    tails = topo.neighbors
+    table = (
+        w_d * (topo.delay + proc_scale * topo.s_ms[tails])
+        + w_r * (topo.edge_rel_cost + topo.node_rel_cost[tails])
+        + w_res * topo.edge_res_cost
+    )
+    table.setflags(write=False)
+
+    with _edge_cost_lock:
+        _edge_cost_cache[key] = table
+        _edge_cost_cache.move_to_end(key)
+        while len(_edge_cost_cache) > EDGE_COST_CACHE_SIZE:
+            _edge_cost_cache.popitem(last=False)
+    return table
+
+
+def path_costs(G, paths, weights):
+    """
+    Yolların ağırlıklı toplam maliyetini kenar maliyet tablosundan topla-ve-getir ile hesaplar.
+    total_cost(compute_metrics(...)) ile aynı sonucu verir; geçersiz yollar için inf döner.
+    """
+    topo = as_topology(G)
+    table = edge_cost_table(topo, weights)
+    offsets, nodes = path_arrays(paths)
+    num_paths, lengths, owner, first, last, pair = _path_layout(offsets, nodes)
+    eids, edge_owner, valid = _path_edges(topo, nodes, owner, pair, num_paths, lengths)
+
+    w_d, w_r, _ = weights_key(weights)
+    # Kenarsız girişte bincount tamsayı dizisi döndürür; inf atanabilmesi için float'a çevrilir
+    costs = np.bincount(edge_owner, weights=table[eids], minlength=num_paths).astype(np.float64, copy=False)
+    costs[valid] += w_r * topo.node_rel_cost[nodes[first]][valid[lengths > 0]]
+    costs[valid] -= w_d * topo.s_ms[nodes[last]][valid[lengths > 0]]
+    costs[~valid] = np.inf
+    return costs
+
 
 def compute_metrics(G, path):
     """
     Verilen yol (path) için tüm QoS metriklerini hesaplar.
+    G, NetworkX grafı ya da graph_utils.Topology olabilir; hesap compute_metrics_batch üzerinden yapılır.
     """
     if path is None or len(path) < 2:
         return None
 
-    # TOPLAM GECİKME HESAPLAMA
-    link_delay_sum = 0.0
-    for i in range(len(path) - 1):
-        u, v = path[i], path[i + 1]
-        link_delay_sum += G.edges[u, v]["delay"]
-
-    proc_delay_sum = 0.0
-    for node in path[1:-1]:
-        proc_delay_sum += G.nodes[node]["processing_delay"]
-
-    total_delay = link_delay_sum + proc_delay_sum
-
-    # TOPLAM GÜVENİLİRLİK HESAPLAMA
-    total_reliability = 1.0
-    for i in range(len(path) - 1):
-        u, v = path[i], path[i + 1]
-        total_reliability *= G.edges[u, v]["reliability"]
-    for node in path:
-        total_reliability *= G.nodes[node]["reliability"]
-
-    #GÜVENİLİRLİK MALİYETİ
-    reliability_cost = 0.0
-    for i in range(len(path) - 1):
-        u, v = path[i], path[i + 1]
-        reliability_cost += -math.log(G.edges[u, v]["reliability"])
-    for node in path:
-        reliability_cost += -math.log(G.nodes[node]["reliability"])
-
-    #KAYNAK KULLANIM MALİYETİ
-    resource_cost = 0.0
-    for i in range(len(path) - 1):
-        u, v = path[i], path[i + 1]
-        resource_cost += 1000.0 / G.edges[u, v]["bandwidth"]
+    batch = compute_metrics_batch(G, [path])
+    if not batch["valid"][0]:
+        raise KeyError(f"Yol üzerindeki bir kenar grafikte bulunamadı: {path}")
 
     return {
-        "total_delay": total_delay,
-        "total_reliability": total_reliability,
-        "reliability_cost": reliability_cost,
-        "resource_cost": resource_cost,
+        "total_delay": float(batch["total_delay"][0]),
+        "total_reliability": float(batch["total_reliability"][0]),
+        "reliability_cost": float(batch["reliability_cost"][0]),
+        "resource_cost": float(batch["resource_cost"][0]),
     }
 
 def total_cost(metrics, weights):
     """
     Ağırlıklı toplam yöntemini uygular.
+    metrics tek yol sözlüğü ya da compute_metrics_batch çıktısı olabilir (dizi döner).
     """
     return (
         weights["delay"] * metrics["total_delay"]
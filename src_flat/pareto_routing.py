@@ -0,0 +1,135 @@
+import math
+import heapq
+
+from graph_utils import as_topology
+from metrics import weights_key
+
+
+# Çok amaçlı etiket yerleştirme (multi-objective Dijkstra, Martins algoritması).
+# Her etiket bir kısmi yolun (gecikme, güvenilirlik maliyeti, kaynak maliyeti) vektörüdür.
+# Etiketler sözlük sırasıyla (lexicographic) kuyruktan çıkarıldığından çıkan etiket bir daha
+# domine edilemez; her düğümde yalnızca domine edilmeyen etiketler tutulur.
+
+
+def _dominated(vec, bag, vecs, scale):
+    # bag içindeki bir etiket vec'i (1 + epsilon) toleransıyla domine ediyor mu?
+    if not bag:
+        return False
+    a, b, c = vec[0] * scale, vec[1] * scale, vec[2] * scale
+    for lid in bag:
+        x = vecs[lid]
+        if x[0] <= a and x[1] <= b and x[2] <= c:
+            return True
+    return False
+
+
+def pareto_front(G, source, destination, demand, epsilon=0.0, max_labels=None):
+    """
+    source -> destination için talebi karşılayan tüm domine edilmeyen yolları tek aramada bulur.
+
+    Amaçlar compute_metrics ile aynıdır: total_delay, reliability_cost, resource_cost.
+    epsilon > 0 verilirse (1 + epsilon)-dominasyon kullanılır; etiket sayısı sınırlanır ve
+    dönen küme gerçek cephenin epsilon yaklaşığı olur. max_labels, oluşturulacak toplam etiket
+    sayısı için güvenlik sınırıdır (aşılırsa o ana kadar bulunan hedef etiketleri döner).
+
+    :return: Gecikmeye göre sıralı sözlük listesi:
+             {"path", "total_delay", "reliability_cost", "resource_cost"}
+    """
+    topo = as_topology(G)
+    if source not in topo or destination not in topo or source == destination:
+        return []
+
+    # Varılan düğümün işlem gecikmesi ve güvenilirliği kenara katlanır (bkz. edge_cost_table)
+    tails = topo.neighbors
+    edge_delay = (topo.delay + topo.s_ms[tails]).tolist()
+    edge_rel = (topo.edge_rel_cost + topo.node_rel_cost[tails]).tolist()
+    edge_res = topo.edge_res_cost.tolist()
+    nbrs = tails.tolist()
+    scale = 1.0 + epsilon
+
+    # Etiket tabloları: vektör, düğüm, önceki etiket, canlı mı
+    vecs = [(0.0, 0.0, 0.0)]
+    nodes = [source]
+    preds = [-1]
+    alive = [True]
+    bags = {source: [0]}
+    heap = [((0.0, 0.0, 0.0), 0)]
+
+    while heap:
+        vec, lid = heapq.heappop(heap)
+        if not alive[lid]:
+            continue
+        u = nodes[lid]
+        if u == destination:
+            continue
+
+        target_bag = bags.get(destination)
+        for e in topo.feasible_edges(u, demand).tolist():
+            v = nbrs[e]
+            new = (vec[0] + edge_delay[e], vec[1] + edge_rel[e], vec[2] + edge_res[e])
+
+            # Hedefteki bir etiket tarafından domine ediliyorsa uzatmaya değmez
+            if _dominated(new, target_bag, vecs, scale):
+                continue
+            bag = bags.setdefault(v, [])
+            if _dominated(new, bag, vecs, scale):
+                continue
+
+            # Yeni etiketin domine ettiği etiketler düşürülür
+            kept = []
+            for other in bag:
+                x = vecs[other]
+                if new[0] <= x[0] and new[1] <= x[1] and new[2] <= x[2]:
+                    alive[other] = False
+                else:
+                    kept.append(other)
+
+            new_id = len(vecs)
+            vecs.append(new)
+            nodes.append(v)
+            preds.append(lid)
+            alive.append(True)
+            kept.append(new_id)
+            bags[v] = kept
+            heapq.heappush(heap, (new, new_id))
+
+        if max_labels is not None and len(vecs) >= max_labels:
+            break
+
+    # Sabit terimler: kaynak düğümün güvenilirliği eklenir, hedefin işlem gecikmesi çıkarılır
+    src_rel = float(topo.node_rel_cost[source])
+    dst_proc = float(topo.s_ms[destination])
+
+    front = []
+    for lid in bags.get(destination, []):
+        if not alive[lid]:
+            continue
+        path = []
+        k = lid
+        while k >= 0:
+            path.append(nodes[k])
+            k = preds[k]
+        d, r, c = vecs[lid]
+        front.append({
+            "path": path[::-1],
+            "total_delay": d - dst_proc,
+            "reliability_cost": r + src_rel,
+            "resource_cost": c,
+        })
+
+    front.sort(key=lambda m: (m["total_delay"], m["reliability_cost"], m["resource_cost"]))
+    return front
+
+
+def best_from_front(front, weights):
+    """
+    Hesaplanmış cepheden verilen ağırlıklar için en düşük total_cost'lu yolu seçer.
+    Çözücü yeniden çalıştırılmaz; (path, cost) döndürür, cephe boşsa (None, inf).
+    """
+    w_d, w_r, w_res = weights_key(weights)
+    best_path, best_cost = None, math.inf
+    for m in front:
+        c = w_d * m["total_delay"] + w_r * m["reliability_cost"] + w_res * m["resource_cost"]
+        if c < best_cost:
+            best_path, best_cost = m["path"], c
+    return best_path, best_cost
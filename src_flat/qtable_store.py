@@ -0,0 +1,120 @@
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from graph_utils import as_topology
+from metrics import weights_key
+
+
+class QTableStore:
+    """
+    Hedef düğüm bazlı Q-tablosu deposu (bellek + isteğe bağlı disk).
+
+    Q değerleri "hedefe kalan maliyeti" kodlar ve eğiticiler ödüle kaynağa bağlı terim katmaz
+    (kaynak güvenilirliği her aksiyonda aynı sabittir); bu yüzden aynı hedefe giden farklı
+    kaynaklı sorgular aynı tabloyu sıcak başlangıç (warm start) için kullanabilir.
+    Anahtar: (topoloji parmak izi, hedef, talep kapasite sınıfı, ağırlıklar).
+    Bellekte en fazla max_entries tablo LRU sırasıyla tutulur; cache_dir verilirse tablolar
+    .npz olarak yazılır ve sonraki oturumlarda oradan okunur.
+    """
+
+    def __init__(self, cache_dir=None, max_entries=64, weight_digits=4):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.weight_digits = weight_digits
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+    def key(self, G, destination, demand, weights):
+        topo = as_topology(G)
+        w = tuple(round(x, self.weight_digits) for x in weights_key(weights))
+        return (topo.fingerprint, int(destination), topo.demand_class(demand), w)
+
+    def _file(self, key):
+        fingerprint, destination, cls, w = key
+        name = f"{destination}_{cls}_" + "_".join(f"{x:g}" for x in w) + ".npz"
+        return os.path.join(self.cache_dir, fingerprint[:16], name)
+
+    def get(self, G, destination, demand, weights):
+        """
+        Kayıtlı tabloyu döndürür: {"q": salt okunur dizi, "episodes": int, "converged": bool,
+        "sources": eğitimde kullanılan kaynaklar} ya da None.
+        Çağıran tabloyu değiştirmeden önce kopyalamalıdır.
+        """
+        key = self.key(G, destination, demand, weights)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        if self.cache_dir is not None:
+            path = self._file(key)
+            if os.path.exists(path):
+                try:
+                    with np.load(path) as data:
+                        entry = self._make_entry(
+                            data["q"], int(data["episodes"]), bool(data["converged"]), data["sources"].tolist()
+                        )
+                except (OSError, ValueError, KeyError):
+                    entry = None
+                if entry is not None and len(entry["q"]) == as_topology(G).num_edges:
+                    with self._lock:
+                        self._insert(key, entry)
+                        self.hits += 1
+                        self.disk_hits += 1
+                    return entry
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, G, destination, demand, weights, q, episodes, converged=False, sources=()):
+        """Tabloyu depoya yazar (bellek ve varsa disk)."""
+        key = self.key(G, destination, demand, weights)
+        entry = self._make_entry(np.array(q, dtype=np.float64), episodes, converged, sources)
+        with self._lock:
+            self._insert(key, entry)
+
+        if self.cache_dir is not None:
+            path = self._file(key)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}.npz"
+                np.savez(tmp, q=entry["q"], episodes=episodes, converged=converged,
+                         sources=np.array(sorted(entry["sources"]), dtype=np.int64))
+                os.replace(tmp, path)
+            except OSError:
+                pass
+
+    def stats(self):
+        """İsabet/ıska istatistikleri; önbellek boyutlandırması için."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "disk_hits": self.disk_hits,
+                "entries": len(self._entries),
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+    @staticmethod
+    def _make_entry(q, episodes, converged, sources=()):
+        q = np.asarray(q, dtype=np.float64)
+        q.setflags(write=False)
+        return {"q": q, "episodes": int(episodes), "converged": bool(converged),
+                "sources": frozenset(int(x) for x in sources)}
+
+    def _insert(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
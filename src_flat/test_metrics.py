@@ -0,0 +1,39 @@
+import numpy as np
+
+from graph_utils import Topology
+from metrics import compute_metrics, path_costs, total_cost
+from genetik_ga import run_genetic_algorithm
+
+WEIGHTS = {"delay": 0.4, "reliability": 0.3, "resource": 0.3}
+
+
+# 0 - 1 - 2 zinciri ve 0 - 2 kısa yolu
+def _topology():
+    return Topology.from_edges(
+        3, [0, 1, 0], [1, 2, 2],
+        capacity=[500.0, 500.0, 200.0], delay=[3.0, 4.0, 9.0], r_link=[0.99, 0.98, 0.97],
+        s_ms=[1.0, 1.5, 2.0], r_node=[0.99, 0.98, 0.97],
+    )
+
+
+# Kenarsız girişte bincount tamsayı dizisi döndürür; maliyetler yine float olmalı
+def test_path_costs_edgeless_batch():
+    topo = _topology()
+    costs = path_costs(topo, [[0], []], WEIGHTS)
+    assert costs.dtype == np.float64
+    assert np.isinf(costs).all()
+
+    assert path_costs(topo, [], WEIGHTS).shape == (0,)
+
+
+def test_path_costs_mixed_batch_matches_compute_metrics():
+    topo = _topology()
+    costs = path_costs(topo, [[0], [0, 1, 2]], WEIGHTS)
+    assert np.isinf(costs[0])
+    assert np.isclose(costs[1], total_cost(compute_metrics(topo, [0, 1, 2]), WEIGHTS))
+
+
+def test_genetic_algorithm_same_source_and_destination():
+    path, cost = run_genetic_algorithm(_topology(), 1, 1, 100, WEIGHTS, pop_size=10, generations=5, rng=1)
+    assert path is None
+    assert cost == float("inf")
@@ -4,18 +4,46 @@ import numpy as np
 import pandas as pd
 import sys
 import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(current_dir)
 
-parent_dir = os.path.dirname(current_dir)
-edge_path = os.path.join(parent_dir, "BSM307_317_Guz2025_TermProject_EdgeData.csv")
-node_path = os.path.join(parent_dir, "BSM307_317_Guz2025_TermProject_NodeData.csv")
-demand_path = os.path.join(parent_dir, "BSM307_317_Guz2025_TermProject_DemandData.csv")
+data_dir = os.path.join(os.path.dirname(current_dir), "data")
+edge_path = os.path.join(data_dir, "BSM307_317_Guz2025_TermProject_EdgeData.csv")
+node_path = os.path.join(data_dir, "BSM307_317_Guz2025_TermProject_NodeData.csv")
+demand_path = os.path.join(data_dir, "BSM307_317_Guz2025_TermProject_DemandData.csv")
+
+from Qlearning import Q_Learning_run, Q_Learning_batch_run, Q_Learning_sweep_run, SERIAL_EQUIVALENT_STOPPING
+from genetik_ga import run_genetic_algorithm
+from island_ga import island_speedup_report
+from dijkstra import dijkstra_run, route_demands
+from metrics import compute_metrics
+from dominance import non_dominated_mask
+from graph_utils import (create_graph_from_csv, create_random_graph, load_demands, demand_class_report, as_topology,
+                         load_snapshot, save_snapshot)
+
+# GA kalite/süre dengeleri: sabit pop/nesil çifti yerine üst sınır ve durdurma ölçütleri
+# (bkz. genetik_ga.DEFAULT_STOPPING). --ga-profile <ad> ile seçilir.
+GA_PROFILES = {
+    "fast": {"pop_size": 30, "generations": 100,
+             "stopping": {"stall_generations": 8, "time_budget": 0.25}},
+    "balanced": {"pop_size": 50, "generations": 200,
+                 "stopping": {"stall_generations": 20, "time_budget": 1.0}},
+    "thorough": {"pop_size": 80, "generations": 500,
+                 "stopping": {"stall_generations": 50, "time_budget": 5.0}},
+}
+
+# Toplu Q-Learning ayarları: "batch" kendi varsayılanlarını (sıralamalı açgözlü seçim ve kararlılık
+# penceresi, bkz. Qlearning.BATCH_STOPPING) kullanır; "serial" seriyle aynı politika ve durdurma
+# ölçütlerini kullanır (karşılaştırmalı ölçümler için). --q-profile <ad> ile seçilir.
+Q_BATCH_PROFILES = {
+    "batch": {},
+    "serial": {"greedy_ranks": 1, "stopping": SERIAL_EQUIVALENT_STOPPING},
+}
 
-from qlearning.qlearning import Q_Learning_run
-from genetik.ga import run_genetic_algorithm
-from graph_and_metriks.graph_utils import create_graph_from_csv, create_random_graph
 
 def get_graph():
     if os.path.exists(edge_path):
@@ -23,22 +51,22 @@ def get_graph():
     else:
         return create_random_graph(num_nodes=50)
 
-def generate_scenarios(G, num_cases=20):
+def generate_scenarios(G, num_cases=20, rng=random):
     nodes = list(G.nodes())
     scenarios = []
     
     for i in range(num_cases):
-        s = random.choice(nodes)
-        d = random.choice(nodes)
+        s = rng.choice(nodes)
+        d = rng.choice(nodes)
         while s == d:
-            d = random.choice(nodes)
+            d = rng.choice(nodes)
         
         if i < 18:
-            bandwidth = random.randint(10, 150) 
+            bandwidth = rng.randint(10, 150) 
         else:
             bandwidth = 999999
 
-        mode = random.choice(['delay', 'reliability', 'balanced'])
+        mode = rng.choice(['delay', 'reliability', 'balanced'])
         if mode == 'delay':
             weights = {"delay": 1.0, "reliability": 0.1, "resource": 0.1}
         elif mode == 'reliability':
@@ -56,85 +84,321 @@ def generate_scenarios(G, num_cases=20):
         })
     return scenarios
 
-def run_experiments():
+EXPERIMENT_ALGOS = ["Dijkstra", "Q-Learning", "Q-Learning (Batch)", "Q-Learning (Sweep)", "Genetic"]
+
+# İşçi süreçte anlık görüntüden bir kez açılan topoloji (bkz. _init_worker)
+_worker_topology = None
+
+
+def task_seed(seed, scenario_id, algo_index, rep):
+    """(senaryo, algoritma, tekrar) görevinin tohumu; işçi sayısından ve görev sırasından bağımsızdır."""
+    return int(np.random.SeedSequence([seed, scenario_id, algo_index, rep]).generate_state(1, np.uint64)[0])
+
+
+def _init_worker(snapshot_path):
+    global _worker_topology
+    _worker_topology = load_snapshot(snapshot_path)
+
+
+def run_task(task):
+    """
+    Tek bir (senaryo, algoritma, tekrar) çalıştırması. Süre işçi içinde perf_counter ile yalnızca
+    algoritma çağrısı için ölçülür; metrik hesabı süreye dahil değildir.
+    """
+    sc, algo_name, rep, seed, ga_settings, batch_settings = task
+    G = _worker_topology
+    s, d, b, w = sc["source"], sc["destination"], sc["bandwidth"], sc["weights"]
+    info = {}
+    path, cost = None, float('inf')
+
+    start_time = time.perf_counter()
+    try:
+        if algo_name == "Dijkstra":
+            path, cost = dijkstra_run(G, s, d, b, w)
+        elif algo_name == "Q-Learning":
+            path, cost, info = Q_Learning_run(G, s, d, b, w, rng=seed, return_info=True)
+        elif algo_name == "Q-Learning (Batch)":
+            path, cost, info = Q_Learning_batch_run(G, s, d, b, w, rng=seed, return_info=True,
+                                                     **batch_settings)
+        elif algo_name == "Q-Learning (Sweep)":
+            path, cost, info = Q_Learning_sweep_run(G, s, d, b, w, rng=seed, return_info=True)
+        elif algo_name == "Genetic":
+            path, cost, info = run_genetic_algorithm(G, s, d, b, w, rng=seed, return_info=True,
+                                                     **ga_settings)
+    except Exception:
+        path = None
+    duration = time.perf_counter() - start_time
+
+    result = {"scenario": sc["id"], "algorithm": algo_name, "rep": rep, "path": path,
+              "cost": cost, "time": duration, "point": None}
+    if path is not None and cost != float('inf'):
+        # s ile d bağlı değilse GA yolu sorguya özel sentetik kenarı kullanabilir: metrikler o katmandan
+        # hesaplanır ve çalıştırma işaretlenir. Hesaplanamayan yol noktasız kalır; hata havuzdan sızmaz.
+        try:
+            m = compute_metrics(info.get("topology", G), path)
+            result["point"] = (m["total_delay"], m["reliability_cost"], m["resource_cost"])
+        except KeyError:
+            pass
+        if info.get("synthetic_edge") is not None:
+            result["synthetic_edge"] = True
+    if "episodes_used" in info:
+        result["episodes_used"] = info["episodes_used"]
+        result["converged_episode"] = info["converged_episode"]
+    if algo_name == "Genetic" and "generations" in info:
+        # Önbellekten puanlanan (yeniden hesaplanmayan) bireylerin oranı
+        gens = info["generations"]
+        total = sum(g["saved"] + g["evaluated"] for g in gens)
+        result["saved_fraction"] = sum(g["saved"] for g in gens) / total if total else 0.0
+        result["generations_used"] = info["generations_used"]
+    return result
+
+
+def _summarize(sc, algo_name, runs, ga_profile):
+    # Bir (senaryo, algoritma) çiftinin tekrarlarından rapor satırı
+    ok = [r for r in runs if r["point"] is not None]
+    costs = [r["cost"] for r in ok]
+    times = [r["time"] for r in ok]
+    episodes_used = [r["episodes_used"] for r in runs if "episodes_used" in r]
+    converged_at = [r["converged_episode"] for r in runs if "converged_episode" in r]
+    saved_fraction = [r["saved_fraction"] for r in runs if "saved_fraction" in r]
+    generations_used = [r["generations_used"] for r in runs if "generations_used" in r]
+    synthetic = sum(1 for r in runs if r.get("synthetic_edge"))
+
+    if ok:
+        avg_cost = np.mean(costs)
+        std_dev = np.std(costs)
+        best_res = np.min(costs)
+        worst_res = np.max(costs)
+        avg_time = np.mean(times)
+        status = "SUCCESS"
+    else:
+        avg_cost = 0
+        std_dev = 0
+        best_res = 0
+        worst_res = 0
+        avg_time = np.mean(times) if times else 0
+        status = "FAILURE"
+
+    row = {
+        "Scenario ID": sc["id"],
+        "Source": sc["source"],
+        "Destination": sc["destination"],
+        "Demand": sc["bandwidth"],
+        "Mode": sc["mode"],
+        "Algorithm": algo_name,
+        "Status": status,
+        "Avg Time (s)": round(avg_time, 4),
+        "Avg Cost": round(avg_cost, 2),
+        "Std Dev": round(std_dev, 2),
+        "Best": round(best_res, 2),
+        "Worst": round(worst_res, 2)
+    }
+    if episodes_used:
+        row["Avg Episodes"] = round(np.mean(episodes_used), 1)
+        row["Avg Converged Ep"] = round(np.mean(converged_at), 1)
+    if saved_fraction:
+        row["Avg Eval Saved %"] = round(100 * np.mean(saved_fraction), 1)
+    if generations_used:
+        row["Avg Generations"] = round(np.mean(generations_used), 1)
+    if synthetic:
+        row["Synthetic Edge Runs"] = synthetic
+
+    print(f"   -> {algo_name:<12}: {status} (Avg Cost: {avg_cost:.2f}, Time: {avg_time:.4f}s)")
+    if episodes_used:
+        wasted = 1.0 - np.mean(converged_at) / max(np.mean(episodes_used), 1)
+        print(f"      {'':<12}  Episodes: {np.mean(episodes_used):.0f}, "
+              f"converged at {np.mean(converged_at):.0f} ({wasted:.0%} wasted)")
+    if saved_fraction:
+        print(f"      {'':<12}  Fitness cache saved {np.mean(saved_fraction):.0%} of evaluations, "
+              f"{np.mean(generations_used):.0f} generations ({ga_profile})")
+    if synthetic:
+        print(f"      {'':<12}  {synthetic} run(s) used a synthetic s-d edge (source and destination disconnected)")
+    return row
+
+
+def run_experiments(ga_profile="balanced", workers=1, repetitions=5, seed=2025, num_cases=20,
+                    output="experiment_results.csv", q_profile="batch"):
+    """
+    (senaryo, algoritma, tekrar) ızgarasını çalıştırıp özet tabloyu CSV'ye yazar.
+
+    workers > 1 ise görevler süreç havuzuna dağıtılır; işçiler topolojiyi pickle'lanmış G yerine
+    salt okunur anlık görüntüden açar. Senaryolar ve her görevin tohumu seed'den türetildiği için
+    sonuçlar işçi sayısından bağımsız olarak aynıdır (GA profillerindeki time_budget bu yüzden
+    kullanılmaz; süreler ise doğal olarak değişir). q_profile toplu Q-Learning'in kendi varsayılanlarıyla
+    mı ("batch") yoksa seriyle aynı politika ve durdurmayla mı ("serial") çalışacağını seçer.
+    """
     G = get_graph()
-    scenarios = generate_scenarios(G, 20)
-    
-    results = []
-    
+    topo = as_topology(G)
+    ga_settings = dict(GA_PROFILES[ga_profile])
+    ga_settings["stopping"] = {k: v for k, v in ga_settings["stopping"].items() if k != "time_budget"}
+    batch_settings = Q_BATCH_PROFILES[q_profile]
+    scenarios = generate_scenarios(G, num_cases, rng=random.Random(seed))
+
+    tasks = [
+        (sc, algo_name, rep, task_seed(seed, sc["id"], a, rep), ga_settings, batch_settings)
+        for sc in scenarios
+        for a, algo_name in enumerate(EXPERIMENT_ALGOS)
+        for rep in range(repetitions)
+    ]
+
     print(f"{'='*80}")
     print(f"{'TEST PROCESS':^80}")
     print(f"{'='*80}\n")
+    print(f"{len(tasks)} tasks, {workers} worker(s), seed {seed}, batch Q-Learning profile {q_profile}\n")
+
+    wall_start = time.perf_counter()
+    if workers > 1:
+        # Bellekte üretilmiş topolojiler (CSV yoksa) için geçici anlık görüntü yazılır
+        tmp_dir = None
+        snapshot_path = topo.snapshot_path
+        if snapshot_path is None:
+            tmp_dir = tempfile.mkdtemp(prefix="experiments_")
+            snapshot_path = os.path.join(tmp_dir, "topology")
+            save_snapshot(topo, snapshot_path)
+            topo.snapshot_path = None
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(snapshot_path,)) as pool:
+                outputs = list(pool.map(run_task, tasks, chunksize=1))
+        finally:
+            if tmp_dir is not None:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+    else:
+        global _worker_topology
+        _worker_topology = topo
+        outputs = [run_task(t) for t in tasks]
+    wall_time = time.perf_counter() - wall_start
+
+    grouped = {}
+    for r in outputs:
+        grouped.setdefault((r["scenario"], r["algorithm"]), []).append(r)
 
+    results = []
     for sc in scenarios:
-        s, d, b, w = sc["source"], sc["destination"], sc["bandwidth"], sc["weights"]
-        print(f"Scenario {sc['id']}: {s} -> {d} | Demand: {b} | Mode: {sc['mode']}")
-        
-        algos = ["Q-Learning", "Genetic"]
-        
-        for algo_name in algos:
-            costs = []
-            times = []
-            success_count = 0
-            
-            for _ in range(5):
-                start_time = time.time()
-                path = None
-                cost = float('inf')
-                
-                try:
-                    if algo_name == "Q-Learning":
-                        path, cost = Q_Learning_run(G, s, d, b, w)
-                    elif algo_name == "Genetic":
-                        path, cost = run_genetic_algorithm(G, s, d, b, w, pop_size=30, generations=20)
-                except Exception:
-                    path = None
-                
-                end_time = time.time()
-                duration = end_time - start_time
-                
-                if path is not None and cost != float('inf'):
-                    costs.append(cost)
-                    times.append(duration)
-                    success_count += 1
-            
-            if success_count > 0:
-                avg_cost = np.mean(costs)
-                std_dev = np.std(costs)
-                best_res = np.min(costs)
-                worst_res = np.max(costs)
-                avg_time = np.mean(times)
-                status = "SUCCESS"
-            else:
-                avg_cost = 0
-                std_dev = 0
-                best_res = 0
-                worst_res = 0
-                avg_time = np.mean(times) if times else 0
-                status = "FAILURE"
-
-            results.append({
-                "Scenario ID": sc["id"],
-                "Source": s,
-                "Destination": d,
-                "Demand": b,
-                "Mode": sc["mode"],
-                "Algorithm": algo_name,
-                "Status": status,
-                "Avg Time (s)": round(avg_time, 4),
-                "Avg Cost": round(avg_cost, 2),
-                "Std Dev": round(std_dev, 2),
-                "Best": round(best_res, 2),
-                "Worst": round(worst_res, 2)
-            })
-            
-            print(f"   -> {algo_name:<12}: {status} (Avg Cost: {avg_cost:.2f}, Time: {avg_time:.4f}s)")
+        print(f"Scenario {sc['id']}: {sc['source']} -> {sc['destination']} | "
+              f"Demand: {sc['bandwidth']} | Mode: {sc['mode']}")
+        scenario_rows = [_summarize(sc, name, grouped[(sc["id"], name)], ga_profile)
+                         for name in EXPERIMENT_ALGOS]
+
+        # Senaryodaki tüm başarılı çalıştırmaların (gecikme, güvenilirlik, kaynak) noktaları;
+        # her algoritmanın noktalarının ne kadarının ortak Pareto cephesinde kaldığı raporlanır
+        runs = [r for name in EXPERIMENT_ALGOS for r in grouped[(sc["id"], name)] if r["point"] is not None]
+        if runs:
+            on_front = non_dominated_mask(np.array([r["point"] for r in runs]))
+            owner = np.array([r["algorithm"] for r in runs])
+            for row in scenario_rows:
+                mine = owner == row["Algorithm"]
+                row["Pareto %"] = round(100 * on_front[mine].mean(), 1) if mine.any() else 0.0
+        results.extend(scenario_rows)
 
     df = pd.DataFrame(results)
-    df.to_csv("experiment_results.csv", index=False)
+    df.to_csv(output, index=False)
     print(f"\n{'='*80}")
-    print("Completed. Saved to experiment_results.csv")
+    print(f"Completed in {wall_time:.2f}s wall time ({workers} worker(s)). Saved to {output}")
     print(f"{'='*80}")
+    return df
+
+
+def run_batch_throughput(weights=None, per_demand_sample=5):
+    """
+    DemandData taleplerini toplu yönlendirme (route_demands) ile çözer ve talep/saniye
+    verimini talep başına Dijkstra, GA ve Q-Learning çalıştırmalarıyla karşılaştırır.
+    GA ve Q-Learning yavaş olduğundan yalnızca ilk per_demand_sample talep üzerinde ölçülür.
+    """
+    G = get_graph()
+    demands = load_demands(demand_path)
+    if weights is None:
+        weights = {"delay": 0.4, "reliability": 0.3, "resource": 0.3}
+
+    rows = []
+
+    # Isınma: bant genişliği indeksi ve kenar maliyet tablosu ölçüm dışında bir kez kurulur
+    dijkstra_run(G, *demands[0], weights)
+
+    start = time.perf_counter()
+    batch = route_demands(G, demands, weights)
+    elapsed = time.perf_counter() - start
+    routed = sum(1 for p, _ in batch if p is not None)
+    rows.append(("Batch SPT", len(demands), routed, elapsed))
+
+    runners = [
+        ("Dijkstra", lambda s, d, b: dijkstra_run(G, s, d, b, weights), demands),
+        ("Genetic", lambda s, d, b: run_genetic_algorithm(G, s, d, b, weights, pop_size=30, generations=20),
+         demands[:per_demand_sample]),
+        ("Q-Learning", lambda s, d, b: Q_Learning_run(G, s, d, b, weights), demands[:per_demand_sample]),
+    ]
+    for name, run, subset in runners:
+        routed = 0
+        start = time.perf_counter()
+        for s, d, b in subset:
+            path, _ = run(s, d, b)
+            if path is not None:
+                routed += 1
+        rows.append((name, len(subset), routed, time.perf_counter() - start))
+
+    print(f"{'='*80}")
+    print(f"{'BATCH THROUGHPUT':^80}")
+    print(f"{'='*80}\n")
+    for name, count, routed, elapsed in rows:
+        rate = count / elapsed if elapsed > 0 else float('inf')
+        print(f"   -> {name:<12}: {count:>5} demands, {routed:>5} routed, {elapsed:.4f}s, {rate:,.1f} demands/s")
+
+
+def report_demand_classes():
+    """
+    Topolojideki kapasite eşiği sınıflarını ve DemandData taleplerinin bu sınıflara dağılımını
+    yazdırır. Aynı sınıftaki talepler için eğitilen Q tablosu birbirinin yerine kullanılabilir.
+    """
+    G = get_graph()
+    demands = load_demands(demand_path) if os.path.exists(demand_path) else []
+    report = demand_class_report(G, demands)
+    topo = as_topology(G)
+
+    print(f"{'='*80}")
+    print(f"{'DEMAND CLASSES':^80}")
+    print(f"{'='*80}\n")
+    print(f"   -> Distinct capacity levels : {report['capacity_levels']}")
+    print(f"   -> Demand classes           : {report['classes']}")
+    if demands:
+        print(f"   -> Demands in DemandData    : {report['demands']}")
+        print(f"   -> Classes used by demands  : {report['demand_classes']}")
+        top = sorted(report["class_counts"].items(), key=lambda kv: -kv[1])[:10]
+        for cls, count in top:
+            print(f"      class {cls:>4} (>= {topo.class_threshold(cls):g} Mbps): {count} demands")
+
+
+def run_island_speedup(worker_counts=(1, 2, 4), islands=4):
+    """
+    Ada modeli GA'yı aynı senaryo ve tohumla farklı işçi sayılarında çalıştırıp
+    süre ve hızlanmayı yazdırır. Tohum sabit olduğundan maliyet tüm satırlarda aynı olmalıdır.
+    """
+    G = get_graph()
+    sc = generate_scenarios(G, num_cases=1)[0]
+    s, d, b, weights = sc["source"], sc["destination"], sc["bandwidth"], sc["weights"]
+    rows = island_speedup_report(G, s, d, b, weights, worker_counts=worker_counts, islands=islands,
+                                 pop_size=50, generations=100, migration_interval=10)
+
+    print(f"{'='*80}")
+    print(f"{'ISLAND GA SPEEDUP':^80}")
+    print(f"{'='*80}\n")
+    print(f"   Scenario: {s} -> {d}, {b} Mbps, {islands} islands, {os.cpu_count()} CPUs\n")
+    for row in rows:
+        print(f"   -> {row['workers']:>2} workers: {row['time']:.4f}s, speedup {row['speedup']:.2f}x, cost {row['cost']:.4f}")
+
 
 if __name__ == "__main__":
-    run_experiments()
\ No newline at end of file
+    if "--batch" in sys.argv:
+        run_batch_throughput()
+    elif "--islands" in sys.argv:
+        run_island_speedup()
+    elif "--classes" in sys.argv:
+        report_demand_classes()
+    else:
+        # --ga-profile <ad>, --q-profile <ad>, --workers <n>, --seed <n> ile deney ızgarası ayarlanır
+        def arg(name, default, cast=str):
+            return cast(sys.argv[sys.argv.index(name) + 1]) if name in sys.argv else default
+
+        run_experiments(ga_profile=arg("--ga-profile", "balanced"),
+                        workers=arg("--workers", 1, int),
+                        seed=arg("--seed", 2025, int),
+                        q_profile=arg("--q-profile", "batch"))
\ No newline at end of file